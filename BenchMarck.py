@@ -1,68 +1,2152 @@
 import os
+import sys
 import time
+
+# Início da importação do módulo (tempo de inicialização reportado pela ferramenta)
+_MODULE_IMPORT_START = time.perf_counter()
+
 import csv
+import json
+import math
+import base64
+import hashlib
+import pickle
 import random
+import argparse
 import datetime
 import platform
-import psutil
+import importlib
 import threading
+import multiprocessing
 import cryptography
-import psutil
-import openpyxl
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives import hashes, padding
-from cryptography.hazmat.primitives.asymmetric import rsa, padding as asym_padding
-from cryptography.hazmat.primitives.asymmetric import ec, ed25519, x25519
-from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat, PrivateFormat, NoEncryption
+from array import array
+
+class LazyModule:
+    """
+    Proxy de módulo importado apenas no primeiro acesso a um atributo. Evita carregar
+    psutil e a hazmat da cryptography em processos que não chegam a usá-los.
+    """
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+    def __repr__(self):
+        state = "carregado" if self._module is not None else "não carregado"
+        return f"<LazyModule {self._name} ({state})>"
+
+psutil = LazyModule("psutil")
+ciphers = LazyModule("cryptography.hazmat.primitives.ciphers")
+algorithms = LazyModule("cryptography.hazmat.primitives.ciphers.algorithms")
+modes = LazyModule("cryptography.hazmat.primitives.ciphers.modes")
+hashes = LazyModule("cryptography.hazmat.primitives.hashes")
+padding = LazyModule("cryptography.hazmat.primitives.padding")
+asym_padding = LazyModule("cryptography.hazmat.primitives.asymmetric.padding")
+asym_utils = LazyModule("cryptography.hazmat.primitives.asymmetric.utils")
+rsa = LazyModule("cryptography.hazmat.primitives.asymmetric.rsa")
+ec = LazyModule("cryptography.hazmat.primitives.asymmetric.ec")
+ed25519 = LazyModule("cryptography.hazmat.primitives.asymmetric.ed25519")
+x25519 = LazyModule("cryptography.hazmat.primitives.asymmetric.x25519")
+ed448 = LazyModule("cryptography.hazmat.primitives.asymmetric.ed448")
+x448 = LazyModule("cryptography.hazmat.primitives.asymmetric.x448")
+serialization = LazyModule("cryptography.hazmat.primitives.serialization")
+x509 = LazyModule("cryptography.x509")
 
 # Lista para armazenar os algoritmos criptográficos disponíveis no sistema
+# (preenchida por probe_available_algorithms, sob demanda)
 AVAILABLE_ALGORITHMS = []
+PQC_KEM_CLASSES = {}        # nome -> (classe da chave privada, classe da chave pública) ML-KEM
+PQC_SIGNATURE_CLASSES = {}  # nome -> (classe da chave privada, classe da chave pública) ML-DSA
+
+# Estado da verificação de disponibilidade: None (não executada), "cache" ou "probe"
+_PROBE_SOURCE = None
+
+def run_algorithm_checks(report):
+    """
+    Verifica quais algoritmos a versão instalada da cryptography/OpenSSL oferece,
+    gerando uma chave (ou derivação) mínima de cada família. `report(ok, mensagem)`
+    recebe o resultado de cada verificação.
+    """
+    available = []
+    
+    # Verificação da disponibilidade de RSA
+    try:
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        available.append("RSA")
+        report(True, "RSA disponível")
+    except (ImportError, AttributeError) as e:
+        report(False, f"RSA não disponível: {str(e)}")
+    
+    # Verificação da disponibilidade de Curve25519/Ed25519
+    try:
+        from cryptography.hazmat.primitives.asymmetric import x25519, ed25519
+        ed25519.Ed25519PrivateKey.generate()
+        available += ["Ed25519", "X25519"]
+        report(True, "Curve25519/Ed25519 disponível")
+    except (ImportError, AttributeError) as e:
+        report(False, f"Curve25519/Ed25519 não disponível: {str(e)}")
+    
+    # Verificação da disponibilidade de Curve448/Ed448
+    try:
+        from cryptography.hazmat.primitives.asymmetric import x448, ed448
+        ed448.Ed448PrivateKey.generate()
+        x448.X448PrivateKey.generate()
+        available += ["Ed448", "X448"]
+        report(True, "Curve448/Ed448 disponível")
+    except Exception as e:
+        report(False, f"Curve448/Ed448 não disponível: {str(e)}")
+    
+    # Verificação da disponibilidade de curvas NIST
+    try:
+        from cryptography.hazmat.primitives.asymmetric import ec
+        ec.generate_private_key(ec.SECP256R1())
+        available += ["NIST_P256", "NIST_P384", "NIST_P521"]
+        report(True, "Curvas NIST (P-256/P-384/P-521) disponíveis")
+    except (ImportError, AttributeError) as e:
+        report(False, f"Curvas NIST não disponíveis: {str(e)}")
+    
+    # Verificação da disponibilidade das funções de derivação de chaves (KDF)
+    try:
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+        available += ["HKDF", "PBKDF2"]
+        report(True, "HKDF/PBKDF2 disponíveis")
+    except (ImportError, AttributeError) as e:
+        report(False, f"HKDF/PBKDF2 não disponíveis: {str(e)}")
+    
+    try:
+        from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+        Scrypt(salt=b"\x00" * 16, length=32, n=2, r=1, p=1).derive(b"probe")
+        available.append("scrypt")
+        report(True, "scrypt disponível")
+    except Exception as e:
+        report(False, f"scrypt não disponível: {str(e)}")
+    
+    try:
+        from cryptography.hazmat.primitives.kdf.argon2 import Argon2id
+        Argon2id(salt=b"\x00" * 16, length=32, iterations=1, lanes=1, memory_cost=8).derive(b"probe")
+        available.append("Argon2id")
+        report(True, "Argon2id disponível")
+    except Exception as e:
+        report(False, f"Argon2id não disponível: {str(e)}")
+    
+    # Verificação da disponibilidade de algoritmos pós-quânticos (ML-KEM / ML-DSA, FIPS 203/204)
+    for family, module_name, prefix, parameter_sets in (
+            ("ML-KEM", "mlkem", "MLKEM", (512, 768, 1024)),
+            ("ML-DSA", "mldsa", "MLDSA", (44, 65, 87))):
+        try:
+            module = importlib.import_module(f"cryptography.hazmat.primitives.asymmetric.{module_name}")
+            found = []
+            for parameter_set in parameter_sets:
+                key_class = getattr(module, f"{prefix}{parameter_set}PrivateKey", None)
+                if key_class is not None:
+                    key_class.generate()
+                    found.append(f"{family}-{parameter_set}")
+            available += found
+            report(True, f"{family} disponível ({', '.join(found)})")
+        except Exception as e:
+            report(False, f"{family} não disponível: {str(e)}")
+    
+    return available
+
+def register_pqc_classes(available):
+    """Associa os nomes ML-KEM/ML-DSA disponíveis às classes de chave correspondentes"""
+    PQC_KEM_CLASSES.clear()
+    PQC_SIGNATURE_CLASSES.clear()
+    for name in available:
+        if name.startswith(("ML-KEM-", "ML-DSA-")):
+            family, parameter_set = name.rsplit("-", 1)
+            module_name, prefix, target = (("mlkem", "MLKEM", PQC_KEM_CLASSES) if family == "ML-KEM"
+                                           else ("mldsa", "MLDSA", PQC_SIGNATURE_CLASSES))
+            module = importlib.import_module(f"cryptography.hazmat.primitives.asymmetric.{module_name}")
+            target[name] = (getattr(module, f"{prefix}{parameter_set}PrivateKey"),
+                            getattr(module, f"{prefix}{parameter_set}PublicKey"))
+
+def probe_cache_path():
+    """Arquivo de cache da verificação, específico para as versões da cryptography e do OpenSSL"""
+    versions = get_crypto_library_versions()
+    key = hashlib.sha256(f"{versions['cryptography']}|{versions['openssl']}|{platform.machine()}".encode())
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_dir, "crypto-benchmark", f"probe-{key.hexdigest()[:16]}.json")
+
+def probe_available_algorithms(verbose=False, refresh=False):
+    """
+    Preenche AVAILABLE_ALGORITHMS. O resultado é reutilizado do cache (por versão da
+    cryptography/OpenSSL) quando existe; a verificação só imprime se `verbose`.
+    """
+    global _PROBE_SOURCE
+    if _PROBE_SOURCE is not None and not refresh:
+        return AVAILABLE_ALGORITHMS
+    
+    cache_path = probe_cache_path()
+    available = None
+    if not refresh:
+        try:
+            with open(cache_path) as cache_file:
+                available = json.load(cache_file)["algorithms"]
+            _PROBE_SOURCE = "cache"
+        except (OSError, ValueError, KeyError):
+            available = None
+    
+    if available is None:
+        def report(ok, message):
+            if verbose:
+                print(f"✓ {message}" if ok else f"⚠️ AVISO: {message}")
+        available = run_algorithm_checks(report)
+        _PROBE_SOURCE = "probe"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "w") as cache_file:
+                json.dump({"versions": get_crypto_library_versions(), "algorithms": available}, cache_file)
+        except OSError:
+            pass
+    
+    AVAILABLE_ALGORITHMS[:] = available
+    register_pqc_classes(available)
+    if verbose:
+        origin = " (cache)" if _PROBE_SOURCE == "cache" else ""
+        print(f"Algoritmos disponíveis{origin}: {', '.join(AVAILABLE_ALGORITHMS)}")
+    return AVAILABLE_ALGORITHMS
+
+# Versões das bibliotecas criptográficas (registradas em cada resultado), obtidas sob demanda
+_CRYPTO_LIBRARY_VERSIONS = None
+
+def get_crypto_library_versions():
+    """Retorna as versões da biblioteca cryptography e do OpenSSL utilizado por ela"""
+    global _CRYPTO_LIBRARY_VERSIONS
+    if _CRYPTO_LIBRARY_VERSIONS is None:
+        versions = {
+            "cryptography": cryptography.__version__,
+            "openssl": "desconhecida"
+        }
+        try:
+            from cryptography.hazmat.backends.openssl.backend import backend
+            versions["openssl"] = backend.openssl_version_text()
+        except (ImportError, AttributeError):
+            pass
+        _CRYPTO_LIBRARY_VERSIONS = versions
+    return _CRYPTO_LIBRARY_VERSIONS
+
+
+# ==== Dados de teste determinísticos ====
+
+# Tamanho dos blocos do keystream em generate_seeded_bytes
+SEEDED_CHUNK_SIZE = 1024 * 1024
+
+def generate_seeded_bytes(seed, size, label=b"test-data"):
+    """
+    Gera `size` bytes pseudoaleatórios reprodutíveis a partir da semente: keystream
+    AES-256-CTR com chave SHA-256(semente || rótulo). O rótulo separa os fluxos de
+    dados (ex.: dados de teste e mensagens OAEP) gerados com a mesma semente.
+    
+    O keystream é escrito em blocos de SEEDED_CHUNK_SIZE direto em um bytearray
+    pré-alocado (update_into), de modo que o pico de memória fica em ~`size` bytes
+    mesmo para tamanhos de GB. Retorna um bytearray (aceito pelas operações de
+    assinatura e hash; converta com bytes() onde a API exigir bytes).
+    """
+    key = hashlib.sha256(str(seed).encode() + b"|" + label).digest()
+    encryptor = ciphers.Cipher(algorithms.AES(key), modes.CTR(b"\x00" * 16)).encryptor()
+    output = bytearray(size)
+    view = memoryview(output)
+    zeros = bytes(min(size, SEEDED_CHUNK_SIZE))
+    # update_into exige espaço para len(dados) + 15 bytes; o último bloco usa um buffer à parte
+    scratch = bytearray(len(zeros) + 15)
+    offset = 0
+    while offset < size:
+        length = min(SEEDED_CHUNK_SIZE, size - offset)
+        if size - offset >= length + 15:
+            offset += encryptor.update_into(zeros[:length], view[offset:])
+        else:
+            written = encryptor.update_into(zeros[:length], scratch)
+            view[offset:offset + written] = scratch[:written]
+            offset += written
+    encryptor.finalize()
+    return output
+
+def new_random_seed():
+    """Sorteia uma semente (registrada no manifesto para permitir a reprodução)"""
+    return random.SystemRandom().randrange(2 ** 32)
+
+# ==== Impressão digital do ambiente de execução ====
+
+def read_system_file(path):
+    """Lê um arquivo de /proc ou /sys, retornando None se não existir ou não for legível"""
+    try:
+        with open(path) as system_file:
+            return system_file.read().strip()
+    except OSError:
+        return None
+
+def read_cpuinfo():
+    """Extrai o modelo do processador e as flags de /proc/cpuinfo (Linux)"""
+    cpuinfo = read_system_file("/proc/cpuinfo") or ""
+    model = None
+    flags = set()
+    for line in cpuinfo.splitlines():
+        if ":" not in line:
+            continue
+        key, value = [part.strip() for part in line.split(":", 1)]
+        if key in ("model name", "Hardware", "Processor") and model is None:
+            model = value
+        elif key in ("flags", "Features") and not flags:
+            # "flags" em x86, "Features" em ARM
+            flags = set(value.split())
+    return model or platform.processor() or None, flags
+
+def parse_cpu_list(cpu_list):
+    """Conta os núcleos de uma lista no formato do cpuset (ex: "0-3,6")"""
+    count = 0
+    for part in (cpu_list or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-", 1)
+            count += int(last) - int(first) + 1
+        else:
+            count += 1
+    return count or None
+
+def cgroup_hierarchy(mount, path):
+    """Retorna os diretórios do cgroup do processo, da folha até a raiz montada"""
+    directories = []
+    current = os.path.normpath(os.path.join(mount, (path or "/").lstrip("/")))
+    while current.startswith(mount):
+        if os.path.isdir(current):
+            directories.append(current)
+        if current == mount:
+            break
+        current = os.path.dirname(current)
+    return directories
+
+def read_process_cgroup_paths():
+    """Caminhos do cgroup do processo por controlador, segundo /proc/self/cgroup ("" = v2)"""
+    cgroup_paths = {}
+    for line in (read_system_file("/proc/self/cgroup") or "").splitlines():
+        parts = line.split(":", 2)
+        if len(parts) == 3:
+            for controller in parts[1].split(","):
+                cgroup_paths[controller] = parts[2]
+    return cgroup_paths
+
+def read_cgroup_memory_usage():
+    """
+    Uso de memória atual do cgroup do processo em bytes (memory.current /
+    memory.usage_in_bytes), lido a cada chamada por variar ao longo da execução
+    """
+    cgroup_paths = read_process_cgroup_paths()
+    if os.path.exists("/sys/fs/cgroup/cgroup.controllers"):
+        mount, path, filename = "/sys/fs/cgroup", cgroup_paths.get("", "/"), "memory.current"
+    else:
+        mount, path, filename = "/sys/fs/cgroup/memory", cgroup_paths.get("memory", "/"), "memory.usage_in_bytes"
+    for directory in cgroup_hierarchy(mount, path):
+        usage = read_system_file(os.path.join(directory, filename))
+        if usage:
+            return int(usage)
+    return None
+
+def detect_container_limits():
+    """
+    Detecta os limites de CPU e memória impostos pelo cgroup (v1 ou v2) ao processo.
+    Os limites de todos os níveis da hierarquia são considerados (vale o menor).
+    """
+    limits = {
+        "version": None,
+        "cpu_quota_cores": None,     # cpu.max / cpu.cfs_quota_us
+        "cpuset_cores": None,        # cpuset.cpus.effective / afinidade do processo
+        "memory_limit_bytes": None   # memory.max / memory.limit_in_bytes
+    }
+    cgroup_paths = read_process_cgroup_paths()
+    
+    def keep_min(key, value):
+        if value is not None and (limits[key] is None or value < limits[key]):
+            limits[key] = value
+    
+    if os.path.exists("/sys/fs/cgroup/cgroup.controllers"):
+        # cgroup v2 (hierarquia unificada)
+        limits["version"] = "v2"
+        for directory in cgroup_hierarchy("/sys/fs/cgroup", cgroup_paths.get("", "/")):
+            cpu_max = read_system_file(os.path.join(directory, "cpu.max"))
+            if cpu_max:
+                quota, _, period = cpu_max.partition(" ")
+                if quota != "max" and period:
+                    keep_min("cpu_quota_cores", int(quota) / int(period))
+            memory_max = read_system_file(os.path.join(directory, "memory.max"))
+            if memory_max and memory_max != "max":
+                keep_min("memory_limit_bytes", int(memory_max))
+            if limits["cpuset_cores"] is None:
+                limits["cpuset_cores"] = parse_cpu_list(
+                    read_system_file(os.path.join(directory, "cpuset.cpus.effective")))
+    else:
+        # cgroup v1 (um diretório montado por controlador)
+        for directory in cgroup_hierarchy("/sys/fs/cgroup/cpu", cgroup_paths.get("cpu", "/")):
+            limits["version"] = "v1"
+            quota = read_system_file(os.path.join(directory, "cpu.cfs_quota_us"))
+            period = read_system_file(os.path.join(directory, "cpu.cfs_period_us"))
+            if quota and period and int(quota) > 0:
+                keep_min("cpu_quota_cores", int(quota) / int(period))
+        for directory in cgroup_hierarchy("/sys/fs/cgroup/memory", cgroup_paths.get("memory", "/")):
+            limits["version"] = "v1"
+            memory_limit = read_system_file(os.path.join(directory, "memory.limit_in_bytes"))
+            if memory_limit:
+                keep_min("memory_limit_bytes", int(memory_limit))
+        for directory in cgroup_hierarchy("/sys/fs/cgroup/cpuset", cgroup_paths.get("cpuset", "/")):
+            limits["cpuset_cores"] = parse_cpu_list(
+                read_system_file(os.path.join(directory, "cpuset.effective_cpus")) or
+                read_system_file(os.path.join(directory, "cpuset.cpus")))
+            break
+    
+    # A afinidade do processo também reflete o cpuset (e taskset)
+    if hasattr(os, "sched_getaffinity"):
+        affinity_cores = len(os.sched_getaffinity(0))
+        if limits["cpuset_cores"] is None or affinity_cores < limits["cpuset_cores"]:
+            limits["cpuset_cores"] = affinity_cores
+    
+    # Em cgroup v1 "sem limite" é representado por um valor enorme
+    if limits["memory_limit_bytes"] is not None and limits["memory_limit_bytes"] >= psutil.virtual_memory().total:
+        limits["memory_limit_bytes"] = None
+        
+    return limits
+
+def effective_cpu_count(limits):
+    """Núcleos efetivamente disponíveis considerando cpuset e cota de CPU do cgroup"""
+    cores = psutil.cpu_count(logical=True)
+    if limits.get("cpuset_cores"):
+        cores = min(cores, limits["cpuset_cores"])
+    if limits.get("cpu_quota_cores"):
+        # Arredonda para baixo: mais workers que a cota causam throttling do CFS
+        cores = min(cores, max(1, int(limits["cpu_quota_cores"])))
+    return cores
+
+def effective_memory_bytes(limits):
+    """Retorna (memória total, memória disponível) em bytes respeitando o limite do cgroup"""
+    virtual_memory = psutil.virtual_memory()
+    total, available = virtual_memory.total, virtual_memory.available
+    if limits.get("memory_limit_bytes"):
+        total = min(total, limits["memory_limit_bytes"])
+        used = read_cgroup_memory_usage() or 0
+        available = min(available, max(0, limits["memory_limit_bytes"] - used))
+    return total, available
+
+def collect_environment_fingerprint():
+    """
+    Coleta uma impressão digital estruturada do ambiente de execução
+    (hardware, frequência, cgroup, sistema operacional e bibliotecas)
+    """
+    import ssl
+    
+    cpu_model, cpu_flags = read_cpuinfo()
+    logical_cores = psutil.cpu_count(logical=True)
+    physical_cores = psutil.cpu_count(logical=False)
+    
+    # SMT: preferir o estado informado pelo kernel
+    smt_active = read_system_file("/sys/devices/system/cpu/smt/active")
+    if smt_active is not None:
+        smt_enabled = smt_active == "1"
+    else:
+        smt_enabled = bool(physical_cores and logical_cores > physical_cores)
+    
+    # Turbo: intel_pstate usa no_turbo (invertido); acpi-cpufreq usa boost
+    no_turbo = read_system_file("/sys/devices/system/cpu/intel_pstate/no_turbo")
+    boost = read_system_file("/sys/devices/system/cpu/cpufreq/boost")
+    if no_turbo is not None:
+        turbo_enabled = no_turbo == "0"
+    elif boost is not None:
+        turbo_enabled = boost == "1"
+    else:
+        turbo_enabled = None
+    
+    try:
+        cpu_freq = psutil.cpu_freq()
+    except (AttributeError, NotImplementedError, OSError):
+        cpu_freq = None
+    
+    return {
+        "cpu": {
+            "model": cpu_model,
+            "architecture": platform.machine(),
+            "logical_cores": logical_cores,
+            "physical_cores": physical_cores,
+            "smt_enabled": smt_enabled,
+            "frequency_governor": read_system_file("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"),
+            "frequency_mhz": {
+                "current": cpu_freq.current if cpu_freq else None,
+                "min": cpu_freq.min if cpu_freq else None,
+                "max": cpu_freq.max if cpu_freq else None
+            },
+            "turbo_enabled": turbo_enabled,
+            "flags": {
+                "aes_ni": "aes" in cpu_flags,
+                "sha_ni": "sha_ni" in cpu_flags or "sha2" in cpu_flags,
+                "avx2": "avx2" in cpu_flags,
+                "avx512f": "avx512f" in cpu_flags,
+                "pmull": "pmull" in cpu_flags
+            }
+        },
+        "cgroup": detect_container_limits(),
+        "memory": {
+            "total_mb": psutil.virtual_memory().total / (1024 * 1024)
+        },
+        "os": {
+            "system": platform.system(),
+            "kernel": platform.release(),
+            "version": platform.version()
+        },
+        "python": {
+            "version": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "ssl_openssl": ssl.OPENSSL_VERSION
+        },
+        "libraries": dict(get_crypto_library_versions())
+    }
+
+def environment_fingerprint_id(fingerprint):
+    """Gera um identificador curto e estável para a impressão digital do ambiente"""
+    stable = json.loads(json.dumps(fingerprint, sort_keys=True, default=str))
+    # A frequência atual varia entre amostras e não identifica o ambiente
+    stable.get("cpu", {}).get("frequency_mhz", {}).pop("current", None)
+    return hashlib.sha256(json.dumps(stable, sort_keys=True).encode()).hexdigest()[:12]
+
+def environment_warnings(fingerprint, use_cores):
+    """Retorna avisos sobre configurações do ambiente conhecidas por gerar ruído nas medições"""
+    warnings = []
+    cpu = fingerprint.get("cpu", {})
+    
+    governor = cpu.get("frequency_governor")
+    if governor and governor != "performance":
+        warnings.append(f"Governador de frequência '{governor}' (use 'performance' para medições estáveis)")
+    if cpu.get("turbo_enabled"):
+        warnings.append("Turbo/boost ativo: a frequência varia com a temperatura e a carga")
+    
+    quota = fingerprint.get("cgroup", {}).get("cpu_quota_cores")
+    if quota is not None and quota < use_cores:
+        warnings.append(f"Cota de CPU do cgroup ({quota:.2f} núcleos) menor que os núcleos solicitados ({use_cores})")
+        
+    return warnings
+
+def flatten_dict(data, prefix=""):
+    """Achata um dicionário aninhado em pares (chave.pontilhada, valor)"""
+    items = []
+    for key, value in data.items():
+        full_key = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            items.extend(flatten_dict(value, full_key))
+        else:
+            items.append((full_key, value))
+    return items
+
+# ==== Contadores de hardware (perf_event, Linux) ====
+
+class PerfEventCounters:
+    """
+    Contadores de hardware do processo atual via perf_event_open (Linux).
+    Mede ciclos, instruções, falhas de cache e falhas de previsão de desvio
+    somente em modo usuário, o que funciona com perf_event_paranoid <= 2.
+    Os eventos formam um grupo (agendados juntos na PMU) e são lidos com os
+    tempos habilitado/em execução, escalando as contagens quando há multiplexação.
+    """
+    # Números da chamada de sistema perf_event_open por arquitetura
+    SYSCALL_NUMBERS = {
+        "x86_64": 298, "amd64": 298, "i386": 336, "i686": 336,
+        "aarch64": 241, "arm64": 241, "riscv64": 241,
+        "armv7l": 364, "ppc64le": 319, "ppc64": 319, "s390x": 331
+    }
+    PERF_TYPE_HARDWARE = 0
+    EVENTS = {
+        "cycles": 0,         # PERF_COUNT_HW_CPU_CYCLES
+        "instructions": 1,   # PERF_COUNT_HW_INSTRUCTIONS
+        "cache_misses": 3,   # PERF_COUNT_HW_CACHE_MISSES
+        "branch_misses": 5   # PERF_COUNT_HW_BRANCH_MISSES
+    }
+    # Bits de perf_event_attr.flags: disabled (só no líder), exclude_kernel, exclude_hv
+    ATTR_DISABLED = 1 << 0
+    ATTR_FLAGS = (1 << 5) | (1 << 6)
+    # read_format: TOTAL_TIME_ENABLED | TOTAL_TIME_RUNNING | GROUP
+    READ_FORMAT = (1 << 0) | (1 << 1) | (1 << 3)
+    IOC_ENABLE = 0x2400
+    IOC_DISABLE = 0x2401
+    IOC_RESET = 0x2403
+    IOC_FLAG_GROUP = 1
+
+    def __init__(self):
+        self.file_descriptors = {}   # Evento -> descritor, na ordem do grupo (o primeiro é o líder)
+        self.unavailable_reason = None
+        self._open()
+
+    @property
+    def available(self):
+        return bool(self.file_descriptors)
+
+    def _open(self):
+        """Abre um descritor por evento; eventos não suportados são ignorados"""
+        if platform.system() != "Linux":
+            self.unavailable_reason = "perf_event disponível apenas no Linux"
+            return
+        syscall_number = self.SYSCALL_NUMBERS.get(platform.machine().lower())
+        if syscall_number is None:
+            self.unavailable_reason = f"arquitetura {platform.machine()} não suportada"
+            return
+        paranoid = read_system_file("/proc/sys/kernel/perf_event_paranoid")
+        if paranoid is not None and int(paranoid) > 2:
+            self.unavailable_reason = f"perf_event_paranoid={paranoid} (requer <= 2)"
+            return
+
+        import ctypes
+        import struct
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.syscall.restype = ctypes.c_long
+
+        leader = -1
+        for name, config in self.EVENTS.items():
+            flags = self.ATTR_FLAGS | (self.ATTR_DISABLED if leader < 0 else 0)
+            # perf_event_attr (PERF_ATTR_SIZE_VER0 = 64 bytes)
+            attr = struct.pack("IIQQQQQIIQ", self.PERF_TYPE_HARDWARE, 64, config,
+                               0, 0, self.READ_FORMAT, flags, 0, 0, 0)
+            buffer = ctypes.create_string_buffer(attr, len(attr))
+            # pid=0 (processo atual), cpu=-1 (qualquer CPU), grupo do primeiro evento aberto
+            fd = libc.syscall(syscall_number, buffer, 0, -1, leader, 0)
+            if fd >= 0:
+                self.file_descriptors[name] = fd
+                if leader < 0:
+                    leader = fd
+            elif self.unavailable_reason is None:
+                self.unavailable_reason = f"perf_event_open falhou: {os.strerror(ctypes.get_errno())}"
+        if self.file_descriptors:
+            self.unavailable_reason = None
+
+    @property
+    def leader(self):
+        return next(iter(self.file_descriptors.values()))
+
+    def start(self):
+        """Zera e habilita o grupo de contadores"""
+        import fcntl
+        fcntl.ioctl(self.leader, self.IOC_RESET, self.IOC_FLAG_GROUP)
+        fcntl.ioctl(self.leader, self.IOC_ENABLE, self.IOC_FLAG_GROUP)
+
+    def stop(self):
+        """
+        Desabilita o grupo e retorna um dicionário evento -> contagem, escalada por
+        tempo habilitado / tempo em execução. Vazio se o grupo não chegou a ser
+        agendado na PMU (contagens desconhecidas).
+        """
+        import fcntl
+        import struct
+        fcntl.ioctl(self.leader, self.IOC_DISABLE, self.IOC_FLAG_GROUP)
+        # Formato do grupo: nr, time_enabled, time_running, valor de cada evento
+        count = len(self.file_descriptors)
+        data = os.read(self.leader, 8 * (3 + count))
+        nr, time_enabled, time_running, *counts = struct.unpack(f"{3 + count}Q", data)
+        if not time_running:
+            return {}
+        scale = time_enabled / time_running
+        return {name: int(round(value * scale)) for name, value in zip(self.file_descriptors, counts[:nr])}
+
+    def close(self):
+        for fd in self.file_descriptors.values():
+            os.close(fd)
+        self.file_descriptors = {}
+
+# ==== Energia consumida (RAPL via powercap, Linux) ====
+
+class RaplEnergyCounters:
+    """
+    Energia (joules) dos domínios RAPL expostos pelo powercap do Linux
+    (/sys/class/powercap/intel-rapl:*, também usado por CPUs AMD recentes).
+    Soma os pacotes (package-N) e os subdomínios de núcleos (core). Os contadores
+    são do sistema inteiro: a energia de outros processos ativos entra na medição.
+    """
+    POWERCAP_DIR = "/sys/class/powercap"
+
+    def __init__(self):
+        self.domains = {}        # Caminho -> (tipo "package"/"core", faixa máxima em µJ)
+        self.start_values = {}
+        self.unavailable_reason = None
+        self._discover()
+
+    @property
+    def available(self):
+        return any(kind == "package" for kind, _ in self.domains.values())
+
+    def _discover(self):
+        """Localiza os domínios de pacote e de núcleos legíveis"""
+        if not os.path.isdir(self.POWERCAP_DIR):
+            self.unavailable_reason = f"powercap não encontrado ({self.POWERCAP_DIR})"
+            return
+        for entry in sorted(os.listdir(self.POWERCAP_DIR)):
+            if not entry.startswith("intel-rapl:"):
+                continue
+            path = os.path.join(self.POWERCAP_DIR, entry)
+            name = read_system_file(os.path.join(path, "name")) or ""
+            if name.startswith("package"):
+                kind = "package"
+            elif name == "core":
+                kind = "core"
+            else:
+                continue  # uncore, dram, psys
+            if read_system_file(os.path.join(path, "energy_uj")) is None:
+                self.unavailable_reason = "energy_uj sem permissão de leitura (requer root em kernels recentes)"
+                continue
+            max_range = read_system_file(os.path.join(path, "max_energy_range_uj"))
+            self.domains[path] = (kind, int(max_range) if max_range else 0)
+        if self.available:
+            self.unavailable_reason = None
+        elif self.unavailable_reason is None:
+            self.unavailable_reason = "nenhum domínio RAPL encontrado"
+
+    def _read(self):
+        values = {}
+        for path in self.domains:
+            energy = read_system_file(os.path.join(path, "energy_uj"))
+            if energy is not None:
+                values[path] = int(energy)
+        return values
+
+    def start(self):
+        """Registra a energia acumulada de cada domínio"""
+        self.start_values = self._read()
+
+    def stop(self):
+        """Retorna a energia (J) consumida desde start(): {"package": ..., "core": ...}"""
+        totals = {}
+        for path, end_value in self._read().items():
+            if path not in self.start_values:
+                continue
+            kind, max_range = self.domains[path]
+            delta = end_value - self.start_values[path]
+            if delta < 0:
+                delta += max_range  # O contador voltou a zero durante a medição
+            totals[kind] = totals.get(kind, 0.0) + delta / 1e6
+        return totals
+
+# ==== Perfis de execução (cProfile e amostragem por sinal) ====
+
+# Intervalo de amostragem (tempo de CPU) do profiler por sinal SIGPROF
+PROFILE_SAMPLING_INTERVAL = 0.001
+
+def profile_frame_label(filename, lineno, name):
+    """Nome de um quadro na pilha colapsada (funções nativas aparecem sem arquivo)"""
+    if filename == "~":
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{lineno})"
+    return label.replace(";", ",")
+
+def collapse_profile_stats(stats, min_seconds=1e-7):
+    """
+    Converte as estatísticas do cProfile (grafo chamador -> chamado) em pilhas colapsadas
+    ("a;b;c microssegundos"), distribuindo o tempo de cada função entre os caminhos
+    proporcionalmente ao tempo acumulado em cada chamador. É uma aproximação: o cProfile
+    não registra pilhas completas.
+    """
+    entries = stats.stats  # função -> (cc, nc, tempo próprio, tempo acumulado, chamadores)
+    callees = {}
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((function, edge[3]))
+    
+    stacks = {}
+    def visit(function, path, functions_in_path, share):
+        _, _, own_time, _, _ = entries[function]
+        path = path + (profile_frame_label(*function),)
+        if own_time * share >= min_seconds:
+            stacks[path] = stacks.get(path, 0.0) + own_time * share
+        for callee, edge_time in callees.get(function, ()):
+            callee_time = entries[callee][3]
+            if callee in functions_in_path or callee_time <= 0:
+                continue
+            callee_share = share * edge_time / callee_time
+            if callee_share * callee_time >= min_seconds:
+                visit(callee, path, functions_in_path | {callee}, callee_share)
+    
+    for function, (_, _, _, _, callers) in entries.items():
+        if not any(caller in entries for caller in callers):
+            visit(function, (), {function}, 1.0)
+    return [f"{';'.join(path)} {round(seconds * 1e6)}" for path, seconds in stacks.items() if round(seconds * 1e6) > 0]
+
+class SamplingProfiler:
+    """
+    Profiler de baixo custo por amostragem: o temporizador ITIMER_PROF envia SIGPROF a
+    cada PROFILE_SAMPLING_INTERVAL de CPU e o tratador registra a pilha Python atual.
+    Só funciona na thread principal de sistemas POSIX. O tempo gasto em código nativo
+    (OpenSSL) é atribuído à linha Python que fez a chamada; como sinais pendentes durante
+    uma chamada longa se acumulam em um só, cada amostra é ponderada pelo tempo de CPU
+    decorrido desde a anterior.
+    """
+    def __init__(self, interval=PROFILE_SAMPLING_INTERVAL):
+        self.interval = interval
+        self.counts = {}            # Pilha -> tempo de CPU (µs)
+        self.samples = 0
+        self.last_cpu_ns = 0
+        self.previous_handler = None
+        self.stop_frame = None
+
+    @staticmethod
+    def is_available():
+        import signal
+        return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+    def _handle(self, signum, frame):
+        path = []
+        while frame is not None and frame is not self.stop_frame:
+            code = frame.f_code
+            path.append(profile_frame_label(code.co_filename, frame.f_lineno, code.co_name))
+            frame = frame.f_back
+        stack = tuple(reversed(path))
+        cpu_ns = time.process_time_ns()
+        self.counts[stack] = self.counts.get(stack, 0) + (cpu_ns - self.last_cpu_ns) / 1000
+        self.last_cpu_ns = cpu_ns
+        self.samples += 1
+
+    def start(self):
+        import signal
+        # Pilhas acima de quem iniciou o profiler (o próprio harness) são omitidas
+        self.stop_frame = sys._getframe(1)
+        self.previous_handler = signal.signal(signal.SIGPROF, self._handle)
+        self.last_cpu_ns = time.process_time_ns()
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        import signal
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self.previous_handler)
+
+    def collapsed(self):
+        """Pilhas colapsadas ("a;b;c microssegundos"), compatíveis com flamegraph.pl e speedscope"""
+        return [f"{';'.join(stack)} {round(cpu_us)}" for stack, cpu_us in self.counts.items()
+                if stack and round(cpu_us) > 0]
+
+# ==== Execução supervisionada em processo filho (tempo limite com interrupção) ====
+
+def encode_worker_value(value):
+    """Prepara o valor retornado pela operação para envio ao processo pai (chaves privadas via PKCS#8)"""
+    try:
+        return ("pickle", pickle.dumps(value))
+    except Exception:
+        pass
+    if hasattr(value, "private_bytes"):
+        try:
+            return ("pkcs8", value.private_bytes(serialization.Encoding.DER, serialization.PrivateFormat.PKCS8,
+                                                 serialization.NoEncryption()))
+        except Exception:
+            pass
+    return ("none", None)
+
+def decode_worker_value(encoded):
+    """Reconstrói no processo pai o valor enviado por encode_worker_value"""
+    kind, payload = encoded
+    if kind == "pickle":
+        return pickle.loads(payload)
+    if kind == "pkcs8":
+        from cryptography.hazmat.primitives.serialization import load_der_private_key
+        return load_der_private_key(payload, password=None)
+    return None
+
+# Intervalo máximo entre envios de amostras do worker supervisionado ao processo pai
+SUPERVISED_FLUSH_NS = 50_000_000
+
+def run_supervised_worker(connection, operation, iterations, collect_perf_counters):
+    """
+    Corpo do processo filho supervisionado: executa as iterações e envia as amostras em
+    lotes (bytes de um array 'q') a cada SUPERVISED_FLUSH_NS, para que as amostras parciais
+    sobrevivam a um encerramento forçado sem uma mensagem por iteração. Envia ("ready",)
+    imediatamente antes da primeira iteração, marcando o início da região medida.
+    """
+    try:
+        counters = PerfEventCounters() if collect_perf_counters else None
+        if counters is not None and not counters.available:
+            counters = None
+        process = psutil.Process(os.getpid())
+        start_memory = process.memory_info().rss
+        connection.send(("ready",))
+        if counters:
+            counters.start()
+        
+        value = None
+        pending = new_sample_array()
+        last_flush = time.perf_counter_ns()
+        for _ in range(iterations):
+            start_time = time.perf_counter_ns()
+            value = operation()
+            end_time = time.perf_counter_ns()
+            pending.append(end_time - start_time)
+            if end_time - last_flush >= SUPERVISED_FLUSH_NS:
+                connection.send(("samples", pending.tobytes()))
+                pending = new_sample_array()
+                last_flush = time.perf_counter_ns()
+        if pending:
+            connection.send(("samples", pending.tobytes()))
+        
+        counter_values = counters.stop() if counters else {}
+        memory_delta = process.memory_info().rss - start_memory
+        connection.send(("done", encode_worker_value(value), counter_values, memory_delta))
+    except BaseException as ex:
+        connection.send(("error", f"{type(ex).__name__}: {str(ex)}"))
+    finally:
+        connection.close()
+
+# ==== Operações para benchmarks de concorrência (threads e processos) ====
+
+# Tamanho da mensagem assinada nos testes de concorrência (requisição típica de serviço)
+SCALING_MESSAGE_SIZE = 256
+
+# Fixtures (chaves, assinaturas) reutilizadas por processo e compartilhadas entre threads
+_SCALING_FIXTURES = {}
+_SCALING_FIXTURES_LOCK = threading.Lock()
+
+def build_scaling_operation(name):
+    """Cria a chave e os dados de uma operação de concorrência e retorna a função a ser medida"""
+    message = b"\x5a" * SCALING_MESSAGE_SIZE
+    pss = asym_padding.PSS(mgf=asym_padding.MGF1(hashes.SHA256()), salt_length=asym_padding.PSS.MAX_LENGTH)
+    
+    if name.startswith("Ed25519"):
+        private_key = ed25519.Ed25519PrivateKey.generate()
+        if name == "Ed25519 Signing":
+            return lambda: private_key.sign(message)
+        signature = private_key.sign(message)
+        public_key = private_key.public_key()
+        return lambda: public_key.verify(signature, message)
+    if name == "X25519 Key Exchange":
+        private_key = x25519.X25519PrivateKey.generate()
+        peer_public = x25519.X25519PrivateKey.generate().public_key()
+        return lambda: private_key.exchange(peer_public)
+    if name.startswith("NIST_P256"):
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        if name == "NIST_P256 Signing":
+            return lambda: private_key.sign(message, ec.ECDSA(hashes.SHA256()))
+        signature = private_key.sign(message, ec.ECDSA(hashes.SHA256()))
+        public_key = private_key.public_key()
+        return lambda: public_key.verify(signature, message, ec.ECDSA(hashes.SHA256()))
+    if name.startswith("RSA-2048"):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        if name == "RSA-2048 Signing":
+            return lambda: private_key.sign(message, pss, hashes.SHA256())
+        signature = private_key.sign(message, pss, hashes.SHA256())
+        public_key = private_key.public_key()
+        return lambda: public_key.verify(signature, message, pss, hashes.SHA256())
+    raise ValueError(f"Operação de concorrência desconhecida: {name}")
+
+# Operações disponíveis: nome -> (algoritmo, tamanho da chave, tipo de operação)
+SCALING_OPERATIONS = {
+    "Ed25519 Signing": ("Ed25519", 256, "Signing"),
+    "Ed25519 Verification": ("Ed25519", 256, "Verification"),
+    "X25519 Key Exchange": ("X25519", 256, "Key Exchange"),
+    "NIST_P256 Signing": ("NIST_P256", 256, "Signing"),
+    "NIST_P256 Verification": ("NIST_P256", 256, "Verification"),
+    "RSA-2048 Signing": ("RSA", 2048, "Signing"),
+    "RSA-2048 Verification": ("RSA", 2048, "Verification")
+}
+
+def get_scaling_operation(name):
+    """Retorna a função da operação, criando a fixture uma única vez por processo"""
+    with _SCALING_FIXTURES_LOCK:
+        if name not in _SCALING_FIXTURES:
+            _SCALING_FIXTURES[name] = build_scaling_operation(name)
+        return _SCALING_FIXTURES[name]
+
+def run_request_operations(names):
+    """Executa uma requisição simulada (sequência de operações) e retorna o tempo de serviço em segundos"""
+    start_time = time.perf_counter()
+    for name in names:
+        get_scaling_operation(name)()
+    return time.perf_counter() - start_time
+
+def run_scaling_worker(name, count):
+    """
+    Executa a operação `count` vezes (usado por threads e processos) e retorna
+    (count, instantes de run_timed_operations). count=0 apenas aquece.
+    """
+    operation = get_scaling_operation(name)
+    if count == 0:
+        # Aquecimento: garante a criação da fixture e dá tempo para os demais workers iniciarem
+        time.sleep(0.05)
+    return run_timed_operations(operation, count)
+
+# ==== Certificados e handshakes TLS em loopback ====
+
+def build_self_signed_certificate(private_key, common_name="localhost", days=1):
+    """Emite um certificado autoassinado (com SAN localhost/127.0.0.1) para a chave informada"""
+    import ipaddress
+    
+    name = x509.Name([x509.NameAttribute(x509.NameOID.COMMON_NAME, common_name)])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(private_key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=days))
+        .add_extension(x509.SubjectAlternativeName([
+            x509.DNSName("localhost"),
+            x509.IPAddress(ipaddress.ip_address("127.0.0.1"))
+        ]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(private_key, certificate_signature_hash(private_key))
+    )
+
+def certificate_signature_hash(private_key):
+    """Algoritmo de hash da assinatura X.509 (Ed25519/Ed448 não usam hash externo)"""
+    if isinstance(private_key, (ed25519.Ed25519PrivateKey, ed448.Ed448PrivateKey)):
+        return None
+    return hashes.SHA256()
+
+def issue_certificate(csr, issuer_certificate, issuer_key, days=1, ca=False):
+    """Emite um certificado de curta duração a partir de uma CSR, assinado pelo emissor"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return (
+        x509.CertificateBuilder()
+        .subject_name(csr.subject)
+        .issuer_name(issuer_certificate.subject)
+        .public_key(csr.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=days))
+        .add_extension(x509.BasicConstraints(ca=ca, path_length=None), critical=True)
+        .sign(issuer_key, certificate_signature_hash(issuer_key))
+    )
+
+def build_certificate_request(private_key, common_name):
+    """Cria e assina uma CSR com o nome informado como CN e SAN"""
+    return (
+        x509.CertificateSigningRequestBuilder()
+        .subject_name(x509.Name([x509.NameAttribute(x509.NameOID.COMMON_NAME, common_name)]))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName(common_name)]), critical=False)
+        .sign(private_key, certificate_signature_hash(private_key))
+    )
+
+def build_tls_server_context(cert_path, key_path):
+    """
+    Contexto TLS do servidor. Deve ser criado antes do fork: as chaves dos tickets
+    de sessão são geradas com o contexto, e todos os processos servidores precisam
+    compartilhá-las para aceitar tickets emitidos por qualquer um deles.
+    """
+    import ssl
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    return context
+
+def run_tls_server_worker(listen_socket, context):
+    """Processo servidor: aceita conexões no socket compartilhado e completa o handshake TLS"""
+    import ssl
+    while True:
+        connection, _ = listen_socket.accept()
+        try:
+            with context.wrap_socket(connection, server_side=True) as tls_connection:
+                # Um byte de resposta faz o cliente processar os tickets de sessão (TLS 1.3)
+                tls_connection.sendall(b"\x00")
+        except (OSError, ssl.SSLError):
+            connection.close()
+
+def run_tls_client_worker(port, cert_path, duration, resume):
+    """
+    Processo cliente: executa handshakes em sequência por `duration` segundos.
+    Com resume=True, reutiliza a sessão anterior (retomada por ticket).
+    Retorna (handshakes, handshakes retomados, tempo decorrido, versão TLS,
+    tempo gasto nos handshakes retomados).
+    """
+    import ssl
+    import socket
+    context = ssl.create_default_context(cafile=cert_path)
+    session = None
+    handshakes = resumed = 0
+    resumed_seconds = 0.0
+    tls_version = ""
+    
+    start_time = time.perf_counter()
+    deadline = start_time + duration
+    while time.perf_counter() < deadline:
+        handshake_start = time.perf_counter()
+        with socket.create_connection(("127.0.0.1", port)) as connection:
+            with context.wrap_socket(connection, server_hostname="localhost",
+                                     session=session if resume else None) as tls_connection:
+                tls_connection.recv(1)
+                handshakes += 1
+                if tls_connection.session_reused:
+                    resumed += 1
+                    resumed_seconds += time.perf_counter() - handshake_start
+                tls_version = tls_connection.version()
+                if resume:
+                    session = tls_connection.session
+    return handshakes, resumed, time.perf_counter() - start_time, tls_version, resumed_seconds
+
+# ==== Tokens JWS/JWT (serialização compacta) ====
+
+# alg JWS -> (algoritmo da suíte, tamanho da chave, nome do hash)
+JWS_ALGORITHMS = {
+    "EdDSA": ("Ed25519", 256, None),
+    "ES256": ("NIST_P256", 256, "SHA256"),
+    "ES384": ("NIST_P384", 384, "SHA384"),
+    "ES512": ("NIST_P521", 521, "SHA512"),
+    "RS256": ("RSA", 2048, "SHA256"),
+    "PS256": ("RSA", 2048, "SHA256")
+}
+
+def base64url_encode(data):
+    """Codificação base64url sem preenchimento (RFC 7515)"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def base64url_decode(data):
+    """Decodificação base64url aceitando a ausência de preenchimento"""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+def jws_signing_input(alg, claims):
+    """Monta o cabeçalho e o payload codificados (parte assinada do token)"""
+    header = json.dumps({"alg": alg, "typ": "JWT"}, separators=(",", ":")).encode()
+    payload = json.dumps(claims, separators=(",", ":")).encode()
+    return base64url_encode(header) + b"." + base64url_encode(payload)
+
+def sign_jws(alg, private_key, claims):
+    """Gera um token JWS compacto; assinaturas ECDSA são convertidas de DER para r||s"""
+    _, key_size, hash_name = JWS_ALGORITHMS[alg]
+    hash_class = getattr(hashes, hash_name) if hash_name else None
+    signing_input = jws_signing_input(alg, claims)
+    if alg == "EdDSA":
+        signature = private_key.sign(signing_input)
+    elif alg.startswith("ES"):
+        r, s = asym_utils.decode_dss_signature(private_key.sign(signing_input, ec.ECDSA(hash_class())))
+        size = (key_size + 7) // 8
+        signature = r.to_bytes(size, "big") + s.to_bytes(size, "big")
+    elif alg == "RS256":
+        signature = private_key.sign(signing_input, asym_padding.PKCS1v15(), hash_class())
+    else:
+        signature = private_key.sign(
+            signing_input,
+            asym_padding.PSS(mgf=asym_padding.MGF1(hash_class()), salt_length=hash_class.digest_size),
+            hash_class())
+    return (signing_input + b"." + base64url_encode(signature)).decode()
+
+def verify_jws(alg, public_key, token):
+    """Verifica um token JWS compacto e retorna as claims decodificadas"""
+    _, key_size, hash_name = JWS_ALGORITHMS[alg]
+    hash_class = getattr(hashes, hash_name) if hash_name else None
+    signing_input, _, encoded_signature = token.encode().rpartition(b".")
+    header = json.loads(base64url_decode(signing_input.split(b".", 1)[0]))
+    if header.get("alg") != alg:
+        raise ValueError(f"Algoritmo inesperado no cabeçalho: {header.get('alg')}")
+    signature = base64url_decode(encoded_signature)
+    
+    if alg == "EdDSA":
+        public_key.verify(signature, signing_input)
+    elif alg.startswith("ES"):
+        size = (key_size + 7) // 8
+        der_signature = asym_utils.encode_dss_signature(int.from_bytes(signature[:size], "big"),
+                                             int.from_bytes(signature[size:], "big"))
+        public_key.verify(der_signature, signing_input, ec.ECDSA(hash_class()))
+    elif alg == "RS256":
+        public_key.verify(signature, signing_input, asym_padding.PKCS1v15(), hash_class())
+    else:
+        public_key.verify(
+            signature, signing_input,
+            asym_padding.PSS(mgf=asym_padding.MGF1(hash_class()), salt_length=hash_class.digest_size),
+            hash_class())
+    return json.loads(base64url_decode(signing_input.split(b".", 1)[1]))
+
+def build_jwt_claims():
+    """Claims típicas de um token de acesso de curta duração"""
+    issued_at = int(time.time())
+    return {
+        "iss": "https://auth.benchmark.local",
+        "sub": "user-1234567890",
+        "aud": "api.benchmark.local",
+        "iat": issued_at,
+        "exp": issued_at + 300,
+        "scope": "read write",
+        "jti": "3f9c2a4e-1b7d-4c8e-9a6f-0d2e5b7c8a91"
+    }
+
+# ==== Derivação de chaves e hash de senhas (KDF) ====
+
+# Senha e sal fixos: o custo das KDFs não depende do conteúdo da entrada
+KDF_PASSWORD = b"correct horse battery staple"
+KDF_SALT = b"\x5a" * 16
+KDF_OUTPUT_LENGTH = 32
+
+# Configurações: nome -> (KDF, parâmetros). scrypt usa 128·N·r bytes e Argon2id
+# usa memory_cost KiB; as últimas de cada família excedem pods de 0,5 GB.
+KDF_CONFIGS = {
+    "HKDF-SHA256": ("HKDF", {}),
+    "PBKDF2-SHA256 i=100000": ("PBKDF2", {"iterations": 100_000}),
+    "PBKDF2-SHA256 i=600000": ("PBKDF2", {"iterations": 600_000}),
+    "scrypt N=2^14 r=8 p=1": ("scrypt", {"n": 2 ** 14, "r": 8, "p": 1}),
+    "scrypt N=2^15 r=8 p=1": ("scrypt", {"n": 2 ** 15, "r": 8, "p": 1}),
+    "scrypt N=2^15 r=8 p=3": ("scrypt", {"n": 2 ** 15, "r": 8, "p": 3}),
+    "scrypt N=2^17 r=8 p=1": ("scrypt", {"n": 2 ** 17, "r": 8, "p": 1}),
+    "scrypt N=2^20 r=8 p=1": ("scrypt", {"n": 2 ** 20, "r": 8, "p": 1}),
+    "Argon2id m=19MiB t=2 p=1": ("Argon2id", {"memory_cost": 19 * 1024, "iterations": 2, "lanes": 1}),
+    "Argon2id m=64MiB t=3 p=4": ("Argon2id", {"memory_cost": 64 * 1024, "iterations": 3, "lanes": 4}),
+    "Argon2id m=2GiB t=1 p=4": ("Argon2id", {"memory_cost": 2 * 1024 * 1024, "iterations": 1, "lanes": 4})
+}
+
+def build_kdf_operation(name):
+    """Retorna uma função que deriva uma chave com a configuração indicada (KDFs são de uso único)"""
+    kind, params = KDF_CONFIGS[name]
+    if kind == "HKDF":
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+        return lambda: HKDF(algorithm=hashes.SHA256(), length=KDF_OUTPUT_LENGTH,
+                            salt=KDF_SALT, info=b"benchmark").derive(KDF_PASSWORD)
+    if kind == "PBKDF2":
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+        return lambda: PBKDF2HMAC(algorithm=hashes.SHA256(), length=KDF_OUTPUT_LENGTH, salt=KDF_SALT,
+                                  iterations=params["iterations"]).derive(KDF_PASSWORD)
+    if kind == "scrypt":
+        from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+        return lambda: Scrypt(salt=KDF_SALT, length=KDF_OUTPUT_LENGTH,
+                              n=params["n"], r=params["r"], p=params["p"]).derive(KDF_PASSWORD)
+    if kind == "Argon2id":
+        from cryptography.hazmat.primitives.kdf.argon2 import Argon2id
+        return lambda: Argon2id(salt=KDF_SALT, length=KDF_OUTPUT_LENGTH, iterations=params["iterations"],
+                                lanes=params["lanes"], memory_cost=params["memory_cost"]).derive(KDF_PASSWORD)
+    raise ValueError(f"KDF desconhecida: {kind}")
+
+def kdf_memory_bytes(name):
+    """Memória de trabalho exigida pela configuração (0 para KDFs sem custo de memória)"""
+    kind, params = KDF_CONFIGS[name]
+    if kind == "scrypt":
+        return 128 * params["n"] * params["r"]
+    if kind == "Argon2id":
+        return params["memory_cost"] * 1024
+    return 0
+
+def run_kdf_worker(name, count):
+    """Executa a derivação `count` vezes em um worker do pool; retorna (count, instantes). count=0 apenas aquece."""
+    operation = build_kdf_operation(name)
+    if count == 0:
+        time.sleep(0.05)
+    return run_timed_operations(operation, count)
+
+def reset_peak_rss():
+    """Zera o pico de RSS do processo (VmHWM) no Linux; retorna False se não suportado"""
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+def read_peak_rss_bytes():
+    """Lê o pico de RSS do processo (VmHWM) em bytes, ou None se indisponível"""
+    for line in (read_system_file("/proc/self/status") or "").splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) * 1024
+    return None
+
+# ==== Troca de chaves híbrida X25519 + ML-KEM ====
+
+def combine_hybrid_secrets(kem_secret, x25519_secret):
+    """Deriva o segredo da sessão a partir da concatenação ML-KEM || X25519 (ordem do X25519MLKEM768)"""
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+    return HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                info=b"hybrid handshake").derive(kem_secret + x25519_secret)
+
+def hybrid_client_hello(kem_classes):
+    """Cliente: gera as chaves efêmeras e monta o key share (chave pública ML-KEM || X25519)"""
+    kem_private = kem_classes[0].generate()
+    x25519_private = x25519.X25519PrivateKey.generate()
+    key_share = kem_private.public_key().public_bytes_raw() + x25519_private.public_key().public_bytes_raw()
+    return (kem_private, x25519_private), key_share
+
+def hybrid_server_response(kem_classes, key_share):
+    """Servidor: encapsula para a chave ML-KEM, troca X25519 e retorna (key share, segredo)"""
+    kem_public = kem_classes[1].from_public_bytes(key_share[:-32])
+    kem_secret, ciphertext = kem_public.encapsulate()
+    x25519_private = x25519.X25519PrivateKey.generate()
+    x25519_secret = x25519_private.exchange(x25519.X25519PublicKey.from_public_bytes(key_share[-32:]))
+    server_share = ciphertext + x25519_private.public_key().public_bytes_raw()
+    return server_share, combine_hybrid_secrets(kem_secret, x25519_secret)
+
+def hybrid_client_finish(client_state, server_share):
+    """Cliente: desencapsula o ciphertext, troca X25519 e deriva o mesmo segredo do servidor"""
+    kem_private, x25519_private = client_state
+    kem_secret = kem_private.decapsulate(server_share[:-32])
+    x25519_secret = x25519_private.exchange(x25519.X25519PublicKey.from_public_bytes(server_share[-32:]))
+    return combine_hybrid_secrets(kem_secret, x25519_secret)
+
+def run_hybrid_handshake(kem_classes):
+    """Executa a troca híbrida completa (cliente e servidor) e retorna os dois segredos e os bytes trafegados"""
+    client_state, key_share = hybrid_client_hello(kem_classes)
+    server_share, server_secret = hybrid_server_response(kem_classes, key_share)
+    client_secret = hybrid_client_finish(client_state, server_share)
+    return client_secret, server_secret, len(key_share) + len(server_share)
+
+# ==== Funções estatísticas auxiliares ====
+
+def median(values):
+    """Calcula a mediana de uma lista de valores"""
+    ordered = sorted(values)
+    n = len(ordered)
+    if n == 0:
+        return 0.0
+    middle = n // 2
+    if n % 2 == 1:
+        return float(ordered[middle])
+    return (ordered[middle - 1] + ordered[middle]) / 2.0
+
+def median_absolute_deviation(values):
+    """Calcula o desvio absoluto mediano (MAD) de uma lista de valores"""
+    if not values:
+        return 0.0
+    center = median(values)
+    return median([abs(value - center) for value in values])
+
+def percentile(values, pct):
+    """Calcula o percentil (0-100) com interpolação linear entre as amostras ordenadas"""
+    return percentile_of_sorted(sorted(values), pct)
+
+def percentile_of_sorted(ordered, pct):
+    """Percentil (0-100) de uma sequência já ordenada, com interpolação linear"""
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * pct / 100.0
+    lower = int(math.floor(position))
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+# NumPy é opcional: carregado sob demanda e usado apenas para vetorizar as estatísticas
+_NUMPY = None
+
+def get_numpy():
+    """Retorna o módulo numpy, ou None se não estiver instalado (importado uma única vez)"""
+    global _NUMPY
+    if _NUMPY is None:
+        try:
+            _NUMPY = importlib.import_module("numpy")
+        except ImportError:
+            _NUMPY = False
+    return _NUMPY or None
+
+def new_sample_array(values=()):
+    """Cria o armazenamento compacto de amostras: inteiros de 64 bits (8 bytes por amostra)"""
+    return array("q", values)
+
+def summarize_samples(samples_ns):
+    """
+    Estatísticas resumidas (em ms) das amostras em nanossegundos: média, desvio padrão,
+    mínimo, máximo, mediana, p90 e p99. Com NumPy o cálculo é vetorizado sobre o próprio
+    buffer do array (sem cópia); sem NumPy, uma única ordenação atende todos os percentis.
+    """
+    count = len(samples_ns)
+    if count == 0:
+        return {"count": 0, "mean_ms": 0.0, "stdev_ms": 0.0, "min_ms": 0.0, "max_ms": 0.0,
+                "median_ms": 0.0, "p90_ms": 0.0, "p99_ms": 0.0}
+    
+    np = get_numpy()
+    if np is not None:
+        if isinstance(samples_ns, array):
+            values = np.frombuffer(samples_ns, dtype=np.int64)
+        else:
+            values = np.asarray(samples_ns, dtype=np.int64)
+        p50, p90, p99 = (float(value) for value in np.percentile(values, [50, 90, 99]))
+        mean = float(values.mean())
+        stdev = float(values.std(ddof=1)) if count > 1 else 0.0
+        minimum, maximum = int(values.min()), int(values.max())
+    else:
+        ordered = sorted(samples_ns)
+        p50, p90, p99 = (percentile_of_sorted(ordered, pct) for pct in (50, 90, 99))
+        mean = math.fsum(ordered) / count
+        stdev = math.sqrt(math.fsum((value - mean) ** 2 for value in ordered) / (count - 1)) if count > 1 else 0.0
+        minimum, maximum = ordered[0], ordered[-1]
+    
+    return {"count": count, "mean_ms": mean / 1e6, "stdev_ms": stdev / 1e6, "min_ms": minimum / 1e6,
+            "max_ms": maximum / 1e6, "median_ms": p50 / 1e6, "p90_ms": p90 / 1e6, "p99_ms": p99 / 1e6}
+
+def mann_whitney_u_pvalue(baseline, current):
+    """
+    Teste de Mann-Whitney U unilateral (aproximação normal com correção de empates).
+    Retorna o p-valor da hipótese de que os valores atuais são maiores que os da linha de base.
+    """
+    n1, n2 = len(baseline), len(current)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    # Atribuição de postos (ranks) médios para valores empatados
+    combined = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    ranks = [0.0] * len(combined)
+    tie_correction = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2.0 + 1
+        for k in range(i, j + 1):
+            ranks[k] = average_rank
+        tied = j - i + 1
+        tie_correction += tied ** 3 - tied
+        i = j + 1
+
+    rank_sum_current = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 1)
+    u_current = rank_sum_current - n2 * (n2 + 1) / 2.0
+
+    n = n1 + n2
+    mean_u = n1 * n2 / 2.0
+    variance_u = n1 * n2 / 12.0 * ((n + 1) - tie_correction / (n * (n - 1))) if n > 1 else 0.0
+    if variance_u <= 0:
+        return 1.0
+
+    # Correção de continuidade
+    z = (u_current - mean_u - 0.5) / math.sqrt(variance_u)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+# ==== Histogramas de latência (log-linear, estilo HdrHistogram) ====
+
+class LatencyHistogram:
+    """
+    Histograma log-linear de latências em nanossegundos, no estilo do HdrHistogram:
+    valores menores que 2^SUB_BUCKET_BITS são exatos; acima disso, cada potência de 2
+    é dividida em 2^SUB_BUCKET_BITS faixas iguais (erro relativo < 0,8%). A memória é
+    limitada pela faixa de valores, não pelo número de amostras, e histogramas são
+    combinados somando as contagens (entre workers, rodadas e execuções).
+    """
+    SUB_BUCKET_BITS = 7
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+    def __init__(self):
+        self.counts = {}        # Índice da faixa -> contagem (apenas faixas não vazias)
+        self.total_count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = None
+
+    @classmethod
+    def bucket_index(cls, value_ns):
+        """Índice da faixa que contém o valor"""
+        if value_ns < cls.SUB_BUCKET_COUNT:
+            return max(0, value_ns)
+        shift = value_ns.bit_length() - 1 - cls.SUB_BUCKET_BITS
+        return ((shift + 1) << cls.SUB_BUCKET_BITS) + (value_ns >> shift) - cls.SUB_BUCKET_COUNT
+
+    @classmethod
+    def bucket_bounds(cls, index):
+        """Menor e maior valor (ns) representados pela faixa"""
+        block = index >> cls.SUB_BUCKET_BITS
+        if block == 0:
+            return index, index
+        shift = block - 1
+        lower = ((index & (cls.SUB_BUCKET_COUNT - 1)) + cls.SUB_BUCKET_COUNT) << shift
+        return lower, lower + (1 << shift) - 1
 
-# Verificação da disponibilidade de RSA
-try:
-    from cryptography.hazmat.primitives.asymmetric import rsa
-    AVAILABLE_ALGORITHMS.append("RSA")
-    print("✓ RSA disponível")
-except (ImportError, AttributeError) as e:
-    print(f"⚠️ AVISO: RSA não disponível: {str(e)}")
-
-# Verificação da disponibilidade de Curve25519/Ed25519
-try:
-    from cryptography.hazmat.primitives.asymmetric import x25519, ed25519
-    ed25519.Ed25519PrivateKey.generate()
-    AVAILABLE_ALGORITHMS.append("Ed25519")
-    AVAILABLE_ALGORITHMS.append("X25519")
-    print("✓ Curve25519/Ed25519 disponível")
-except (ImportError, AttributeError) as e:
-    print(f"⚠️ AVISO: Curve25519/Ed25519 não disponível: {str(e)}")
-
-# Verificação da disponibilidade de curvas NIST
-try:
-    from cryptography.hazmat.primitives.asymmetric import ec
-    ec.generate_private_key(ec.SECP256R1())
-    AVAILABLE_ALGORITHMS.append("NIST_P256")
-    AVAILABLE_ALGORITHMS.append("NIST_P384")
-    AVAILABLE_ALGORITHMS.append("NIST_P521")
-    print("✓ Curvas NIST (P-256/P-384/P-521) disponíveis")
-except (ImportError, AttributeError) as e:
-    print(f"⚠️ AVISO: Curvas NIST não disponíveis: {str(e)}")
-
-print(f"Algoritmos disponíveis: {', '.join(AVAILABLE_ALGORITHMS)}")
+    def record(self, value_ns, count=1):
+        """Registra `count` ocorrências de uma latência"""
+        value_ns = int(value_ns)
+        index = self.bucket_index(value_ns)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += count
+        self.total_ns += value_ns * count
+        self.min_ns = value_ns if self.min_ns is None else min(self.min_ns, value_ns)
+        self.max_ns = value_ns if self.max_ns is None else max(self.max_ns, value_ns)
+
+    @classmethod
+    def from_samples(cls, samples_ns):
+        """Cria o histograma a partir de amostras em ns (vetorizado com NumPy, se disponível)"""
+        histogram = cls()
+        if not len(samples_ns):
+            return histogram
+        np = get_numpy()
+        if np is None:
+            for value in samples_ns:
+                histogram.record(value)
+            return histogram
+        
+        values = (np.frombuffer(samples_ns, dtype=np.int64) if isinstance(samples_ns, array)
+                  else np.asarray(samples_ns, dtype=np.int64))
+        values = np.maximum(values, 0)
+        # bit_length via frexp (exato para valores < 2^53 ns, ~104 dias)
+        bit_length = np.frexp(values.astype(np.float64))[1].astype(np.int64)
+        shift = np.maximum(bit_length - 1 - cls.SUB_BUCKET_BITS, 0)
+        indices = np.where(values < cls.SUB_BUCKET_COUNT, values,
+                           ((shift + 1) << cls.SUB_BUCKET_BITS) + (values >> shift) - cls.SUB_BUCKET_COUNT)
+        unique_indices, counts = np.unique(indices, return_counts=True)
+        histogram.counts = {int(index): int(count) for index, count in zip(unique_indices, counts)}
+        histogram.total_count = int(values.size)
+        histogram.total_ns = int(values.sum())
+        histogram.min_ns, histogram.max_ns = int(values.min()), int(values.max())
+        return histogram
+
+    def merge(self, other):
+        """Soma as contagens de outro histograma a este (retorna self)"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += other.total_count
+        self.total_ns += other.total_ns
+        for value in (other.min_ns, other.max_ns):
+            if value is not None:
+                self.min_ns = value if self.min_ns is None else min(self.min_ns, value)
+                self.max_ns = value if self.max_ns is None else max(self.max_ns, value)
+        return self
+
+    def value_at_percentile(self, pct):
+        """Latência (ns) no percentil (0-100): maior valor equivalente da faixa que o contém"""
+        if not self.total_count:
+            return 0
+        target = max(1, math.ceil(self.total_count * pct / 100.0))
+        cumulative = 0
+        for index in sorted(self.counts):
+            cumulative += self.counts[index]
+            if cumulative >= target:
+                return min(self.bucket_bounds(index)[1], self.max_ns)
+        return self.max_ns
+
+    def cumulative_counts(self, bounds_ns):
+        """
+        Contagens acumuladas menores ou iguais a cada limite (ns, em ordem crescente),
+        usando o maior valor equivalente de cada faixa, como em value_at_percentile
+        """
+        counts = []
+        cumulative = 0
+        indices = sorted(self.counts)
+        position = 0
+        for bound in bounds_ns:
+            while position < len(indices) and min(self.bucket_bounds(indices[position])[1], self.max_ns) <= bound:
+                cumulative += self.counts[indices[position]]
+                position += 1
+            counts.append(cumulative)
+        return counts
+
+    def summary(self):
+        """p50/p90/p99/p99.9, mínimo, máximo e média em ms"""
+        return {
+            "count": self.total_count,
+            "mean_ms": self.total_ns / self.total_count / 1e6 if self.total_count else 0.0,
+            "min_ms": (self.min_ns or 0) / 1e6,
+            "p50_ms": self.value_at_percentile(50) / 1e6,
+            "p90_ms": self.value_at_percentile(90) / 1e6,
+            "p99_ms": self.value_at_percentile(99) / 1e6,
+            "p999_ms": self.value_at_percentile(99.9) / 1e6,
+            "max_ms": (self.max_ns or 0) / 1e6
+        }
+
+    def to_dict(self):
+        """Forma serializável em JSON (apenas faixas não vazias)"""
+        return {"sub_bucket_bits": self.SUB_BUCKET_BITS, "total_count": self.total_count,
+                "total_ns": self.total_ns, "min_ns": self.min_ns, "max_ns": self.max_ns,
+                "counts": [[index, self.counts[index]] for index in sorted(self.counts)]}
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("sub_bucket_bits", cls.SUB_BUCKET_BITS) != cls.SUB_BUCKET_BITS:
+            raise ValueError(f"Histograma com {data['sub_bucket_bits']} bits de subfaixa "
+                             f"(suportado: {cls.SUB_BUCKET_BITS})")
+        histogram = cls()
+        histogram.counts = {int(index): int(count) for index, count in data["counts"]}
+        histogram.total_count = data["total_count"]
+        histogram.total_ns = data["total_ns"]
+        histogram.min_ns, histogram.max_ns = data["min_ns"], data["max_ns"]
+        return histogram
+
+    def percentile_distribution(self):
+        """
+        Distribuição de percentis no formato de texto do HdrHistogram (.hgrm, valores em ms),
+        compatível com o HdrHistogram Plotter
+        """
+        lines = [f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>14}", ""]
+        cumulative = 0
+        for index in sorted(self.counts):
+            cumulative += self.counts[index]
+            fraction = cumulative / self.total_count
+            value_ms = min(self.bucket_bounds(index)[1], self.max_ns) / 1e6
+            inverse = f"{1 / (1 - fraction):14.2f}" if fraction < 1 else f"{'inf':>14}"
+            lines.append(f"{value_ms:12.6f} {fraction:14.12f} {cumulative:10d} {inverse}")
+        summary = self.summary()
+        variance = 0.0
+        if self.total_count:
+            mean_ns = self.total_ns / self.total_count
+            for index, count in self.counts.items():
+                lower, upper = self.bucket_bounds(index)
+                variance += count * ((lower + upper) / 2 - mean_ns) ** 2
+            variance /= self.total_count
+        lines.append(f"#[Mean    = {summary['mean_ms']:12.6f}, StdDeviation   = {math.sqrt(variance) / 1e6:12.6f}]")
+        lines.append(f"#[Max     = {summary['max_ms']:12.6f}, Total count    = {self.total_count:12d}]")
+        lines.append(f"#[Buckets = {len(self.counts):12d}, SubBuckets     = {self.SUB_BUCKET_COUNT:12d}]")
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def from_timestamps(cls, timestamps_ns):
+        """Cria o histograma a partir de instantes consecutivos (ns): latência = diferença entre vizinhos"""
+        np = get_numpy()
+        if np is not None and isinstance(timestamps_ns, array):
+            return cls.from_samples(np.diff(np.frombuffer(timestamps_ns, dtype=np.int64)))
+        return cls.from_samples([end - start for start, end in zip(timestamps_ns, timestamps_ns[1:])])
+
+def run_timed_operations(operation, count):
+    """
+    Executa a operação `count` vezes e retorna (count, instantes em ns): um array 'q'
+    pré-alocado com o início e o fim de cada operação (o fim de uma é o início da
+    seguinte). O laço faz uma leitura de relógio e uma escrita por operação, sem
+    alocar nem manter o GIL por mais tempo; o histograma é montado depois, fora da
+    região medida (LatencyHistogram.from_timestamps).
+    """
+    timestamps = array("q", bytes(8 * (count + 1)))
+    clock = time.perf_counter_ns
+    timestamps[0] = clock()
+    for index in range(1, count + 1):
+        operation()
+        timestamps[index] = clock()
+    return count, timestamps
+
+# ==== Agregação vetorizada de resultados (execução atual e histórico) ====
+
+class ResultTable:
+    """
+    Tabela colunar de resultados para agregação em lote: cada grupo (algoritmo, chave,
+    operação, configuração) recebe um código inteiro e os tempos ficam em arrays
+    compactos ('q', ns) paralelos aos códigos. Com NumPy, mediana, quantis, mínimo,
+    máximo e médias de todos os grupos são calculados de uma vez (uma ordenação);
+    sem NumPy, o cálculo é feito grupo a grupo em Python puro.
+    """
+    KEY_FIELDS = ("algorithm", "key_size", "operation", "config")
+    BOOTSTRAP_RESAMPLES = 1000
+    # Acima disso o bootstrap usa uma subamostra de m valores (m-out-of-n) e a largura do
+    # intervalo é reescalada por sqrt(m/n), válido para a mediana
+    BOOTSTRAP_MAX_SAMPLES = 1000
+
+    def __init__(self, key_fields=KEY_FIELDS):
+        self.key_fields = tuple(key_fields)
+        self.keys = []                      # Código -> tupla de chave
+        self.key_codes = {}                 # Tupla de chave -> código
+        self.sample_groups = array("q")     # Código do grupo de cada amostra
+        self.samples_ns = array("q")        # Tempos (ns)
+        self.row_groups = array("q")        # Código do grupo de cada resultado
+        self.memory_mb = array("d")
+        self.cpu_pct = array("d")
+
+    def __len__(self):
+        return len(self.row_groups)
+
+    def group_code(self, key):
+        code = self.key_codes.get(key)
+        if code is None:
+            code = self.key_codes[key] = len(self.keys)
+            self.keys.append(key)
+        return code
+
+    def add(self, fields, times_ns, memory_mb=0.0, cpu_pct=0.0):
+        """Adiciona um resultado (um ou mais tempos em ns) ao grupo definido pelos campos"""
+        code = self.group_code(tuple(fields.get(name, "") for name in self.key_fields))
+        self.row_groups.append(code)
+        self.memory_mb.append(memory_mb or 0.0)
+        self.cpu_pct.append(cpu_pct or 0.0)
+        if not isinstance(times_ns, array) or times_ns.typecode != "q":
+            times_ns = new_sample_array(times_ns)
+        self.samples_ns.extend(times_ns)
+        self.sample_groups.extend(array("q", [code]) * len(times_ns))
+
+    def add_result(self, result, config="", use_samples=True):
+        """Adiciona um BenchmarkResult: amostras por iteração, ou apenas o tempo médio"""
+        fields = {"algorithm": result.algorithm, "key_size": result.key_size,
+                  "operation": result.operation_type, "config": config}
+        if use_samples and len(result.samples_ns):
+            times_ns = result.samples_ns
+        else:
+            times_ns = [int(round(result.execution_time_ms * 1e6))]
+        self.add(fields, times_ns, result.memory_usage_mb, result.cpu_percentage)
+
+    @classmethod
+    def from_results(cls, results, config="", key_fields=KEY_FIELDS, use_samples=True):
+        table = cls(key_fields)
+        for result in results:
+            table.add_result(result, config, use_samples)
+        return table
+
+    def aggregate(self, quantiles=(0.5, 0.9, 0.99), confidence=0.95, bootstrap=True, seed=0):
+        """
+        Estatísticas por grupo, na ordem em que os grupos apareceram: execuções, amostras,
+        média, mínimo, máximo, quantis (chaves "q50", "q90", ...), intervalo de confiança
+        bootstrap da mediana e médias de memória e CPU. Tempos em ms.
+        """
+        if not self.keys:
+            return []
+        np = get_numpy()
+        if np is not None:
+            columns = self._aggregate_numpy(np, quantiles, confidence, bootstrap, seed)
+        else:
+            columns = self._aggregate_python(quantiles, confidence, bootstrap, seed)
+        
+        rows = []
+        for code, key in enumerate(self.keys):
+            row = dict(zip(self.key_fields, key))
+            row.update({name: values[code] for name, values in columns.items()})
+            rows.append(row)
+        return rows
+
+    def _row_means(self, runs):
+        """Médias de memória e CPU por grupo (Python puro; uma entrada por resultado)"""
+        memory = [0.0] * len(self.keys)
+        cpu = [0.0] * len(self.keys)
+        for code, memory_mb, cpu_pct in zip(self.row_groups, self.memory_mb, self.cpu_pct):
+            memory[code] += memory_mb
+            cpu[code] += cpu_pct
+        return ([total / runs[code] for code, total in enumerate(memory)],
+                [total / runs[code] for code, total in enumerate(cpu)])
+
+    def _aggregate_numpy(self, np, quantiles, confidence, bootstrap, seed):
+        groups = len(self.keys)
+        codes = np.frombuffer(self.sample_groups, dtype=np.int64)
+        values = np.frombuffer(self.samples_ns, dtype=np.int64)
+        
+        # Uma única ordenação por (grupo, valor) atende mediana, quantis, mínimo e máximo.
+        # Quando cabem em 63 bits, grupo e valor viram uma chave só (np.sort, bem mais
+        # rápido que lexsort); a máscara recupera o valor.
+        value_bits = int(values.max()).bit_length()
+        if values.min() >= 0 and value_bits + (groups - 1).bit_length() <= 62:
+            combined = np.sort((codes << np.int64(value_bits)) | values)
+            sorted_values = (combined & np.int64((1 << value_bits) - 1)).astype(np.float64)
+            del combined
+        else:
+            sorted_values = values[np.lexsort((values, codes))].astype(np.float64)
+        counts = np.bincount(codes, minlength=groups)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        ends = starts + counts - 1
+        
+        def group_quantile(q):
+            position = starts + (counts - 1) * q
+            lower = np.floor(position).astype(np.int64)
+            upper = np.minimum(lower + 1, ends)
+            fraction = position - lower
+            return sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction
+        
+        row_codes = np.frombuffer(self.row_groups, dtype=np.int64)
+        runs = np.bincount(row_codes, minlength=groups)
+        columns = {
+            "runs": runs.tolist(),
+            "samples": counts.tolist(),
+            "mean_ms": (np.bincount(codes, weights=values, minlength=groups) / counts / 1e6).tolist(),
+            "min_ms": (sorted_values[starts] / 1e6).tolist(),
+            "max_ms": (sorted_values[ends] / 1e6).tolist(),
+            "memory_mb": (np.bincount(row_codes, weights=np.frombuffer(self.memory_mb), minlength=groups)
+                          / runs).tolist(),
+            "cpu_pct": (np.bincount(row_codes, weights=np.frombuffer(self.cpu_pct), minlength=groups)
+                        / runs).tolist()
+        }
+        for q in quantiles:
+            columns[f"q{q * 100:g}"] = (group_quantile(q) / 1e6).tolist()
+        
+        if bootstrap:
+            rng = np.random.default_rng(seed)
+            alpha = (1 - confidence) / 2
+            low, high = [], []
+            group_medians = group_quantile(0.5)
+            for start, count, center in zip(starts, counts, group_medians):
+                group_values = sorted_values[start:start + count]
+                if count > self.BOOTSTRAP_MAX_SAMPLES:
+                    group_values = rng.choice(group_values, self.BOOTSTRAP_MAX_SAMPLES, replace=False)
+                draws = rng.integers(0, len(group_values), size=(self.BOOTSTRAP_RESAMPLES, len(group_values)))
+                medians = np.median(group_values[draws], axis=1)
+                scale = math.sqrt(len(group_values) / count)
+                interval = center + (np.quantile(medians, [alpha, 1 - alpha]) - np.median(group_values)) * scale
+                low.append(float(interval[0]) / 1e6)
+                high.append(float(interval[1]) / 1e6)
+            columns["ci_low_ms"], columns["ci_high_ms"] = low, high
+        return columns
+
+    def _aggregate_python(self, quantiles, confidence, bootstrap, seed):
+        grouped = [[] for _ in self.keys]
+        for code, value in zip(self.sample_groups, self.samples_ns):
+            grouped[code].append(value)
+        runs = [0] * len(self.keys)
+        for code in self.row_groups:
+            runs[code] += 1
+        memory, cpu = self._row_means(runs)
+        
+        columns = {"runs": runs, "samples": [], "mean_ms": [], "min_ms": [], "max_ms": [],
+                   "memory_mb": memory, "cpu_pct": cpu}
+        for q in quantiles:
+            columns[f"q{q * 100:g}"] = []
+        if bootstrap:
+            columns["ci_low_ms"], columns["ci_high_ms"] = [], []
+            rng = random.Random(seed)
+            # Sem NumPy, menos reamostragens e amostras por grupo para manter o tempo aceitável
+            resamples = min(self.BOOTSTRAP_RESAMPLES, 200)
+            max_samples = min(self.BOOTSTRAP_MAX_SAMPLES, 500)
+            alpha = (1 - confidence) / 2
+        
+        for values in grouped:
+            ordered = sorted(values)
+            columns["samples"].append(len(ordered))
+            columns["mean_ms"].append(math.fsum(ordered) / len(ordered) / 1e6)
+            columns["min_ms"].append(ordered[0] / 1e6)
+            columns["max_ms"].append(ordered[-1] / 1e6)
+            for q in quantiles:
+                columns[f"q{q * 100:g}"].append(percentile_of_sorted(ordered, q * 100) / 1e6)
+            if bootstrap:
+                population = ordered if len(ordered) <= max_samples else rng.sample(ordered, max_samples)
+                medians = sorted(median(rng.choices(population, k=len(population))) for _ in range(resamples))
+                center = percentile_of_sorted(ordered, 50)
+                shift = median(population)
+                scale = math.sqrt(len(population) / len(ordered))
+                columns["ci_low_ms"].append((center + (percentile_of_sorted(medians, alpha * 100) - shift) * scale) / 1e6)
+                columns["ci_high_ms"].append((center + (percentile_of_sorted(medians, (1 - alpha) * 100) - shift) * scale) / 1e6)
+        return columns
+
+def history_config_label(path, root):
+    """
+    Configuração de um arquivo histórico: o diretório relativo (ex.: "2CPU_0.5GB") ou,
+    para arquivos na raiz, os núcleos e a memória indicados no nome do arquivo
+    """
+    import re
+    directory = os.path.relpath(os.path.dirname(path), root)
+    if directory != ".":
+        return directory.replace(os.sep, "/")
+    match = re.search(r"_(\d+)cores_([\d.]+)GB_", os.path.basename(path))
+    return f"{match.group(1)}CPU_{float(match.group(2)):.1f}GB" if match else ""
+
+def load_history_table(root, table=None):
+    """
+    Carrega as planilhas XLSX exportadas (Resultados_*.xlsx) sob `root`, recursivamente,
+    em uma ResultTable (um tempo médio por linha de resultado). Retorna (tabela, arquivos lidos).
+    """
+    import openpyxl
+    
+    table = table or ResultTable()
+    files = 0
+    for directory, _, filenames in sorted(os.walk(root)):
+        for filename in sorted(filenames):
+            if not (filename.startswith("Resultados_") and filename.endswith(".xlsx")):
+                continue
+            path = os.path.join(directory, filename)
+            config = history_config_label(path, root)
+            workbook = openpyxl.load_workbook(path, read_only=True)
+            try:
+                columns = None
+                for row in workbook.worksheets[0].iter_rows(values_only=True):
+                    if columns is None:
+                        if row and row[0] == "Algoritmo":
+                            columns = {name: index for index, name in enumerate(row) if name}
+                        continue
+                    if not row or not row[0]:
+                        break  # Fim da tabela de resultados (o resumo vem depois)
+                    time_ms = row[columns["Tempo de Execução (ms)"]]
+                    if time_ms is None:
+                        continue
+                    table.add({"algorithm": row[columns["Algoritmo"]],
+                               "key_size": row[columns["Tamanho da Chave (bits)"]],
+                               "operation": row[columns["Operação"]], "config": config},
+                              [int(round(float(time_ms) * 1e6))],
+                              row[columns["Uso de Memória (MB)"]], row[columns["Uso de CPU (%)"]])
+            finally:
+                workbook.close()
+            files += 1
+    return table, files
+
+# Versão do esquema de BenchmarkResult.to_dict, incrementada apenas em mudanças
+# incompatíveis (campo removido, renomeado ou com significado alterado). Campos novos
+# são aditivos e mantêm a versão: from_dict ignora campos desconhecidos e usa o valor
+# padrão para os ausentes. Verificado por check_result_api (--self-test).
+RESULT_SCHEMA_VERSION = 1
 
 class BenchmarkResult:
     """
     Classe para armazenar os resultados de um benchmark único.
+    Os campos são fixos (__slots__) e serializáveis com to_dict/from_dict.
     """
-    def __init__(self):
+    __slots__ = (
+        "algorithm", "key_size", "operation_type", "execution_time_ms", "memory_usage_mb",
+        "cpu_percentage", "data_size_bytes", "timestamp", "notes", "cryptography_version",
+        "openssl_version", "environment_id", "iterations", "samples_ns", "cpu_cycles",
+        "instructions", "cache_misses", "branch_misses", "cycles_per_op", "ipc",
+        "cycles_per_byte", "concurrency_mode", "workers", "throughput_ops", "net_time_ms",
+        "energy_joules", "core_energy_joules", "joules_per_op", "joules_per_mb", "latency_histogram",
+        "processes_data"
+    )
+
+    def __init__(self, **fields):
         self.algorithm = ""         # Nome do algoritmo testado
         self.key_size = 0           # Tamanho da chave em bits
         self.operation_type = ""    # Tipo de operação (ex: Key Generation, Signing, Verification)
-        self.execution_time_ms = 0  # Tempo de execução em milissegundos
+        self.execution_time_ms = 0  # Tempo médio por operação em milissegundos (também com N workers)
         self.memory_usage_mb = 0.0  # Uso de memória em MB
         self.cpu_percentage = 0.0   # Uso de CPU em percentual
         self.data_size_bytes = 0    # Tamanho dos dados testados em bytes
+        self.processes_data = False # A operação medida percorre os data_size_bytes (ciclos/byte e J/MB)
         self.timestamp = None       # Momento em que o benchmark foi executado
         self.notes = ""             # Notas adicionais (ex: timeout, erro)
+        self.cryptography_version = get_crypto_library_versions()["cryptography"]  # Versão da biblioteca cryptography
+        self.openssl_version = get_crypto_library_versions()["openssl"]            # Versão do OpenSSL usado pela cryptography
+        self.environment_id = ""    # Identificador da impressão digital do ambiente
+        self.iterations = 1         # Número de execuções medidas da operação
+        self.samples_ns = new_sample_array()  # Tempo de cada execução em ns (array 'q' compacto)
+        # Contadores de hardware (None quando indisponíveis ou desativados)
+        self.cpu_cycles = None      # Ciclos de CPU totais
+        self.instructions = None    # Instruções executadas totais
+        self.cache_misses = None    # Falhas de cache totais
+        self.branch_misses = None   # Falhas de previsão de desvio totais
+        self.cycles_per_op = None   # Ciclos por operação
+        self.ipc = None             # Instruções por ciclo
+        self.cycles_per_byte = None # Ciclos por byte (operações dependentes dos dados)
+        # Benchmarks de concorrência
+        self.concurrency_mode = ""  # Modo de concorrência ("thread" ou "process")
+        self.workers = 1            # Número de workers concorrentes
+        self.throughput_ops = None  # Vazão agregada em operações por segundo (todos os workers)
+        self.net_time_ms = None     # Tempo por operação descontada a sobrecarga do harness
+        # Energia RAPL (None quando indisponível ou desativada)
+        self.energy_joules = None   # Energia dos pacotes de CPU durante a medição
+        self.core_energy_joules = None  # Energia dos núcleos durante a medição
+        self.joules_per_op = None   # Energia por operação
+        self.joules_per_mb = None   # Energia por MB processado (operações dependentes dos dados)
+        self.latency_histogram = None  # LatencyHistogram das latências por iteração/requisição
+        
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return (f"BenchmarkResult({self.algorithm!r}, {self.key_size}, {self.operation_type!r}, "
+                f"{self.execution_time_ms:.4f} ms)")
+
+    def to_dict(self):
+        """Converte o resultado em um dicionário serializável em JSON (esquema versionado)"""
+        data = {"schema_version": RESULT_SCHEMA_VERSION}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if name == "timestamp" and value is not None:
+                value = value.isoformat()
+            elif name == "samples_ns":
+                value = list(value)
+            elif name == "latency_histogram" and value is not None:
+                value = value.to_dict()
+            data[name] = value
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstrói um resultado a partir de to_dict; campos desconhecidos são ignorados"""
+        schema_version = data.get("schema_version", RESULT_SCHEMA_VERSION)
+        if schema_version > RESULT_SCHEMA_VERSION:
+            raise ValueError(f"Esquema de resultado {schema_version} mais novo que o suportado "
+                             f"({RESULT_SCHEMA_VERSION})")
+        fields = {name: data[name] for name in cls.__slots__ if name in data}
+        if fields.get("timestamp"):
+            fields["timestamp"] = datetime.datetime.fromisoformat(fields["timestamp"])
+        if "samples_ns" in fields:
+            fields["samples_ns"] = new_sample_array(fields["samples_ns"])
+        if fields.get("latency_histogram"):
+            fields["latency_histogram"] = LatencyHistogram.from_dict(fields["latency_histogram"])
+        return cls(**fields)
+
+    def sample_statistics(self):
+        """Estatísticas resumidas das amostras por iteração (ver summarize_samples)"""
+        return summarize_samples(self.samples_ns)
+
+# ==== Saída de mensagens e resultados ====
+
+class ConsoleReporter:
+    """Exibe mensagens e resultados no terminal (comportamento padrão da ferramenta)"""
+    def message(self, *args, **kwargs):
+        print(*args, **kwargs)
+
+    def result(self, result):
+        """Exibe os resultados do benchmark"""
+        print(f"\nResultado do Benchmark:")
+        print(f"Algoritmo: {result.algorithm}")
+        print(f"Tamanho da Chave: {result.key_size} bits")
+        print(f"Operação: {result.operation_type}")
+        print(f"Tamanho dos Dados: {result.data_size_bytes / (1024.0 * 1024.0):.4f} MB")
+        print(f"Tempo de Execução: {result.execution_time_ms:.4f} ms")
+        if result.net_time_ms is not None:
+            print(f"Tempo Líquido (sem sobrecarga do harness): {result.net_time_ms:.4f} ms")
+        print(f"Uso de Memória: {result.memory_usage_mb:.4f} MB")
+        print(f"Uso de CPU: {result.cpu_percentage:.4f}%")
+        if result.joules_per_op is not None:
+            print(f"Energia: {result.joules_per_op * 1000:.4f} mJ/op" +
+                  (f" | {result.joules_per_mb:.4f} J/MB" if result.joules_per_mb is not None else "") +
+                  f" (total {result.energy_joules:.3f} J)")
+        if result.iterations > 1:
+            print(f"Iterações: {result.iterations}")
+        if result.throughput_ops is not None:
+            print(f"Vazão: {result.throughput_ops:.1f} ops/s ({result.workers} {result.concurrency_mode})")
+        if result.latency_histogram is not None and result.latency_histogram.total_count > 1:
+            tail = result.latency_histogram.summary()
+            print(f"Cauda (ms): p50 {tail['p50_ms']:.4f} | p90 {tail['p90_ms']:.4f} | p99 {tail['p99_ms']:.4f} | "
+                  f"p99.9 {tail['p999_ms']:.4f} | máx {tail['max_ms']:.4f}")
+        if result.cycles_per_op is not None:
+            print(f"Ciclos/op: {result.cycles_per_op:.0f}" +
+                  (f" | IPC: {result.ipc:.3f}" if result.ipc is not None else "") +
+                  (f" | Ciclos/byte: {result.cycles_per_byte:.4f}" if result.cycles_per_byte is not None else ""))
+        if result.notes:
+            print(f"Observações: {result.notes}")
+
+    # Ganchos de progresso (sem efeito no console simples; usados por LiveDashboard)
+    def plan(self, total_units):
+        """Informa quantas unidades de benchmark a execução atual pretende rodar"""
+
+    def unit_finished(self, label):
+        """Informa que uma unidade (ou suíte) do plano foi concluída"""
+
+    def operation_started(self, result, samples_ns, iterations, pid=None):
+        """Informa o início de uma medição; `samples_ns` é preenchido durante a execução"""
+
+    def operation_finished(self, result):
+        """Informa o fim da medição iniciada em operation_started"""
+
+    def close(self):
+        """Libera os recursos do reporter ao final da execução"""
+
+class NullReporter(ConsoleReporter):
+    """Descarta toda a saída (uso como biblioteca, health checks, harnesses de carga)"""
+    def message(self, *args, **kwargs):
+        pass
+
+    def result(self, result):
+        pass
+
+class LiveDashboard(ConsoleReporter):
+    """
+    Painel no terminal atualizado no lugar (códigos ANSI) por uma thread própria:
+    operação atual, iterações concluídas, mediana/p99 das últimas amostras, sparkline
+    de ops/s, CPU e RSS do processo medido e estimativa de término do plano.
+
+    A thread medida apenas acrescenta amostras ao array, como sem o painel; a leitura
+    (uma cópia das últimas WINDOW amostras) ocorre na thread do painel a cada REFRESH_SECONDS.
+    Mensagens e resultados são impressos acima do painel, que é redesenhado em seguida.
+    """
+    REFRESH_SECONDS = 0.5
+    WINDOW = 4096           # Amostras mais recentes usadas na mediana/p99 correntes
+    SPARKLINE_WIDTH = 40    # Pontos de ops/s mantidos na sparkline
+    SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.lock = threading.Lock()
+        self.drawn_lines = 0
+        self.total_units = None
+        self.units_done = 0
+        self.plan_start = None
+        self.unit_start = None
+        self.current = None     # (result, samples_ns, iterations, pid, início)
+        self.rates = []
+        self.last_count = 0
+        self.last_tick = None
+        self.processes = {}
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    @staticmethod
+    def is_supported(stream=None):
+        """O painel exige um terminal (TTY) que interprete códigos ANSI"""
+        stream = stream or sys.stdout
+        return hasattr(stream, "isatty") and stream.isatty() and os.environ.get("TERM") != "dumb"
+
+    def message(self, *args, **kwargs):
+        with self.lock:
+            self._clear()
+            print(*args, file=self.stream, **kwargs)
+            self._draw()
+
+    def result(self, result):
+        with self.lock:
+            self._clear()
+            super().result(result)
+            self._draw()
+
+    def plan(self, total_units):
+        self.total_units = total_units
+        self.units_done = 0
+        self.plan_start = self.unit_start = time.perf_counter()
+
+    def unit_finished(self, label):
+        self.units_done += 1
+        self.unit_start = time.perf_counter()
+
+    def operation_started(self, result, samples_ns, iterations, pid=None):
+        self.current = (result, samples_ns, iterations, pid, time.perf_counter())
+        self.rates = []
+        self.last_count = 0
+        self.last_tick = time.perf_counter()
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._refresh_loop, daemon=True)
+            self.thread.start()
+
+    def operation_finished(self, result):
+        self.current = None
+
+    def close(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+        with self.lock:
+            self._clear()
+
+    def _refresh_loop(self):
+        while not self.stop_event.wait(self.REFRESH_SECONDS):
+            with self.lock:
+                self._clear()
+                self._draw()
+
+    def _clear(self):
+        """Apaga o painel desenhado anteriormente (sobe o cursor e limpa até o fim da tela)"""
+        if self.drawn_lines:
+            self.stream.write(f"\x1b[{self.drawn_lines}F\x1b[J")
+            self.drawn_lines = 0
+
+    def _draw(self):
+        lines = self._render()
+        if lines:
+            self.stream.write("\n".join(lines) + "\n")
+            self.drawn_lines = len(lines)
+        self.stream.flush()
+
+    def _process_usage(self, pid):
+        """CPU (%) desde a última leitura (None na primeira) e RSS (MB) do processo medido"""
+        pid = pid or os.getpid()
+        try:
+            process = self.processes.get(pid)
+            if process is None:
+                process = self.processes[pid] = psutil.Process(pid)
+                process.cpu_percent(None)
+                return None, process.memory_info().rss / (1024.0 * 1024.0)
+            return process.cpu_percent(None), process.memory_info().rss / (1024.0 * 1024.0)
+        except psutil.Error:
+            return None, None
+
+    def _sparkline(self):
+        if not self.rates:
+            return ""
+        low, high = min(self.rates), max(self.rates)
+        scale = (len(self.SPARK_CHARS) - 1) / (high - low) if high > low else 0
+        return "".join(self.SPARK_CHARS[int((rate - low) * scale)] for rate in self.rates)
+
+    def _render(self):
+        current = self.current
+        now = time.perf_counter()
+        lines = ["─" * 60]
+        op_remaining = None
+        if current is not None:
+            result, samples_ns, iterations, pid, started = current
+            count = len(samples_ns)
+            if self.last_tick is not None and now > self.last_tick:
+                self.rates.append((count - self.last_count) / (now - self.last_tick))
+                self.rates = self.rates[-self.SPARKLINE_WIDTH:]
+            self.last_count, self.last_tick = count, now
+            
+            stats = summarize_samples(samples_ns[-self.WINDOW:])
+            if count:
+                op_remaining = (iterations - count) * stats["mean_ms"] / 1000.0
+            cpu, rss = self._process_usage(pid)
+            lines.append(f"▶ {result.algorithm} {result.key_size or ''} {result.operation_type}".rstrip())
+            lines.append(f"  Iterações: {count}/{iterations}  |  Mediana: {stats['median_ms']:.4f} ms  |  "
+                         f"p99: {stats['p99_ms']:.4f} ms  |  {now - started:.1f} s")
+            lines.append(f"  ops/s: {self.rates[-1] if self.rates else 0:>10.1f}  {self._sparkline()}")
+            cpu_text = f"{cpu:.0f}%" if cpu is not None else "—"
+            rss_text = f"{rss:.1f} MB" if rss is not None else "—"
+            lines.append(f"  CPU: {cpu_text}  |  RSS: {rss_text}")
+        
+        if self.total_units and (current is not None or self.units_done < self.total_units):
+            eta = None
+            if self.units_done:
+                average_unit = (self.unit_start - self.plan_start) / self.units_done
+                eta = max(0.0, average_unit * (self.total_units - self.units_done) - (now - self.unit_start))
+            if op_remaining is not None:
+                eta = max(eta or 0.0, op_remaining)
+            eta_text = f"{eta:.0f} s" if eta is not None else "estimando..."
+            lines.append(f"  Plano: {self.units_done}/{self.total_units} unidades  |  "
+                         f"Decorrido: {now - self.plan_start:.0f} s  |  ETA: {eta_text}")
+        elif op_remaining is not None:
+            lines.append(f"  ETA da operação: {op_remaining:.1f} s")
+        return lines if len(lines) > 1 else []
 
 class CryptoBenchmark:
     """
@@ -71,227 +2155,661 @@ class CryptoBenchmark:
     # Tamanho padrão dos dados para teste
     TEST_DATA_SIZE_MB = 1
     
+    # Execução supervisionada: em "auto", operações RSA a partir deste tamanho de chave
+    # (e toda geração de chaves RSA) rodam em um processo filho encerrado no tempo limite
+    SUPERVISE_MIN_RSA_BITS = 4096
+    
+    # Calibração do harness: iterações da operação vazia e múltiplo do piso de ruído
+    # abaixo do qual um resultado é sinalizado como não confiável
+    CALIBRATION_ITERATIONS = 20000
+    NOISE_FLOOR_MULTIPLE = 5
+    
+    # Versão do formato do manifesto de execução (--manifest / --replay)
+    MANIFEST_SCHEMA_VERSION = 1
+    
+    # Parâmetros padrão da verificação de regressão de desempenho
+    BASELINE_SCHEMA_VERSION = 1
+    REGRESSION_REPETITIONS = 5      # Repetições do benchmark completo por execução
+    REGRESSION_THRESHOLD_PCT = 10.0 # Aumento mínimo (%) da mediana para considerar regressão
+    REGRESSION_NOISE_FACTOR = 3.0   # Múltiplos do ruído relativo (MAD) tolerados
+    REGRESSION_ALPHA = 0.05         # Nível de significância do teste de Mann-Whitney
+    
+    # Parâmetros do protocolo intercalado de redução de ruído
+    INTERLEAVED_ROUNDS = 5          # Rodadas do benchmark intercalado
+    OUTLIER_Z_THRESHOLD = 3.5       # Limiar do z-score modificado (MAD) para outliers
+    DRIFT_WARNING_PCT = 2.0         # Deriva (% por rodada) a partir da qual é emitido aviso
+    IDLE_CPU_THRESHOLD_PCT = 10.0   # Uso de CPU do sistema considerado ocioso
+    IDLE_TIMEOUT_SECONDS = 30       # Tempo máximo de espera pelo sistema ocioso
+    
+    # Curvas NIST e tamanhos de chave RSA testados
+    NIST_CURVE_NAMES = {
+        "NIST_P256": "SECP256R1",  # P-256
+        "NIST_P384": "SECP384R1",  # P-384
+        "NIST_P521": "SECP521R1"   # P-521
+    }
+    RSA_KEY_SIZES = [1024, 2048, 4096]
+    
+    # Duração alvo (s) de cada medição de escalonamento com 1 worker
+    SCALING_TARGET_SECONDS = 0.5
+    
+    # Handshakes TLS em loopback: (algoritmo, tamanho da chave) e duração de cada medição
+    TLS_KEY_TYPES = [("RSA", 2048), ("RSA", 4096), ("NIST_P256", 256), ("NIST_P384", 384), ("Ed25519", 256),
+                     ("Ed448", 448)]
+    TLS_MEASURE_SECONDS = 2.0
+    
+    # Certificados X.509: tipos de chave e iterações mínimas por operação
+    X509_KEY_TYPES = [("RSA", 2048), ("RSA", 4096), ("NIST_P256", 256), ("NIST_P384", 384),
+                      ("NIST_P521", 521), ("Ed25519", 256), ("Ed448", 448)]
+    X509_ITERATIONS = 50
+    
+    # Pós-quântico: iterações mínimas por operação
+    PQC_ITERATIONS = 100
+    
+    # KDFs: tempo alvo por configuração para calibrar as iterações
+    KDF_TARGET_SECONDS = 1
+    # Configurações com memória de trabalho acima disso (MB) só rodam com opção explícita
+    # (kdf_large_memory / --kdf-large-memory), mesmo com memória livre: em hosts
+    # compartilhados, alocar GBs pode empurrar outros processos para o swap
+    KDF_MEMORY_CAP_MB = 256
+    
+    # Tokens JWT/JWS: iterações mínimas por operação
+    JWT_ITERATIONS = 200
+    
+    # Simulação de serviço asyncio (carga em malha aberta)
+    ASYNC_LOAD_OPERATIONS = ["Ed25519 Verification", "X25519 Key Exchange"]
+    ASYNC_SLO_P99_MS = 50.0         # SLO de latência p99 ponta a ponta
+    ASYNC_STEP_SECONDS = 3.0        # Duração de cada patamar de carga
+    ASYNC_SEARCH_REFINEMENTS = 3    # Passos de bisseção na busca da vazão máxima
+    
     def run_complete_benchmark(self):
         """Executa benchmarks completos de todos os algoritmos configurados"""
-        print("\n===== Executando Benchmark Completo =====")
-        print("Executando benchmark para todos os algoritmos disponíveis")
+        self._print("\n===== Executando Benchmark Completo =====")
+        self._print("Executando benchmark para todos os algoritmos disponíveis")
+        self.reporter.plan(len(self.get_benchmark_units()))
         
         # Executa benchmark para cada grupo de algoritmos
         self.run_curve25519_benchmark()    # Ed25519/X25519
+        self.run_curve448_benchmark(compare=False)  # Ed448/X448
         self.run_nist_curves_benchmark()   # NIST P-256/P-384/P-521
         self.run_rsa_benchmark()           # RSA
         
-        print("\n===== Benchmark Completo Finalizado =====")
-        print(f"Total de resultados: {len(self.results)}")
-        print("Você pode exportar os resultados para CSV usando a opção 5 no menu.")
+        self._print("\n===== Benchmark Completo Finalizado =====")
+        self._print(f"Total de resultados: {len(self.results)}")
+        self._print("Você pode exportar os resultados para CSV usando a opção 5 no menu.")
     
     def run_curve25519_benchmark(self):
         """
         Executa o benchmark de Ed25519 (para assinatura digital) e 
         X25519 (para troca de chaves Diffie-Hellman)
         """
-        print("\n===== Benchmark de Ed25519/X25519 (Curve25519) =====")
-        print("Estabilizando o sistema antes do benchmark...")
+        self._print("\n===== Benchmark de Ed25519/X25519 (Curve25519) =====")
+        self.stabilize_system()
         self.limit_cpu_cores()
         
         results_count_before = len(self.results)
         
         # Benchmark de Ed25519 (assinatura digital)
-        print("\nTestando Ed25519 (assinatura digital)...")
-        try:
-            # Verifica disponibilidade
-            if "Ed25519" not in AVAILABLE_ALGORITHMS:
-                print("⚠️ AVISO: Ed25519 não está disponível no sistema.")
-            else:
-                # Benchmark de geração de chaves
-                result_keygen = self.benchmark_ed25519_keygen()
-                self.results.append(result_keygen)
-                self.display_result(result_keygen)
-                
-                # Benchmark de assinatura
-                result_sign = self.benchmark_ed25519_sign(self.test_data)
-                self.results.append(result_sign)
-                self.display_result(result_sign)
-                
-                # Benchmark de verificação
-                if not self.timeout_occurred:
-                    result_verify = self.benchmark_ed25519_verify(self.test_data)
-                    self.results.append(result_verify)
-                    self.display_result(result_verify)
-        except Exception as ex:
-            print(f"Erro durante benchmark de Ed25519: {str(ex)}")
+        self._print("\nTestando Ed25519 (assinatura digital)...")
+        self.run_benchmark_unit("Ed25519", "Ed25519", self.iter_ed25519_benchmarks)
         
         # Benchmark de X25519 (troca de chaves)
-        print("\nTestando X25519 (troca de chaves)...")
-        try:
-            # Verifica disponibilidade
-            if "X25519" not in AVAILABLE_ALGORITHMS:
-                print("⚠️ AVISO: X25519 não está disponível no sistema.")
-            else:
-                # Benchmark de geração de chaves
-                result_keygen = self.benchmark_x25519_keygen()
-                self.results.append(result_keygen)
-                self.display_result(result_keygen)
-                
-                # Benchmark de troca de chaves
-                result_key_exchange = self.benchmark_x25519_key_exchange()
-                self.results.append(result_key_exchange)
-                self.display_result(result_key_exchange)
-        except Exception as ex:
-            print(f"Erro durante benchmark de X25519: {str(ex)}")
+        self._print("\nTestando X25519 (troca de chaves)...")
+        self.run_benchmark_unit("X25519", "X25519", self.iter_x25519_benchmarks)
             
         results_count_after = len(self.results)
-        print(f"\nTotal de resultados da Curve25519 adicionados: {results_count_after - results_count_before}")
+        self._print(f"\nTotal de resultados da Curve25519 adicionados: {results_count_after - results_count_before}")
+
+    def run_curve448_benchmark(self, compare=True):
+        """
+        Executa o benchmark de Ed448 (assinatura digital) e X448 (troca de chaves),
+        e compara o custo da margem de segurança extra com Curve25519 e P-521
+        """
+        self._print("\n===== Benchmark de Ed448/X448 (Curve448) =====")
+        self.stabilize_system()
+        self.limit_cpu_cores()
+        
+        results_count_before = len(self.results)
+        
+        # Benchmark de Ed448 (assinatura digital)
+        self._print("\nTestando Ed448 (assinatura digital)...")
+        self.run_benchmark_unit("Ed448", "Ed448", self.iter_ed448_benchmarks)
+        
+        # Benchmark de X448 (troca de chaves)
+        self._print("\nTestando X448 (troca de chaves)...")
+        self.run_benchmark_unit("X448", "X448", self.iter_x448_benchmarks)
+        
+        results_count_after = len(self.results)
+        self._print(f"\nTotal de resultados da Curve448 adicionados: {results_count_after - results_count_before}")
+        
+        if compare:
+            # Executa as referências ainda não medidas nesta sessão
+            measured = {result.algorithm for result in self.results}
+            references = [unit for unit in self.get_benchmark_units()
+                          if unit[0] in ("Ed25519", "X25519", "NIST_P521")
+                          and not ({unit[0], f"{unit[0]}_ECDH"} & measured)]
+            for name, availability_key, unit in references:
+                self._print(f"\nTestando {name} (referência para comparação)...")
+                self.run_benchmark_unit(availability_key, name, unit)
+            self.print_curve_comparison()
+
+    def build_curve_comparison(self):
+        """
+        Monta a comparação de tempos da Curve448 com Curve25519 e P-521 a partir dos
+        resultados medidos: lista de (operação, algoritmo, ms, ms Curve25519, ms P-521)
+        """
+        times = {}
+        for result in self.results:
+            if not result.concurrency_mode and not result.notes:
+                times[(result.algorithm, result.operation_type)] = result.execution_time_ms
+        
+        rows = []
+        comparisons = [
+            ("Ed448", "Ed25519", "NIST_P521", ("Key Generation", "Signing", "Verification")),
+            ("X448", "X25519", "NIST_P521_ECDH", ("Key Generation", "Key Exchange"))
+        ]
+        for algorithm, curve25519_name, p521_name, operations in comparisons:
+            for operation_type in operations:
+                curve448_ms = times.get((algorithm, operation_type))
+                if curve448_ms is None:
+                    continue
+                p521_ms = times.get((p521_name, operation_type))
+                if p521_ms is None and operation_type == "Key Generation":
+                    # A geração de chaves P-521 é medida no grupo ECDSA
+                    p521_ms = times.get(("NIST_P521", operation_type))
+                rows.append((operation_type, algorithm, curve448_ms,
+                             times.get((curve25519_name, operation_type)), p521_ms))
+        return rows
+
+    def print_curve_comparison(self):
+        """Exibe o custo relativo da Curve448 frente a Curve25519 e P-521"""
+        rows = self.build_curve_comparison()
+        if not rows:
+            return
+        
+        def ratio(value, reference):
+            return f"{value / reference:.2f}x" if reference else "-"
+        
+        header = (f"{'Algoritmo':<8} {'Operação':<16} {'Curve448 (ms)':>14} {'Curve25519 (ms)':>16} "
+                  f"{'448/25519':>10} {'P-521 (ms)':>11} {'448/P-521':>10}")
+        self._print("\n===== Comparação: Curve448 vs Curve25519 vs P-521 =====")
+        self._print(header)
+        self._print("-" * len(header))
+        for operation_type, algorithm, curve448_ms, curve25519_ms, p521_ms in rows:
+            curve25519_text = f"{curve25519_ms:>16.4f}" if curve25519_ms is not None else f"{'-':>16}"
+            p521_text = f"{p521_ms:>11.4f}" if p521_ms is not None else f"{'-':>11}"
+            self._print(f"{algorithm:<8} {operation_type:<16} {curve448_ms:>14.4f} {curve25519_text} "
+                  f"{ratio(curve448_ms, curve25519_ms):>10} {p521_text} {ratio(curve448_ms, p521_ms):>10}")
 
     def run_nist_curves_benchmark(self):
         """
         Executa benchmark das curvas NIST (P-256, P-384, P-521) para ECDSA
         (assinatura digital) e ECDH (troca de chaves)
         """
-        print("\n===== Benchmark de Curvas NIST (P-256/P-384/P-521) =====")
-        print("Estabilizando o sistema antes do benchmark...")
+        self._print("\n===== Benchmark de Curvas NIST (P-256/P-384/P-521) =====")
+        self.stabilize_system()
         self.limit_cpu_cores()
         
-        # Lista de curvas NIST a serem testadas
-        nist_curves = {
-            "NIST_P256": ec.SECP256R1(),  # P-256
-            "NIST_P384": ec.SECP384R1(),  # P-384
-            "NIST_P521": ec.SECP521R1()   # P-521
-        }
-        
         results_count_before = len(self.results)
         
-        for curve_name, curve in nist_curves.items():
-            print(f"\nTestando {curve_name}...")
-            
-            try:
-                # Verificar se a curva está disponível
-                if curve_name not in AVAILABLE_ALGORITHMS:
-                    print(f"⚠️ AVISO: {curve_name} não está disponível no sistema.")
-                    continue
-                
-                # Benchmark de geração de chaves
-                result_keygen = self.benchmark_ecdsa_keygen(curve_name, curve)
-                self.results.append(result_keygen)
-                self.display_result(result_keygen)
-                
-                # Benchmark de assinatura ECDSA
-                result_sign = self.benchmark_ecdsa_sign(curve_name, curve, self.test_data)
-                self.results.append(result_sign)
-                self.display_result(result_sign)
-                
-                # Benchmark de verificação ECDSA
-                if not self.timeout_occurred:
-                    result_verify = self.benchmark_ecdsa_verify(curve_name, curve, self.test_data)
-                    self.results.append(result_verify)
-                    self.display_result(result_verify)
-                    
-                # Benchmark de troca de chaves ECDH
-                result_ecdh = self.benchmark_ecdh_key_exchange(curve_name, curve)
-                self.results.append(result_ecdh)
-                self.display_result(result_ecdh)
-                
-            except Exception as ex:
-                print(f"Erro durante benchmark de {curve_name}: {str(ex)}")
+        for curve_name, curve in self.get_nist_curves().items():
+            self._print(f"\nTestando {curve_name}...")
+            self.run_benchmark_unit(curve_name, curve_name,
+                                    lambda: self.iter_nist_curve_benchmarks(curve_name, curve))
         
         results_count_after = len(self.results)
-        print(f"\nTotal de resultados de curvas NIST adicionados: {results_count_after - results_count_before}")
+        self._print(f"\nTotal de resultados de curvas NIST adicionados: {results_count_after - results_count_before}")
 
     def run_rsa_benchmark(self):
         """
         Executa o benchmark de RSA com diferentes tamanhos de chave
         (1024, 2048, 4096 bits)
         """
-        print("\n===== Benchmark de RSA =====")
-        print("Estabilizando o sistema antes do benchmark...")
+        self._print("\n===== Benchmark de RSA =====")
+        self.stabilize_system()
         self.limit_cpu_cores()
         
-        # Diferentes tamanhos de chave para RSA
-        key_sizes = [1024, 2048, 4096]
-        
         results_count_before = len(self.results)
         
-        for key_size in key_sizes:
-            print(f"\nTestando RSA com chave de {key_size} bits...")
-            
-            try:
-                # Verificar se RSA está disponível
-                if "RSA" not in AVAILABLE_ALGORITHMS:
-                    print("⚠️ AVISO: RSA não está disponível no sistema.")
-                    break
-                
-                # Benchmark de geração de chaves RSA
-                result_keygen = self.benchmark_rsa_keygen(key_size)
-                self.results.append(result_keygen)
-                self.display_result(result_keygen)
-                
-                # Prepara dados para assinatura (hash dos dados originais)
-                digest = hashes.Hash(hashes.SHA256())
-                digest.update(self.test_data)
-                message_digest = digest.finalize()
-                
-                # Benchmark de assinatura RSA
-                result_sign = self.benchmark_rsa_sign(key_size, message_digest)
-                self.results.append(result_sign)
-                self.display_result(result_sign)
-                
-                # Benchmark de verificação RSA
-                if not self.timeout_occurred:
-                    result_verify = self.benchmark_rsa_verify(key_size, message_digest)
-                    self.results.append(result_verify)
-                    self.display_result(result_verify)
-                    
-                # Benchmark de operação criptográfica RSA (criptografar/descriptografar)
-                # Para RSA, usamos um conjunto de dados menor devido às limitações
-                max_data_size = key_size // 8 - 42  # Fórmula aproximada para OAEP
-                max_data_size = max(1, max_data_size)  # Garantir pelo menos 1 byte
-                test_data = os.urandom(max_data_size)
-                
-                # Benchmark de criptografia/descriptografia RSA
-                result_crypt = self.benchmark_rsa_encryption("RSA", key_size, test_data)
-                self.results.append(result_crypt)
-                self.display_result(result_crypt)
-                    
-            except Exception as ex:
-                print(f"Erro durante benchmark de RSA: {str(ex)}")
+        # Verificar se RSA está disponível
+        if "RSA" not in AVAILABLE_ALGORITHMS:
+            self._print("⚠️ AVISO: RSA não está disponível no sistema.")
+        else:
+            for key_size in self.RSA_KEY_SIZES:
+                self._print(f"\nTestando RSA com chave de {key_size} bits...")
+                self.run_benchmark_unit("RSA", "RSA",
+                                        lambda: self.iter_rsa_benchmarks(key_size))
         
         results_count_after = len(self.results)
-        print(f"\nTotal de resultados do RSA adicionados: {results_count_after - results_count_before}")
+        self._print(f"\nTotal de resultados do RSA adicionados: {results_count_after - results_count_before}")
+
+    def get_nist_curves(self):
+        """Retorna as curvas NIST (instanciadas sob demanda) por nome"""
+        return {name: getattr(ec, curve_class)() for name, curve_class in self.NIST_CURVE_NAMES.items()}
+
+    def run_benchmark_unit(self, availability_key, label, unit):
+        """
+        Executa uma unidade de benchmark (gerador de resultados), registrando e
+        exibindo cada resultado. Resultados parciais são mantidos em caso de erro.
+        """
+        if availability_key not in AVAILABLE_ALGORITHMS:
+            self._print(f"⚠️ AVISO: {label} não está disponível no sistema.")
+            return []
         
-    def __init__(self):
+        unit_results = []
+        try:
+            for result in unit():
+                self.add_result(result)
+                self.display_result(result)
+                unit_results.append(result)
+        except Exception as ex:
+            self._print(f"Erro durante benchmark de {label}: {str(ex)}")
+        self.reporter.unit_finished(label)
+        return unit_results
+
+    # ==== Unidades de benchmark (sequências dependentes de operações) ====
+
+    def iter_ed25519_benchmarks(self):
+        """Geração de chaves, assinatura e verificação Ed25519"""
+        yield self.benchmark_ed25519_keygen()
+        yield self.benchmark_ed25519_sign(self.test_data)
+        if not self.timeout_occurred:
+            yield self.benchmark_ed25519_verify(self.test_data)
+
+    def iter_x25519_benchmarks(self):
+        """Geração de chaves e troca de chaves X25519"""
+        yield self.benchmark_x25519_keygen()
+        yield self.benchmark_x25519_key_exchange()
+
+    def iter_ed448_benchmarks(self):
+        """Geração de chaves, assinatura e verificação Ed448"""
+        yield self.benchmark_ed448_keygen()
+        yield self.benchmark_ed448_sign(self.test_data)
+        if not self.timeout_occurred:
+            yield self.benchmark_ed448_verify(self.test_data)
+
+    def iter_x448_benchmarks(self):
+        """Geração de chaves e troca de chaves X448"""
+        yield self.benchmark_x448_keygen()
+        yield self.benchmark_x448_key_exchange()
+
+    def iter_nist_curve_benchmarks(self, curve_name, curve):
+        """Geração de chaves, assinatura/verificação ECDSA e troca de chaves ECDH em uma curva NIST"""
+        yield self.benchmark_ecdsa_keygen(curve_name, curve)
+        yield self.benchmark_ecdsa_sign(curve_name, curve, self.test_data)
+        if not self.timeout_occurred:
+            yield self.benchmark_ecdsa_verify(curve_name, curve, self.test_data)
+        yield self.benchmark_ecdh_key_exchange(curve_name, curve)
+
+    def iter_rsa_benchmarks(self, key_size):
+        """Geração de chaves, assinatura/verificação e criptografia RSA para um tamanho de chave"""
+        yield self.benchmark_rsa_keygen(key_size)
+        if self.timeout_occurred:
+            # Sem chave gerada, as operações seguintes teriam de gerá-la fora da supervisão
+            return
+        
+        # Prepara dados para assinatura (hash dos dados originais)
+        digest = hashes.Hash(hashes.SHA256())
+        digest.update(self.test_data)
+        message_digest = digest.finalize()
+        
+        yield self.benchmark_rsa_sign(key_size, message_digest)
+        if not self.timeout_occurred:
+            yield self.benchmark_rsa_verify(key_size, message_digest)
+        
+        # Para RSA, usamos um conjunto de dados menor devido às limitações
+        max_data_size = key_size // 8 - 66  # Limite do OAEP com SHA-256: k - 2*hLen - 2
+        max_data_size = max(1, max_data_size)  # Garantir pelo menos 1 byte
+        # RSA encrypt() exige bytes (não aceita bytearray); a mensagem OAEP é pequena
+        test_data = bytes(generate_seeded_bytes(self.data_seed, max_data_size, f"rsa-oaep-{key_size}".encode()))
+        yield self.benchmark_rsa_encryption("RSA", key_size, test_data)
+
+    def get_benchmark_units(self):
+        """
+        Retorna as unidades de benchmark disponíveis como tuplas
+        (nome, chave de disponibilidade, gerador de resultados)
+        """
+        units = [
+            ("Ed25519", "Ed25519", self.iter_ed25519_benchmarks),
+            ("X25519", "X25519", self.iter_x25519_benchmarks),
+            ("Ed448", "Ed448", self.iter_ed448_benchmarks),
+            ("X448", "X448", self.iter_x448_benchmarks)
+        ]
+        for curve_name, curve in self.get_nist_curves().items():
+            units.append((curve_name, curve_name,
+                          lambda curve_name=curve_name, curve=curve: self.iter_nist_curve_benchmarks(curve_name, curve)))
+        for key_size in self.RSA_KEY_SIZES:
+            units.append((f"RSA-{key_size}", "RSA",
+                          lambda key_size=key_size: self.iter_rsa_benchmarks(key_size)))
+        return [unit for unit in units if unit[1] in AVAILABLE_ALGORITHMS]
+
+    # ==== API de biblioteca: execução de uma seleção ====
+
+    def get_selection_suites(self):
+        """Suítes que podem ser selecionadas em run_selection, além das unidades de benchmark"""
+        return {
+            "curve448": self.run_curve448_benchmark,
+            "thread-scaling": self.run_thread_scaling_benchmark,
+            "tls": self.run_tls_handshake_benchmark,
+            "x509": self.run_x509_benchmark,
+            "jwt": self.run_jwt_benchmark,
+            "kdf": self.run_kdf_benchmark,
+            "pqc": self.run_pqc_benchmark
+        }
+
+    def run_selection(self, selection=None):
+        """
+        Executa uma seleção de unidades (ex.: "Ed25519", "NIST_P256", "RSA-2048") e/ou
+        suítes (ex.: "jwt", "kdf") e retorna a lista de BenchmarkResult produzidos.
+        Sem seleção, executa todas as unidades disponíveis.
+        """
+        units = {name: (availability_key, unit) for name, availability_key, unit in self.get_benchmark_units()}
+        suites = self.get_selection_suites()
+        selection = list(units) if selection is None else list(selection)
+        unknown = [name for name in selection if name not in units and name not in suites]
+        if unknown:
+            raise ValueError(f"Seleção desconhecida ou indisponível: {', '.join(unknown)} "
+                             f"(opções: {', '.join(list(units) + list(suites))})")
+        
+        results_count_before = len(self.results)
+        self.stabilize_system()
+        self.limit_cpu_cores()
+        self.reporter.plan(len(selection))
+        for name in selection:
+            if name in units:
+                availability_key, unit = units[name]
+                self._print(f"\nTestando {name}...")
+                self.run_benchmark_unit(availability_key, name, unit)
+            else:
+                suites[name]()
+                self.reporter.unit_finished(name)
+        return self.results[results_count_before:]
+
+    # ==== Protocolo intercalado com redução de ruído ====
+
+    def stabilize_system(self):
+        """Aguarda o sistema ficar ocioso antes de um benchmark, se configurado"""
+        if self.wait_for_idle:
+            self.wait_for_system_idle()
+        else:
+            self._print("Estabilizando o sistema antes do benchmark...")
+
+    def wait_for_system_idle(self, threshold_pct=None, timeout_seconds=None, stable_samples=3):
+        """
+        Aguarda até que o uso de CPU do sistema fique abaixo do limiar por
+        várias amostras consecutivas e então atualiza a linha de base.
+        Retorna True se o sistema ficou ocioso antes do tempo limite.
+        """
+        threshold_pct = self.IDLE_CPU_THRESHOLD_PCT if threshold_pct is None else threshold_pct
+        timeout_seconds = self.IDLE_TIMEOUT_SECONDS if timeout_seconds is None else timeout_seconds
+        
+        self._print(f"Aguardando sistema ocioso (CPU < {threshold_pct:.1f}%, até {timeout_seconds}s)...")
+        deadline = time.time() + timeout_seconds
+        consecutive = 0
+        cpu_usage = None
+        while time.time() < deadline:
+            cpu_usage = psutil.cpu_percent(interval=0.5)
+            consecutive = consecutive + 1 if cpu_usage < threshold_pct else 0
+            if consecutive >= stable_samples:
+                break
+        
+        idle = consecutive >= stable_samples
+        if not idle:
+            self._print(f"⚠️ AVISO: sistema não ficou ocioso (última medição: {cpu_usage}%); prosseguindo")
+        self.update_system_baseline()
+        return idle
+
+    def run_interleaved_benchmark(self, rounds=None, seed=None):
+        """
+        Executa todas as unidades de benchmark em rodadas, em ordem aleatória a cada
+        rodada, para que a deriva lenta (aquecimento, carga de fundo) não favoreça
+        sistematicamente nenhum algoritmo. Ao final, marca outliers (MAD) e
+        relata a deriva entre rodadas.
+        """
+        rounds = rounds or self.INTERLEAVED_ROUNDS
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        rng = random.Random(seed)
+        
+        self._print("\n===== Benchmark Intercalado (ordem aleatória) =====")
+        self._print(f"Rodadas: {rounds} | Semente da ordem: {seed}")
+        self.limit_cpu_cores()
+        
+        units = self.get_benchmark_units()
+        round_results = []  # Lista de (rodada, resultado)
+        self.reporter.plan(rounds * len(units))
+        
+        for round_index in range(rounds):
+            order = list(units)
+            rng.shuffle(order)
+            self._print(f"\n----- Rodada {round_index + 1}/{rounds}: {', '.join(name for name, _, _ in order)} -----")
+            if self.wait_for_idle:
+                self.wait_for_system_idle()
+            
+            for name, availability_key, unit in order:
+                self._print(f"\nTestando {name}...")
+                for result in self.run_benchmark_unit(availability_key, name, unit):
+                    round_results.append((round_index, result))
+        
+        outliers = self.flag_outliers([result for _, result in round_results])
+        drift = self.compute_round_drift(round_results, rounds)
+        self.print_interleaved_summary(round_results, outliers, drift)
+        return round_results
+
+    def flag_outliers(self, results, threshold=None):
+        """
+        Marca como outliers os resultados cujo z-score modificado (baseado no MAD)
+        excede o limiar dentro do seu grupo (algoritmo, chave, operação).
+        Retorna a lista de resultados marcados.
+        """
+        threshold = self.OUTLIER_Z_THRESHOLD if threshold is None else threshold
+        groups = {}
+        for result in results:
+            groups.setdefault(self.result_key(result), []).append(result)
+        
+        outliers = []
+        for group in groups.values():
+            times = [result.execution_time_ms for result in group]
+            center = median(times)
+            mad = median_absolute_deviation(times)
+            # Com poucas amostras o MAD não é uma estimativa confiável da dispersão
+            if len(group) < 5 or mad == 0:
+                continue
+            for result in group:
+                z_score = 0.6745 * (result.execution_time_ms - center) / mad
+                if abs(z_score) > threshold:
+                    note = f"Outlier (MAD z={z_score:+.1f})"
+                    result.notes = f"{result.notes}; {note}" if result.notes else note
+                    outliers.append(result)
+        return outliers
+
+    def compute_round_drift(self, round_results, rounds):
+        """
+        Calcula a deriva entre rodadas: para cada rodada, a média geométrica dos
+        tempos normalizados pela mediana do respectivo grupo (1.0 = sem deriva).
+        Retorna (lista de fatores por rodada, inclinação em % por rodada).
+        """
+        groups = {}
+        for _, result in round_results:
+            groups.setdefault(self.result_key(result), []).append(result.execution_time_ms)
+        group_medians = {key: median(times) for key, times in groups.items()}
+        
+        per_round = [[] for _ in range(rounds)]
+        for round_index, result in round_results:
+            group_median = group_medians[self.result_key(result)]
+            if group_median > 0 and result.execution_time_ms > 0:
+                per_round[round_index].append(math.log(result.execution_time_ms / group_median))
+        factors = [math.exp(sum(values) / len(values)) if values else 1.0 for values in per_round]
+        
+        # Regressão linear simples dos fatores em função da rodada
+        slope = 0.0
+        if rounds > 1:
+            mean_x = (rounds - 1) / 2.0
+            mean_y = sum(factors) / rounds
+            covariance = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(factors))
+            variance = sum((x - mean_x) ** 2 for x in range(rounds))
+            slope = covariance / variance * 100
+        return factors, slope
+
+    def print_interleaved_summary(self, round_results, outliers, drift):
+        """Exibe o resumo do benchmark intercalado: medianas sem outliers e deriva"""
+        factors, slope = drift
+        outlier_ids = {id(result) for result in outliers}
+        
+        groups = {}
+        for _, result in round_results:
+            groups.setdefault(self.result_key(result), []).append(result)
+        
+        self._print("\n===== Resumo do Benchmark Intercalado =====")
+        header = f"{'Algoritmo':<16} {'Chave':>6} {'Operação':<16} {'Amostras':>8} {'Outliers':>8} {'Mediana (ms)':>13} {'MAD (ms)':>10}"
+        self._print(header)
+        self._print("-" * len(header))
+        for key, group in groups.items():
+            algorithm, key_size, operation = key.split("|")
+            kept = [result.execution_time_ms for result in group if id(result) not in outlier_ids]
+            self._print(f"{algorithm:<16} {key_size:>6} {operation:<16} {len(group):>8} "
+                  f"{len(group) - len(kept):>8} {median(kept):>13.4f} {median_absolute_deviation(kept):>10.4f}")
+        
+        self._print("\nDeriva entre rodadas (média geométrica dos tempos normalizados):")
+        for round_index, factor in enumerate(factors, 1):
+            self._print(f"- Rodada {round_index}: {factor:.4f}")
+        self._print(f"Inclinação da deriva: {slope:+.2f}% por rodada")
+        if abs(slope) > self.DRIFT_WARNING_PCT:
+            self._print("⚠️ AVISO: deriva significativa entre rodadas (throttling térmico ou carga de fundo?)")
+        self._print(f"Outliers marcados: {len(outliers)}")
+
+    def __init__(self, data_seed=None, reporter=None):
+        probe_available_algorithms()   # Verificação de disponibilidade (cache, silenciosa)
+        self.reporter = reporter or ConsoleReporter()  # Destino das mensagens e resultados
         self.results = []              # Lista para armazenar os resultados dos benchmarks
         self.stop_cpu_measurement = False  # Flag para controle da medição de CPU
         self.timeout_seconds = 60      # Timeout padrão (60 segundos)
         self.timeout_occurred = False  # Flag para indicar se ocorreu timeout
-        self.max_cores = psutil.cpu_count(logical=True)  # Número máximo de núcleos disponíveis
+        self.container_limits = detect_container_limits()  # Limites do cgroup (contêiner)
+        self.max_cores = effective_cpu_count(self.container_limits)  # Número máximo de núcleos disponíveis
         self.use_cores = self.max_cores  # Por padrão, usa todos os núcleos
         self.memory_limit_mb = None    # Limite de memória (None = sem limite)
+        if self.container_limits["memory_limit_bytes"]:
+            # Dentro de um contêiner, o limite do cgroup é o limite padrão
+            self.memory_limit_mb = self.container_limits["memory_limit_bytes"] // (1024 * 1024)
         self.baseline_memory_usage = 0 # Uso de memória de linha de base
         self.baseline_cpu_usage = 0    # Uso de CPU de linha de base
-        
-        # Inicializa os dados de teste
+        self.wait_for_idle = False     # Aguardar o sistema ficar ocioso antes de cada benchmark
+        self.iterations = 1            # Execuções medidas por operação
+        self.supervise_mode = "auto"   # Processo filho supervisionado: "auto", "always" ou "never"
+        self.enable_perf_counters = False  # Coletar contadores de hardware (perf_event)
+        self.perf_counters = None      # Instância de PerfEventCounters (criada sob demanda)
+        self.enable_energy = False     # Medir energia via RAPL (powercap)
+        self.kdf_large_memory = False  # Incluir KDFs acima de KDF_MEMORY_CAP_MB
+        self.energy_counters = None    # Instância de RaplEnergyCounters (criada sob demanda)
+        self.profile_patterns = []     # Operações perfiladas (trechos de "Algoritmo-chave Operação")
+        self.profile_mode = "cprofile" # Profiler: "cprofile" ou "sampling" (SIGPROF)
+        self.profile_dir = "perfis"    # Diretório dos arquivos de perfil
+        self.profile_files = {}        # Contagem de perfis por nome (evita sobrescrever)
+        self.auto_calibrate = True     # Calibrar o harness antes da primeira medição
+        self.harness_calibration = None  # Resolução do timer, operação vazia e piso de ruído (ns)
+        self.calibrating = False       # Calibração em andamento (evita recursão)
+        
+        # Inicializa os dados de teste (determinísticos a partir da semente)
+        self.data_seed = new_random_seed() if data_seed is None else data_seed
         self.test_data_size_mb = self.TEST_DATA_SIZE_MB
         self.init_test_data()
         
-        # Atualiza as métricas de linha de base do sistema
-        self.update_system_baseline()
+        # Atualiza as métricas de linha de base do sistema (sem bloquear a inicialização)
+        self.update_system_baseline(cpu_interval=None)
         
-    def init_test_data(self):
-        """Gera dados aleatórios para usar nos testes de criptografia"""
-        print(f"Inicializando {self.test_data_size_mb}MB de dados para teste...")
-        self.test_data = os.urandom(self.test_data_size_mb * 1024 * 1024)
-        print("Dados de teste inicializados com sucesso.")
+        # Captura a impressão digital do ambiente de execução
+        self.update_environment_fingerprint()
         
-    def update_system_baseline(self):
-        """Captura as métricas de uso de memória e CPU antes da execução dos benchmarks"""
+    def init_test_data(self):
+        """Gera dados pseudoaleatórios (reprodutíveis pela semente) para os testes de criptografia"""
+        self._print(f"Inicializando {self.test_data_size_mb}MB de dados para teste (semente {self.data_seed})...")
+        start_time = time.perf_counter()
+        self.test_data = generate_seeded_bytes(self.data_seed, self.test_data_size_mb * 1024 * 1024)
+        elapsed = time.perf_counter() - start_time
+        self.test_data_sha256 = hashlib.sha256(self.test_data).hexdigest()
+        rate = self.test_data_size_mb / elapsed if elapsed > 0 else float("inf")
+        self._print(f"Dados de teste inicializados com sucesso ({rate:.0f} MB/s).")
+        
+    def update_system_baseline(self, cpu_interval=0.5):
+        """
+        Captura as métricas de uso de memória e CPU antes da execução dos benchmarks.
+        Com cpu_interval=None a CPU é a média desde o início do processo (sem bloquear).
+        """
         process = psutil.Process(os.getpid())
         self.baseline_memory_usage = process.memory_info().rss / (1024.0 * 1024.0)
-        self.baseline_cpu_usage = process.cpu_percent(interval=0.5)
+        if cpu_interval is None:
+            cpu_times = process.cpu_times()
+            elapsed = max(time.time() - process.create_time(), 1e-3)
+            self.baseline_cpu_usage = (cpu_times.user + cpu_times.system) / elapsed * 100
+        else:
+            self.baseline_cpu_usage = process.cpu_percent(interval=cpu_interval)
+        
+    def update_environment_fingerprint(self):
+        """Captura a impressão digital do ambiente, registrada em cada resultado e exportação"""
+        self.environment = collect_environment_fingerprint()
+        self.environment_id = environment_fingerprint_id(self.environment)
+        
+    def get_available_memory_gb(self):
+        """Memória disponível para o benchmark em GB (limite configurado ou memória efetiva do contêiner)"""
+        if self.memory_limit_mb is not None:
+            return self.memory_limit_mb / 1024
+        return effective_memory_bytes(self.container_limits)[1] / (1024 ** 3)
+        
+    def set_perf_counters(self, enabled):
+        """Ativa ou desativa a coleta de contadores de hardware, com fallback se indisponíveis"""
+        if enabled and self.perf_counters is None:
+            self.perf_counters = PerfEventCounters()
+        if enabled and not self.perf_counters.available:
+            self._print(f"⚠️ AVISO: contadores de hardware indisponíveis: {self.perf_counters.unavailable_reason}")
+            enabled = False
+        self.enable_perf_counters = enabled
+        if enabled:
+            self._print(f"Contadores de hardware ativos: {', '.join(self.perf_counters.file_descriptors)}")
+        return enabled
+        
+    def set_energy_measurement(self, enabled):
+        """Ativa ou desativa a medição de energia RAPL, com fallback se indisponível"""
+        if enabled and self.energy_counters is None:
+            self.energy_counters = RaplEnergyCounters()
+        if enabled and not self.energy_counters.available:
+            self._print(f"⚠️ AVISO: medição de energia indisponível: {self.energy_counters.unavailable_reason}")
+            enabled = False
+        self.enable_energy = enabled
+        if enabled:
+            kinds = sorted({kind for kind, _ in self.energy_counters.domains.values()})
+            self._print(f"Medição de energia RAPL ativa (domínios: {', '.join(kinds)}; inclui todo o sistema)")
+        return enabled
+
+    def start_energy_measurement(self):
+        """Inicia a medição de energia, se ativa; retorna o coletor ou None"""
+        energy = self.energy_counters if self.enable_energy else None
+        if energy:
+            energy.start()
+        return energy
+
+    def apply_energy(self, result, energy_values):
+        """Calcula joules por operação e por MB a partir da energia medida"""
+        if not energy_values or "package" not in energy_values or not result.iterations:
+            return
+        result.energy_joules = energy_values["package"]
+        result.core_energy_joules = energy_values.get("core")
+        result.joules_per_op = result.energy_joules / result.iterations
+        if result.processes_data and result.data_size_bytes > 0:
+            result.joules_per_mb = result.joules_per_op / (result.data_size_bytes / (1024.0 * 1024.0))
+
+    def _print(self, *args, **kwargs):
+        """Encaminha uma mensagem ao reporter (ConsoleReporter imprime, NullReporter descarta)"""
+        self.reporter.message(*args, **kwargs)
+
+    def add_result(self, result):
+        """Registra um resultado, associando-o ao ambiente de execução atual"""
+        result.environment_id = self.environment_id
+        self.results.append(result)
         
     def timeout_handler(self):
         """Função chamada quando um benchmark excede o tempo limite configurado."""
         self.timeout_occurred = True
-        print(f"Timeout atingido após {self.timeout_seconds} segundos!")
+        self._print(f"Timeout atingido após {self.timeout_seconds} segundos!")
         
     def run(self):
         """Método principal que exibe o menu e controla o fluxo do programa"""
@@ -301,16 +2819,32 @@ class CryptoBenchmark:
         self.print_benchmark_config()
         
         while True:
-            print("\nEscolha uma opção:")
-            print("1. Benchmark de Curve25519/Ed25519")
-            print("2. Benchmark de Curvas NIST (P-256/P-384/P-521)")
-            print("3. Benchmark de RSA")
-            print("4. Benchmark completo (todos os algoritmos)")
-            print("5. Exportar resultados para CSV")
-            print("6. Exportar resultados para XLSX (formatado)")  # Nova opção
-            print("7. Configurar núcleos de CPU e limite de memória")
-            print("8. Limpar resultados anteriores")
-            print("0. Sair")
+            self._print("\nEscolha uma opção:")
+            self._print("1. Benchmark de Curve25519/Ed25519")
+            self._print("2. Benchmark de Curvas NIST (P-256/P-384/P-521)")
+            self._print("3. Benchmark de RSA")
+            self._print("4. Benchmark completo (todos os algoritmos)")
+            self._print("5. Exportar resultados para CSV")
+            self._print("6. Exportar resultados para XLSX (formatado)")  # Nova opção
+            self._print("7. Configurar núcleos de CPU e limite de memória")
+            self._print("8. Limpar resultados anteriores")
+            self._print("9. Salvar linha de base de desempenho (JSON)")
+            self._print("10. Verificar regressão contra linha de base")
+            self._print("11. Benchmark intercalado (ordem aleatória, detecção de outliers)")
+            self._print("12. Ativar/desativar contadores de hardware (perf_event)")
+            self._print("13. Escalonamento com threads vs processos (liberação do GIL)")
+            self._print("14. Simulação de serviço asyncio (latência e vazão máxima com SLO)")
+            self._print("15. Benchmark de handshake TLS em loopback")
+            self._print("16. Benchmark de certificados X.509 / CSR")
+            self._print("17. Benchmark de tokens JWT/JWS")
+            self._print("18. Benchmark de derivação de chaves (HKDF, PBKDF2, scrypt, Argon2id)")
+            self._print("19. Benchmark pós-quântico (ML-KEM, ML-DSA e troca híbrida)")
+            self._print("20. Benchmark de Curve448/Ed448 (comparação com Curve25519 e P-521)")
+            self._print("21. Exportar métricas OpenMetrics (textfile collector do Prometheus)")
+            self._print("22. Ativar/desativar medição de energia (RAPL)")
+            self._print("23. Exportar histogramas de latência (cauda p99/p99.9, formato HdrHistogram)")
+            self._print("24. Agregar execuções históricas (diretórios XLSX e JSON de resultados)")
+            self._print("0. Sair")
             
             option = input("\nOpção: ")
             
@@ -331,40 +2865,110 @@ class CryptoBenchmark:
                 self.configure_resources()         # Configurar recursos
             elif option == "8":
                 self.clear_results()               # Limpar resultados
+            elif option == "9":
+                filename = input("Arquivo da linha de base (Enter para baseline.json): ") or "baseline.json"
+                self.save_performance_baseline(filename)
+            elif option == "10":
+                filename = input("Arquivo da linha de base (Enter para baseline.json): ") or "baseline.json"
+                self.run_regression_gate(filename)
+            elif option == "11":
+                rounds = input(f"Número de rodadas (Enter para {self.INTERLEAVED_ROUNDS}): ")
+                self.run_interleaved_benchmark(int(rounds) if rounds.isdigit() else None)
+            elif option == "12":
+                self.set_perf_counters(not self.enable_perf_counters)
+            elif option == "13":
+                workers = input(f"Número máximo de workers (Enter para {self.use_cores}): ")
+                self.run_thread_scaling_benchmark(int(workers) if workers.isdigit() else None)
+            elif option == "14":
+                executor_kind = input("Executor (thread/process, Enter para thread): ") or "thread"
+                slo = input(f"SLO de latência p99 em ms (Enter para {self.ASYNC_SLO_P99_MS}): ")
+                self.run_async_load_benchmark(executor_kind=executor_kind,
+                                              slo_p99_ms=float(slo) if slo else None)
+            elif option == "15":
+                self.run_tls_handshake_benchmark()
+            elif option == "16":
+                self.run_x509_benchmark()
+            elif option == "17":
+                self.run_jwt_benchmark()
+            elif option == "18":
+                large = input(f"Incluir configurações acima de {self.KDF_MEMORY_CAP_MB} MB? (s/N): ")
+                self.kdf_large_memory = large.strip().lower() == "s"
+                self.run_kdf_benchmark()
+            elif option == "19":
+                self.run_pqc_benchmark()
+            elif option == "20":
+                self.run_curve448_benchmark()
+            elif option == "21":
+                filename = input("Arquivo de métricas (Enter para crypto_benchmark.prom): ") or "crypto_benchmark.prom"
+                self.export_results_to_openmetrics(filename)
+            elif option == "22":
+                self.set_energy_measurement(not self.enable_energy)
+            elif option == "23":
+                directory = input("Diretório (Enter para histogramas): ") or "histogramas"
+                self.export_latency_histograms(directory)
+            elif option == "24":
+                paths = input("Diretórios ou arquivos JSON, separados por espaço (Enter para .): ").split() or ["."]
+                self.aggregate_runs(paths)
             elif option == "0":
                 break                              # Sair do programa
             else:
-                print("Opção inválida, tente novamente.")
+                self._print("Opção inválida, tente novamente.")
                 
     def print_system_info(self):
         """Exibe informações do sistema para referência"""
-        print("===== CryptoBenchmark - Análise de Desempenho Criptográfico =====")
-        print(f"Data e Hora: {datetime.datetime.now()}")
-        print(f"Sistema Operacional: {platform.system()} {platform.version()}")
-        print(f"Processador: {psutil.cpu_count(logical=True)} núcleos lógicos (usando {self.use_cores})")
-        print(f"Memória Total: {psutil.virtual_memory().total / (1024**3):.4f} GB")
-        print(f"Memória Disponível: {psutil.virtual_memory().available / (1024**3):.4f} GB")
-        print(f"Utilização de CPU atual: {psutil.cpu_percent()}%")
-        print(f"Processos ativos: {len(psutil.pids())}")
-        print("=================================================================")
+        self._print("===== CryptoBenchmark - Análise de Desempenho Criptográfico =====")
+        self._print(f"Data e Hora: {datetime.datetime.now()}")
+        self._print(f"Sistema Operacional: {platform.system()} {platform.version()}")
+        total_memory, available_memory = effective_memory_bytes(self.container_limits)
+        self._print(f"Processador: {self.max_cores} núcleos lógicos disponíveis (usando {self.use_cores}, "
+              f"host: {psutil.cpu_count(logical=True)})")
+        self._print(f"Memória Total: {total_memory / (1024**3):.4f} GB")
+        self._print(f"Memória Disponível: {available_memory / (1024**3):.4f} GB")
+        if self.container_limits["version"]:
+            quota = self.container_limits["cpu_quota_cores"]
+            memory_limit = self.container_limits["memory_limit_bytes"]
+            self._print(f"cgroup {self.container_limits['version']}: "
+                  f"cota de CPU {f'{quota:.2f} núcleos' if quota else 'ilimitada'}, "
+                  f"cpuset {self.container_limits['cpuset_cores']} núcleos, "
+                  f"memória {f'{memory_limit / (1024**2):.0f} MB' if memory_limit else 'ilimitada'}")
+        self._print(f"Utilização de CPU atual: {psutil.cpu_percent()}%")
+        self._print(f"Processos ativos: {len(psutil.pids())}")
+        self._print(f"Bibliotecas: cryptography {get_crypto_library_versions()['cryptography']} / {get_crypto_library_versions()['openssl']}")
+        
+        # Impressão digital do ambiente
+        cpu = self.environment["cpu"]
+        flags = [name for name, present in cpu["flags"].items() if present]
+        self._print(f"Modelo da CPU: {cpu['model'] or 'desconhecido'} ({cpu['architecture']})")
+        self._print(f"Governador: {cpu['frequency_governor'] or 'desconhecido'} | "
+              f"Turbo: {cpu['turbo_enabled']} | SMT: {cpu['smt_enabled']}")
+        self._print(f"Kernel: {self.environment['os']['kernel']} | Python: {self.environment['python']['version']}")
+        self._print(f"Extensões de CPU: {', '.join(flags) if flags else 'nenhuma detectada'}")
+        self._print(f"Ambiente (ID): {self.environment_id}")
+        for warning in environment_warnings(self.environment, self.use_cores):
+            self._print(f"⚠️ AVISO: {warning}")
+        self._print("=================================================================")
         
     def print_benchmark_config(self):
         """Exibe a configuração atual do benchmark"""
-        print("\nConfiguração do Benchmark:")
-        print(f"- Usando {self.use_cores} núcleos de CPU")
-        print(f"- Tempo limite para testes: {self.timeout_seconds} segundos")
-        print(f"- Tamanho dos dados de teste: {self.test_data_size_mb} MB")
+        self._print("\nConfiguração do Benchmark:")
+        self._print(f"- Usando {self.use_cores} núcleos de CPU")
+        self._print(f"- Tempo limite para testes: {self.timeout_seconds} segundos (supervisão: {self.supervise_mode})")
+        self._print(f"- Tamanho dos dados de teste: {self.test_data_size_mb} MB (semente {self.data_seed})")
+        self._print(f"- Iterações por operação: {self.iterations}")
+        self._print(f"- Contadores de hardware: {'ativos' if self.enable_perf_counters else 'desativados'}")
+        self._print(f"- Medição de energia (RAPL): {'ativa' if self.enable_energy else 'desativada'}")
         if self.memory_limit_mb:
-            print(f"- Limite de memória: {self.memory_limit_mb} MB")
-        print(f"- Memória de linha de base: {self.baseline_memory_usage:.4f} MB")
-        print(f"- CPU de linha de base: {self.baseline_cpu_usage:.4f}%")
+            self._print(f"- Limite de memória: {self.memory_limit_mb} MB")
+        self._print(f"- Memória de linha de base: {self.baseline_memory_usage:.4f} MB")
+        self._print(f"- CPU de linha de base: {self.baseline_cpu_usage:.4f}%")
         
     def configure_resources(self):
         """Permite configurar o número de núcleos de CPU e o limite de memória"""
-        print("===== Configuração de Recursos =====")
-        print(f"Total de núcleos disponíveis no sistema: {self.max_cores}")
-        print(f"Memória total do sistema: {int(psutil.virtual_memory().total / (1024*1024))} MB")
-        print(f"Memória disponível: {int(psutil.virtual_memory().available / (1024*1024))} MB")
+        self._print("===== Configuração de Recursos =====")
+        self._print(f"Total de núcleos disponíveis no sistema: {self.max_cores}")
+        total_memory, available_memory = effective_memory_bytes(self.container_limits)
+        self._print(f"Memória total do sistema: {int(total_memory / (1024*1024))} MB")
+        self._print(f"Memória disponível: {int(available_memory / (1024*1024))} MB")
         
         try:
             # Configuração de núcleos
@@ -374,44 +2978,56 @@ class CryptoBenchmark:
                 if 1 <= cores <= self.max_cores:
                     self.use_cores = cores
                 else:
-                    print(f"Valor inválido. Usando {self.use_cores} núcleos.")
+                    self._print(f"Valor inválido. Usando {self.use_cores} núcleos.")
+            
+            # Configuração de iterações por operação
+            iterations = input(f"Iterações medidas por operação (atualmente {self.iterations}): ")
+            if iterations:
+                self.iterations = max(1, int(iterations))
             
             # Configuração de limite de memória
             mem_limit = input("Limite de memória em MB (opcional, Enter para sem limite): ")
             if mem_limit:
                 self.memory_limit_mb = int(mem_limit)
-                print(f"Limite de memória definido para {self.memory_limit_mb} MB")
+                self._print(f"Limite de memória definido para {self.memory_limit_mb} MB")
             else:
                 self.memory_limit_mb = None
-                print("Sem limite de memória")
+                self._print("Sem limite de memória")
                 
             # Atualiza a linha de base após a mudança de configuração
-            print("Atualizando linha de base do sistema...")
+            self._print("Atualizando linha de base do sistema...")
             self.update_system_baseline()
-            print(f"- Nova memória de linha de base: {self.baseline_memory_usage:.4f} MB")
-            print(f"- Nova CPU de linha de base: {self.baseline_cpu_usage:.4f}%")
+            self._print(f"- Nova memória de linha de base: {self.baseline_memory_usage:.4f} MB")
+            self._print(f"- Nova CPU de linha de base: {self.baseline_cpu_usage:.4f}%")
             
         except ValueError:
-            print("Entrada inválida. Mantendo configurações anteriores.")
+            self._print("Entrada inválida. Mantendo configurações anteriores.")
                 
     def clear_results(self):
             self.results = []
-            print("Resultados limpos com sucesso.")
+            self._print("Resultados limpos com sucesso.")
             
     def limit_cpu_cores(self):
         """Configura o uso limitado de CPU para o benchmark."""
-        if self.use_cores < psutil.cpu_count(logical=True):
-            print(f"Afinidade de CPU definida para usar {self.use_cores} núcleos: {list(range(self.use_cores))}")
+        if self.use_cores < self.max_cores:
+            self._print(f"Afinidade de CPU definida para usar {self.use_cores} núcleos: {list(range(self.use_cores))}")
             # Nota: Em um programa real, aqui você poderia usar psutil.Process().cpu_affinity()
             # Mas isso requer privilégios elevados em alguns sistemas
     
-    def measure_cpu_usage(self, result):
-        """Mede o uso de CPU durante uma operação"""
-        process = psutil.Process(os.getpid())
+    def measure_cpu_usage(self, result, pid=None):
+        """Mede o uso de CPU durante uma operação (do processo atual ou do worker supervisionado)"""
+        try:
+            process = psutil.Process(pid or os.getpid())
+        except psutil.Error:
+            result.cpu_percentage = 0
+            return
         cpu_percentages = []
         
         while not self.stop_cpu_measurement:
-            cpu_percentages.append(process.cpu_percent(interval=0.1))
+            try:
+                cpu_percentages.append(process.cpu_percent(interval=0.1))
+            except psutil.Error:
+                break  # O worker supervisionado terminou
             time.sleep(0.1)
             
         if cpu_percentages:
@@ -420,31 +3036,18 @@ class CryptoBenchmark:
             result.cpu_percentage = 0
         
     def display_result(self, result):
-        """Exibe os resultados do benchmark"""
-        print(f"\nResultado do Benchmark:")
-        print(f"Algoritmo: {result.algorithm}")
-        print(f"Tamanho da Chave: {result.key_size} bits")
-        print(f"Operação: {result.operation_type}")
-        print(f"Tamanho dos Dados: {result.data_size_bytes / (1024.0 * 1024.0):.4f} MB")
-        print(f"Tempo de Execução: {result.execution_time_ms:.4f} ms")
-        print(f"Uso de Memória: {result.memory_usage_mb:.4f} MB")
-        print(f"Uso de CPU: {result.cpu_percentage:.4f}%")
-        if result.notes:
-            print(f"Observações: {result.notes}")
+        """Exibe os resultados do benchmark pelo reporter configurado"""
+        self.reporter.result(result)
     
     def export_results_to_csv(self):
-        from datetime import datetime
         """Exporta os resultados para um arquivo CSV"""
         if not self.results:
-            print("Não há resultados para exportar. Execute alguns benchmarks primeiro.")
+            self._print("Não há resultados para exportar. Execute alguns benchmarks primeiro.")
             return
 
         # Informações do sistema
         total_cores = self.use_cores
-        available_memory_gb = (
-            self.memory_limit_mb / 1024 if self.memory_limit_mb is not None 
-            else psutil.virtual_memory().available / (1024 ** 2)
-        )
+        available_memory_gb = self.get_available_memory_gb()
 
 
         # Nome do algoritmo (fallback para "Algoritmo" se não estiver definido)
@@ -470,11 +3073,29 @@ class CryptoBenchmark:
                     "Uso de Memória (MB)", 
                     "Uso de CPU (%)",
                     "Data/Hora",
-                    "Observações"
+                    "Observações",
+                    "Versão cryptography",
+                    "Versão OpenSSL",
+                    "Ambiente (ID)",
+                    "Iterações",
+                    "Ciclos/op",
+                    "IPC",
+                    "Ciclos/byte",
+                    "Modo de Concorrência",
+                    "Workers",
+                    "Vazão (ops/s)",
+                    "Mediana (ms)",
+                    "p99 (ms)",
+                    "Tempo Líquido (ms)",
+                    "Energia (J)",
+                    "Energia dos Núcleos (J)",
+                    "Energia/op (J)",
+                    "Energia/MB (J)"
                 ])
                 
                 # Escrever resultados
                 for result in self.results:
+                    stats = result.sample_statistics() if result.samples_ns else None
                     writer.writerow([
                         result.algorithm,
                         result.key_size,
@@ -484,41 +3105,64 @@ class CryptoBenchmark:
                         f"{result.memory_usage_mb:.4f}",
                         f"{result.cpu_percentage:.4f}",
                         result.timestamp.strftime('%Y-%m-%d %H:%M:%S') if result.timestamp else "",
-                        result.notes
+                        result.notes,
+                        result.cryptography_version,
+                        result.openssl_version,
+                        result.environment_id,
+                        result.iterations,
+                        f"{result.cycles_per_op:.0f}" if result.cycles_per_op is not None else "",
+                        f"{result.ipc:.4f}" if result.ipc is not None else "",
+                        f"{result.cycles_per_byte:.4f}" if result.cycles_per_byte is not None else "",
+                        result.concurrency_mode,
+                        result.workers,
+                        f"{result.throughput_ops:.4f}" if result.throughput_ops is not None else "",
+                        f"{stats['median_ms']:.4f}" if stats else "",
+                        f"{stats['p99_ms']:.4f}" if stats else "",
+                        f"{result.net_time_ms:.4f}" if result.net_time_ms is not None else "",
+                        f"{result.energy_joules:.6f}" if result.energy_joules is not None else "",
+                        f"{result.core_energy_joules:.6f}" if result.core_energy_joules is not None else "",
+                        f"{result.joules_per_op:.9f}" if result.joules_per_op is not None else "",
+                        f"{result.joules_per_mb:.6f}" if result.joules_per_mb is not None else ""
                     ])
+            
+            # Impressão digital do ambiente em arquivo JSON ao lado do CSV
+            environment_filename = filename[:-len(".csv")] + "_ambiente.json"
+            with open(environment_filename, "w") as environment_file:
+                json.dump({"environment_id": self.environment_id, "environment": self.environment},
+                          environment_file, indent=2)
                     
-            print(f"Resultados exportados para {filename} com sucesso!")
-            print(f"Total de resultados exportados: {len(self.results)}")
+            self._print(f"Resultados exportados para {filename} com sucesso!")
+            self._print(f"Ambiente de execução salvo em {environment_filename}")
+            self._print(f"Total de resultados exportados: {len(self.results)}")
             
             # Mostrar contagem por algoritmo
             algorithm_counts = {}
             for result in self.results:
                 algorithm_counts[result.algorithm] = algorithm_counts.get(result.algorithm, 0) + 1
                 
-            print("\nDetalhamento dos resultados exportados:")
+            self._print("\nDetalhamento dos resultados exportados:")
             for algo, count in algorithm_counts.items():
-                print(f"- {algo}: {count} resultados")
+                self._print(f"- {algo}: {count} resultados")
         
         except Exception as ex:
-            print(f"Erro ao exportar resultados: {str(ex)}")
+            self._print(f"Erro ao exportar resultados: {str(ex)}")
 
 
     
     def export_results_to_xlsx(self):
+        import openpyxl
         from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
         from openpyxl.utils import get_column_letter
         from openpyxl.formatting.rule import ColorScaleRule
+        from openpyxl.comments import Comment
         
         if not self.results:
-            print("Não há resultados para exportar. Execute alguns benchmarks primeiro.")
+            self._print("Não há resultados para exportar. Execute alguns benchmarks primeiro.")
             return
 
         # Informações do sistema
         total_cores = self.use_cores
-        available_memory_gb = (
-            self.memory_limit_mb / 1024 if self.memory_limit_mb is not None 
-            else psutil.virtual_memory().available / (1024 ** 3)
-        )
+        available_memory_gb = self.get_available_memory_gb()
 
         # Nome do algoritmo (fallback para "Algoritmo" se não estiver definido)
         algorithm_name = getattr(self, "algorithm_name", "Algoritmo")
@@ -563,12 +3207,14 @@ class CryptoBenchmark:
             
             ws['A3'] = f"Data de Execução: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
             ws['A4'] = f"Sistema: {platform.system()} {platform.version()}"
-            ws['A5'] = f"CPU: {total_cores} núcleos utilizados de {psutil.cpu_count(logical=True)} disponíveis"
+            ws['A5'] = f"CPU: {total_cores} núcleos utilizados de {self.max_cores} disponíveis"
             ws['A6'] = f"Memória: {available_memory_gb:.2f} GB disponíveis"
             ws['A7'] = f"Tamanho dos dados de teste: {self.test_data_size_mb} MB"
+            ws['A8'] = (f"Bibliotecas: cryptography {get_crypto_library_versions()['cryptography']} / "
+                        f"{get_crypto_library_versions()['openssl']}")
             
             # Aplicar estilo às informações do sistema
-            for row in range(3, 8):
+            for row in range(3, 9):
                 ws[f'A{row}'].font = Font(name='Calibri', size=11, italic=True)
             
             # === CABEÇALHOS DA TABELA ===
@@ -581,12 +3227,32 @@ class CryptoBenchmark:
                 "Uso de Memória (MB)", 
                 "Uso de CPU (%)",
                 "Data/Hora",
-                "Observações"
+                "Observações",
+                "Ciclos/op",
+                "IPC",
+                "Ciclos/byte",
+                "Modo de Concorrência",
+                "Workers",
+                "Vazão (ops/s)",
+                "Mediana (ms)",
+                "p99 (ms)",
+                "Tempo Líquido (ms)",
+                "Energia (J)",
+                "Energia dos Núcleos (J)",
+                "Energia/op (J)",
+                "Energia/MB (J)"
             ]
             
             # Linha onde começam os cabeçalhos
             header_row = 9
             
+            # Notas das colunas cujo significado muda nos resultados de concorrência
+            header_notes = {
+                "Tempo de Execução (ms)": "Tempo médio por operação; com N workers, latência média "
+                                          "por operação dentro de cada worker (comparável às linhas sequenciais)",
+                "Vazão (ops/s)": "Vazão agregada de todos os workers"
+            }
+            
             # Escrever cabeçalhos
             for col, header in enumerate(headers, 1):
                 cell = ws.cell(row=header_row, column=col, value=header)
@@ -594,12 +3260,17 @@ class CryptoBenchmark:
                 cell.fill = header_fill
                 cell.alignment = header_alignment
                 cell.border = thin_border
+                if header in header_notes:
+                    cell.comment = Comment(header_notes[header], "Benchmark")
             
             # === DADOS ===
             data_start_row = header_row + 1
             
             # Escrever resultados com formatação
             for row_idx, result in enumerate(self.results, data_start_row):
+                # Mediana e p99 calculadas a partir das amostras por iteração
+                stats = result.sample_statistics() if result.samples_ns else None
+                
                 # Dados da linha
                 row_data = [
                     result.algorithm,
@@ -610,7 +3281,20 @@ class CryptoBenchmark:
                     result.memory_usage_mb,                       # MB com 6 casas decimais
                     result.cpu_percentage,                        # % com 3 casas decimais
                     result.timestamp.strftime('%d/%m/%Y %H:%M:%S') if result.timestamp else "",
-                    result.notes
+                    result.notes,
+                    result.cycles_per_op,
+                    result.ipc,
+                    result.cycles_per_byte,
+                    result.concurrency_mode,
+                    result.workers,
+                    result.throughput_ops,
+                    stats["median_ms"] if stats else None,
+                    stats["p99_ms"] if stats else None,
+                    result.net_time_ms,
+                    result.energy_joules,
+                    result.core_energy_joules,
+                    result.joules_per_op,
+                    result.joules_per_mb
                 ]
                 
                 # Escrever dados na planilha
@@ -629,6 +3313,18 @@ class CryptoBenchmark:
                         cell.number_format = '0.000000'
                     elif col_idx == 7:  # Uso de CPU (%)
                         cell.number_format = '0.000'
+                    elif col_idx == 10:  # Ciclos/op
+                        cell.number_format = '0'
+                    elif col_idx in (11, 12):  # IPC e Ciclos/byte
+                        cell.number_format = '0.0000'
+                    elif col_idx == 15:  # Vazão (ops/s)
+                        cell.number_format = '0.00'
+                    elif col_idx in (16, 17, 18):  # Mediana, p99 e Tempo Líquido (ms)
+                        cell.number_format = '0.000000'
+                    elif col_idx in (19, 20, 22):  # Energia total, dos núcleos e por MB (J)
+                        cell.number_format = '0.000000'
+                    elif col_idx == 21:  # Energia/op (J)
+                        cell.number_format = '0.000000000'
                     
                     # Cores alternadas para linhas
                     if (row_idx - data_start_row) % 2 == 1:
@@ -644,7 +3340,20 @@ class CryptoBenchmark:
                 'F': 20,  # Uso de Memória
                 'G': 15,  # Uso de CPU
                 'H': 20,  # Data/Hora
-                'I': 25   # Observações
+                'I': 25,  # Observações
+                'J': 14,  # Ciclos/op
+                'K': 10,  # IPC
+                'L': 14,  # Ciclos/byte
+                'M': 22,  # Modo de Concorrência
+                'N': 10,  # Workers
+                'O': 16,  # Vazão (ops/s)
+                'P': 16,  # Mediana (ms)
+                'Q': 16,  # p99 (ms)
+                'R': 20,  # Tempo Líquido (ms)
+                'S': 14,  # Energia (J)
+                'T': 24,  # Energia dos Núcleos (J)
+                'U': 16,  # Energia/op (J)
+                'V': 16   # Energia/MB (J)
             }
             
             for col, width in column_widths.items():
@@ -669,31 +3378,13 @@ class CryptoBenchmark:
             
             summary_start_row += 2
             
-            # Calcular estatísticas por algoritmo
-            algorithm_stats = {}
-            for result in self.results:
-                algo = result.algorithm
-                if algo not in algorithm_stats:
-                    algorithm_stats[algo] = {
-                        'count': 0,
-                        'total_time': 0,
-                        'min_time': float('inf'),
-                        'max_time': 0,
-                        'total_memory': 0,
-                        'total_cpu': 0
-                    }
-                
-                stats = algorithm_stats[algo]
-                stats['count'] += 1
-                stats['total_time'] += result.execution_time_ms
-                stats['min_time'] = min(stats['min_time'], result.execution_time_ms)
-                stats['max_time'] = max(stats['max_time'], result.execution_time_ms)
-                stats['total_memory'] += result.memory_usage_mb
-                stats['total_cpu'] += result.cpu_percentage
+            # Calcular estatísticas por algoritmo (agregação colunar, um tempo médio por resultado)
+            algorithm_stats = ResultTable.from_results(self.results, key_fields=("algorithm",),
+                                                       use_samples=False).aggregate(bootstrap=False)
             
             # Cabeçalhos do resumo
             summary_headers = ['Algoritmo', 'Testes', 'Tempo Médio (ms)', 'Tempo Min (ms)', 
-                            'Tempo Max (ms)', 'Memória Média (MB)', 'CPU Média (%)']
+                            'Tempo Max (ms)', 'Memória Média (MB)', 'CPU Média (%)', 'Mediana (ms)']
             
             for col, header in enumerate(summary_headers, 1):
                 cell = ws.cell(row=summary_start_row, column=col, value=header)
@@ -703,222 +3394,1394 @@ class CryptoBenchmark:
                 cell.border = thin_border
             
             # Dados do resumo
-            for row_idx, (algo, stats) in enumerate(algorithm_stats.items(), summary_start_row + 1):
+            for row_idx, stats in enumerate(algorithm_stats, summary_start_row + 1):
                 summary_data = [
-                    algo,
-                    stats['count'],
-                    stats['total_time'] / stats['count'],     # Tempo médio
-                    stats['min_time'],                        # Tempo mínimo
-                    stats['max_time'],                        # Tempo máximo
-                    stats['total_memory'] / stats['count'],   # Memória média
-                    stats['total_cpu'] / stats['count']       # CPU médio
+                    stats['algorithm'],
+                    stats['runs'],
+                    stats['mean_ms'],      # Tempo médio
+                    stats['min_ms'],       # Tempo mínimo
+                    stats['max_ms'],       # Tempo máximo
+                    stats['memory_mb'],    # Memória média
+                    stats['cpu_pct'],      # CPU médio
+                    stats['q50']           # Mediana
                 ]
                 
-                for col_idx, value in enumerate(summary_data, 1):
-                    cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                    cell.font = data_font
-                    cell.alignment = data_alignment
-                    cell.border = thin_border
+                for col_idx, value in enumerate(summary_data, 1):
+                    cell = ws.cell(row=row_idx, column=col_idx, value=value)
+                    cell.font = data_font
+                    cell.alignment = data_alignment
+                    cell.border = thin_border
+                    
+                    # Formatação numérica para o resumo
+                    if 3 <= col_idx <= 6 or col_idx == 8:  # Colunas de tempo e memória
+                        cell.number_format = '0.000000'
+                    elif col_idx == 7:  # CPU
+                        cell.number_format = '0.000'
+            
+            # === FREEZAR PAINÉIS ===
+            ws.freeze_panes = f'A{data_start_row}'
+            
+            # === AMBIENTE DE EXECUÇÃO ===
+            env_ws = wb.create_sheet("Ambiente")
+            for col, header in enumerate(["Propriedade", "Valor"], 1):
+                cell = env_ws.cell(row=1, column=col, value=header)
+                cell.font = header_font
+                cell.fill = header_fill
+                cell.alignment = header_alignment
+                cell.border = thin_border
+            environment_rows = [("environment_id", self.environment_id)] + flatten_dict(self.environment)
+            for row_idx, (key, value) in enumerate(environment_rows, 2):
+                env_ws.cell(row=row_idx, column=1, value=key).font = data_font
+                env_ws.cell(row=row_idx, column=2, value=str(value) if value is not None else "").font = data_font
+            env_ws.column_dimensions['A'].width = 35
+            env_ws.column_dimensions['B'].width = 60
+            
+            # === COMPARAÇÃO CURVE448 x CURVE25519 x P-521 ===
+            curve_rows = self.build_curve_comparison()
+            if curve_rows:
+                curve_ws = wb.create_sheet("Comparação de Curvas")
+                curve_headers = ["Algoritmo", "Operação", "Curve448 (ms)", "Curve25519 (ms)",
+                                 "448/25519", "P-521 (ms)", "448/P-521"]
+                for col, header in enumerate(curve_headers, 1):
+                    cell = curve_ws.cell(row=1, column=col, value=header)
+                    cell.font = header_font
+                    cell.fill = header_fill
+                    cell.alignment = header_alignment
+                    cell.border = thin_border
+                for row_idx, (operation_type, algorithm, curve448_ms, curve25519_ms, p521_ms) in enumerate(curve_rows, 2):
+                    row_data = [
+                        algorithm, operation_type, curve448_ms, curve25519_ms,
+                        curve448_ms / curve25519_ms if curve25519_ms else None,
+                        p521_ms,
+                        curve448_ms / p521_ms if p521_ms else None
+                    ]
+                    for col_idx, value in enumerate(row_data, 1):
+                        cell = curve_ws.cell(row=row_idx, column=col_idx, value=value)
+                        cell.font = data_font
+                        cell.border = thin_border
+                        if col_idx in (3, 4, 6):
+                            cell.number_format = '0.000000'
+                        elif col_idx in (5, 7):
+                            cell.number_format = '0.00"x"'
+                for col, width in zip("ABCDEFG", (12, 18, 16, 16, 12, 14, 12)):
+                    curve_ws.column_dimensions[col].width = width
+            
+            # Salvar arquivo
+            wb.save(filename)
+                    
+            self._print(f"Resultados exportados para {filename} com sucesso!")
+            self._print(f"Total de resultados exportados: {len(self.results)}")
+            
+            # Mostrar contagem por algoritmo
+            algorithm_counts = {}
+            for result in self.results:
+                algorithm_counts[result.algorithm] = algorithm_counts.get(result.algorithm, 0) + 1
+                
+            self._print("\nDetalhamento dos resultados exportados:")
+            for algo, count in algorithm_counts.items():
+                self._print(f"- {algo}: {count} resultados")
+            
+            self._print(f"\nRecursos do arquivo XLSX:")
+            self._print("- Formatação condicional nos tempos de execução")
+            self._print("- Cores alternadas nas linhas")
+            self._print("- Resumo estatístico por algoritmo")
+            self._print("- Colunas ajustadas automaticamente")
+            self._print("- 6 casas decimais para medições de precisão")
+            self._print("- Planilha 'Ambiente' com a impressão digital do sistema")
+            if curve_rows:
+                self._print("- Planilha 'Comparação de Curvas' (Curve448 vs Curve25519 vs P-521)")
+        
+        except Exception as ex:
+            self._print(f"Erro ao exportar resultados: {str(ex)}")
+            self._print("Certifique-se de que a biblioteca openpyxl está instalada: pip install openpyxl")
+
+    # ==== Histogramas de latência (cauda e jitter) ====
+
+    def merge_latency_histograms(self, results=None):
+        """
+        Combina os histogramas dos resultados de uma mesma série (algoritmo, chave,
+        operação, modo de concorrência e workers), por exemplo entre rodadas intercaladas
+        ou execuções carregadas de JSON. Retorna {rótulo da série: histograma}.
+        """
+        merged = {}
+        for result in self.results if results is None else results:
+            if result.latency_histogram is None or not result.latency_histogram.total_count:
+                continue
+            label = " ".join(str(part) for part in (result.algorithm, result.key_size, result.operation_type) if part)
+            if result.concurrency_mode:
+                label += f" {result.concurrency_mode}x{result.workers}"
+            merged.setdefault(label, LatencyHistogram()).merge(result.latency_histogram)
+        return merged
+
+    def export_latency_histograms(self, directory="histogramas"):
+        """
+        Grava um arquivo .hgrm (distribuição de percentis do HdrHistogram) por série e um
+        JSON com todos os histogramas combinados, e exibe a tabela de cauda por série
+        """
+        import re
+        
+        merged = self.merge_latency_histograms()
+        if not merged:
+            self._print("Não há histogramas de latência para exportar. Execute alguns benchmarks primeiro.")
+            return
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for label, histogram in merged.items():
+                filename = os.path.join(directory, re.sub(r"[^A-Za-z0-9_.-]+", "_", label) + ".hgrm")
+                with open(filename, "w") as histogram_file:
+                    histogram_file.write(histogram.percentile_distribution())
+            with open(os.path.join(directory, "histogramas.json"), "w") as json_file:
+                json.dump({label: histogram.to_dict() for label, histogram in merged.items()}, json_file)
+        except OSError as ex:
+            self._print(f"Erro ao exportar histogramas: {str(ex)}")
+            return
+        
+        header = (f"{'Série':<44} {'Amostras':>9} {'p50':>10} {'p90':>10} {'p99':>10} "
+                  f"{'p99.9':>10} {'Máx':>10} {'Jitter':>8}")
+        self._print("\nLatência por série (ms; jitter = p99/p50):")
+        self._print(header)
+        self._print("-" * len(header))
+        for label, histogram in merged.items():
+            tail = histogram.summary()
+            jitter = tail["p99_ms"] / tail["p50_ms"] if tail["p50_ms"] > 0 else 0.0
+            self._print(f"{label[:44]:<44} {tail['count']:>9} {tail['p50_ms']:>10.4f} {tail['p90_ms']:>10.4f} "
+                        f"{tail['p99_ms']:>10.4f} {tail['p999_ms']:>10.4f} {tail['max_ms']:>10.4f} {jitter:>7.2f}x")
+        self._print(f"\nHistogramas exportados para {directory}/ ({len(merged)} séries, .hgrm e histogramas.json)")
+
+    # ==== Agregação de execuções históricas ====
+
+    def aggregate_runs(self, paths=(), include_current=True, csv_filename=None):
+        """
+        Agrega, por algoritmo, chave, operação e configuração, as planilhas históricas
+        (diretórios como 2CPU_0.5GB/), arquivos JSON de resultados e os resultados atuais,
+        com mediana, p90/p99 e IC bootstrap de 95% da mediana. Retorna as linhas agregadas.
+        """
+        table = ResultTable()
+        files = 0
+        start = time.perf_counter()
+        try:
+            for path in paths:
+                if os.path.isdir(path):
+                    table, loaded = load_history_table(path, table)
+                    files += loaded
+                else:
+                    for result in load_results_json(path):
+                        table.add_result(result, config=os.path.splitext(os.path.basename(path))[0])
+                    files += 1
+        except (OSError, ValueError, KeyError) as ex:
+            self._print(f"Erro ao carregar execuções: {str(ex)}")
+            return []
+        except ImportError:
+            self._print("Erro: a leitura das planilhas requer openpyxl (pip install openpyxl)")
+            return []
+        if include_current:
+            config = f"{self.use_cores}CPU_{self.get_available_memory_gb():.1f}GB (atual)"
+            for result in self.results:
+                table.add_result(result, config)
+        load_seconds = time.perf_counter() - start
+        
+        if not len(table):
+            self._print("Nenhum resultado para agregar.")
+            return []
+        start = time.perf_counter()
+        rows = table.aggregate()
+        aggregate_seconds = time.perf_counter() - start
+        
+        header = (f"{'Algoritmo':<14} {'Chave':>6} {'Operação':<26} {'Configuração':<20} {'Exec.':>5} "
+                  f"{'Mediana':>11} {'p90':>11} {'p99':>11} {'IC 95% da mediana':>25}")
+        self._print("\nAgregação de execuções (tempos em ms):")
+        self._print(header)
+        self._print("-" * len(header))
+        for row in rows:
+            interval = f"[{row['ci_low_ms']:.4f}, {row['ci_high_ms']:.4f}]"
+            self._print(f"{str(row['algorithm'])[:14]:<14} {str(row['key_size']):>6} {str(row['operation'])[:26]:<26} "
+                        f"{str(row['config'])[:20]:<20} {row['runs']:>5} {row['q50']:>11.4f} {row['q90']:>11.4f} "
+                        f"{row['q99']:>11.4f} {interval:>25}")
+        engine = "NumPy" if get_numpy() is not None else "Python puro"
+        self._print(f"\n{len(rows)} grupos, {len(table)} resultados e {len(table.samples_ns)} amostras "
+                    f"({files} arquivos); carga {load_seconds:.2f} s, agregação {aggregate_seconds:.2f} s ({engine})")
+        
+        if csv_filename:
+            columns = ["algorithm", "key_size", "operation", "config", "runs", "samples", "mean_ms",
+                       "min_ms", "q50", "q90", "q99", "max_ms", "ci_low_ms", "ci_high_ms", "memory_mb", "cpu_pct"]
+            try:
+                with open(csv_filename, "w", newline="") as csv_file:
+                    writer = csv.writer(csv_file)
+                    writer.writerow(["Algoritmo", "Tamanho da Chave (bits)", "Operação", "Configuração",
+                                     "Execuções", "Amostras", "Tempo Médio (ms)", "Tempo Min (ms)",
+                                     "Mediana (ms)", "p90 (ms)", "p99 (ms)", "Tempo Max (ms)",
+                                     "IC 95% Inferior (ms)", "IC 95% Superior (ms)",
+                                     "Memória Média (MB)", "CPU Média (%)"])
+                    for row in rows:
+                        writer.writerow([row[column] for column in columns])
+                self._print(f"Agregação exportada para {csv_filename}")
+            except OSError as ex:
+                self._print(f"Erro ao exportar agregação: {str(ex)}")
+        return rows
+
+    # ==== Exportação OpenMetrics (Prometheus) ====
+
+    def render_openmetrics(self):
+        """Texto OpenMetrics dos resultados atuais (ver render_openmetrics)"""
+        return render_openmetrics(list(self.results), self.use_cores, self.memory_limit_mb, self.environment_id)
+
+    def export_results_to_openmetrics(self, filename="crypto_benchmark.prom"):
+        """
+        Grava as métricas em um arquivo para o textfile collector do node_exporter.
+        A escrita é atômica (arquivo temporário + rename) para que a coleta nunca
+        leia um arquivo pela metade.
+        """
+        temporary_filename = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_filename, "w") as metrics_file:
+                metrics_file.write(self.render_openmetrics())
+            os.replace(temporary_filename, filename)
+        except OSError as ex:
+            self._print(f"Erro ao exportar métricas: {str(ex)}")
+            return False
+        self._print(f"Métricas OpenMetrics exportadas para {filename} ({len(self.results)} resultados)")
+        return True
+
+    def serve_openmetrics(self, port, host="127.0.0.1"):
+        """
+        Inicia um servidor HTTP local em segundo plano que responde em /metrics com os
+        resultados atuais (renderizados a cada coleta). Retorna o servidor (use shutdown()).
+        """
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+        benchmark = self
+        
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = benchmark.render_openmetrics().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass  # Coletas periódicas não devem poluir a saída do benchmark
+        
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self._print(f"Métricas OpenMetrics disponíveis em http://{host}:{server.server_address[1]}/metrics")
+        return server
+        
+    # ==== Escalonamento com threads e processos (liberação do GIL) ====
+
+    def measure_pool_throughput(self, executor, operation_name, workers, ops_per_worker,
+                                worker=run_scaling_worker):
+        """
+        Mede a vazão agregada (ops/s) de `workers` tarefas simultâneas no executor,
+        após aquecer os workers para que a criação de fixtures fique fora da medição.
+        Retorna (ops/s, tempo decorrido, energia RAPL consumida, histograma combinado dos workers).
+        A média do histograma é a latência por operação dentro de cada worker, sem o
+        despacho do pool e a comunicação entre processos, comparável às medições
+        sequenciais; a vazão agregada é a que vai para throughput_ops.
+        """
+        list(executor.map(worker, [operation_name] * (workers * 2), [0] * (workers * 2)))
+        
+        energy = self.start_energy_measurement()
+        start_time = time.perf_counter()
+        futures = [executor.submit(worker, operation_name, ops_per_worker) for _ in range(workers)]
+        worker_results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start_time
+        energy_values = energy.stop() if energy else {}
+        
+        # Histogramas montados após a medição, a partir dos instantes de cada worker,
+        # e combinados somando as contagens por faixa
+        total_ops = 0
+        histogram = LatencyHistogram()
+        for count, timestamps in worker_results:
+            total_ops += count
+            histogram.merge(LatencyHistogram.from_timestamps(timestamps))
+        return total_ops / elapsed, elapsed, energy_values, histogram
+
+    def run_thread_scaling_benchmark(self, max_workers=None, operations=None):
+        """
+        Executa cada operação com 1..N threads (ThreadPoolExecutor) e 1..N processos
+        (ProcessPoolExecutor), comparando a vazão agregada. Se as threads escalam como
+        os processos, a chamada ao OpenSSL libera o GIL; a diferença é a contenção.
+        Cada resultado registra a latência média por operação em execution_time_ms e a
+        vazão agregada dos N workers em throughput_ops.
+        """
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+        
+        max_workers = max_workers or self.use_cores
+        operations = operations or list(SCALING_OPERATIONS)
+        
+        self._print("\n===== Benchmark de Escalonamento: Threads vs Processos =====")
+        self._print(f"Workers: 1..{max_workers} | Mensagem: {SCALING_MESSAGE_SIZE} bytes")
+        self.stabilize_system()
+        self.limit_cpu_cores()
+        
+        results_count_before = len(self.results)
+        
+        for operation_name in operations:
+            algorithm, key_size, operation_type = SCALING_OPERATIONS[operation_name]
+            if algorithm not in AVAILABLE_ALGORITHMS:
+                self._print(f"⚠️ AVISO: {algorithm} não está disponível no sistema.")
+                continue
+            
+            self._print(f"\nTestando {operation_name}...")
+            try:
+                # Calibra o número de operações para ~SCALING_TARGET_SECONDS com 1 worker
+                operation = get_scaling_operation(operation_name)
+                calibration_start = time.perf_counter()
+                for _ in range(10):
+                    operation()
+                per_op_seconds = (time.perf_counter() - calibration_start) / 10
+                ops_per_worker = max(10, int(self.SCALING_TARGET_SECONDS / max(per_op_seconds, 1e-9)))
+                
+                throughput = {"thread": {}, "process": {}}
+                for workers in range(1, max_workers + 1):
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        (throughput["thread"][workers], thread_elapsed, thread_energy,
+                         thread_histogram) = self.measure_pool_throughput(executor, operation_name, workers, ops_per_worker)
+                    with ProcessPoolExecutor(max_workers=workers) as executor:
+                        (throughput["process"][workers], process_elapsed, process_energy,
+                         process_histogram) = self.measure_pool_throughput(executor, operation_name, workers, ops_per_worker)
+                    
+                    for mode, elapsed, energy_values, histogram in (
+                            ("thread", thread_elapsed, thread_energy, thread_histogram),
+                            ("process", process_elapsed, process_energy, process_histogram)):
+                        result = BenchmarkResult()
+                        result.algorithm = algorithm
+                        result.key_size = key_size
+                        result.operation_type = operation_type
+                        result.data_size_bytes = SCALING_MESSAGE_SIZE if operation_type != "Key Exchange" else 32
+                        result.processes_data = operation_type != "Key Exchange"
+                        result.iterations = ops_per_worker * workers
+                        result.execution_time_ms = histogram.summary()["mean_ms"]
+                        result.timestamp = datetime.datetime.now()
+                        result.concurrency_mode = mode
+                        result.workers = workers
+                        result.throughput_ops = throughput[mode][workers]
+                        result.latency_histogram = histogram
+                        self.apply_energy(result, energy_values)
+                        self.add_result(result)
+                
+                self.print_scaling_table(operation_name, throughput)
+            except Exception as ex:
+                self._print(f"Erro durante benchmark de escalonamento de {operation_name}: {str(ex)}")
+        
+        results_count_after = len(self.results)
+        self._print(f"\nTotal de resultados de escalonamento adicionados: {results_count_after - results_count_before}")
+
+    def print_scaling_table(self, operation_name, throughput):
+        """Exibe vazão, speedup e contenção de threads em relação a processos"""
+        thread_base = throughput["thread"][1]
+        process_base = throughput["process"][1]
+        
+        header = (f"{'Workers':>7} {'Threads (ops/s)':>16} {'Speedup':>8} "
+                  f"{'Processos (ops/s)':>18} {'Speedup':>8} {'Contenção':>10}")
+        self._print(f"\n{operation_name}:")
+        self._print(header)
+        self._print("-" * len(header))
+        for workers in sorted(throughput["thread"]):
+            thread_ops = throughput["thread"][workers]
+            process_ops = throughput["process"][workers]
+            # Contenção: fração da vazão dos processos perdida ao usar threads
+            contention = 1 - thread_ops / process_ops if process_ops > 0 else 0.0
+            self._print(f"{workers:>7} {thread_ops:>16.1f} {thread_ops / thread_base:>8.2f} "
+                  f"{process_ops:>18.1f} {process_ops / process_base:>8.2f} {contention * 100:>9.1f}%")
+        
+        max_workers = max(throughput["thread"])
+        if max_workers > 1:
+            thread_speedup = throughput["thread"][max_workers] / thread_base
+            process_speedup = throughput["process"][max_workers] / process_base
+            if thread_speedup >= 0.8 * process_speedup:
+                self._print("Conclusão: threads escalam como processos (OpenSSL libera o GIL) → workers com threads")
+            else:
+                self._print("Conclusão: threads escalam menos que processos (contenção no GIL) → workers multiprocesso")
+
+    # ==== Chaves reutilizáveis entre benchmarks ====
+
+    def get_or_generate_private_key(self, algorithm, key_size):
+        """
+        Retorna a última chave gerada pelos benchmarks de geração de chaves para o
+        algoritmo/tamanho, gerando (e guardando) uma nova se ainda não existir
+        """
+        if algorithm == "RSA":
+            if getattr(self, '_last_rsa_keys', {}).get(key_size) is None:
+                if not hasattr(self, '_last_rsa_keys'):
+                    self._last_rsa_keys = {}
+                self._last_rsa_keys[key_size] = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+            return self._last_rsa_keys[key_size]
+        if algorithm in self.NIST_CURVE_NAMES:
+            if getattr(self, '_last_ecdsa_keys', {}).get(algorithm) is None:
+                if not hasattr(self, '_last_ecdsa_keys'):
+                    self._last_ecdsa_keys = {}
+                self._last_ecdsa_keys[algorithm] = ec.generate_private_key(self.get_nist_curves()[algorithm])
+            return self._last_ecdsa_keys[algorithm]
+        if algorithm == "Ed25519":
+            if getattr(self, '_last_ed25519_private_key', None) is None:
+                self._last_ed25519_private_key = ed25519.Ed25519PrivateKey.generate()
+            return self._last_ed25519_private_key
+        if algorithm == "Ed448":
+            if getattr(self, '_last_ed448_private_key', None) is None:
+                self._last_ed448_private_key = ed448.Ed448PrivateKey.generate()
+            return self._last_ed448_private_key
+        raise ValueError(f"Algoritmo sem suporte para geração de chaves: {algorithm}")
+
+    # ==== Handshakes TLS em loopback ====
+
+    def measure_tls_handshakes(self, port, cert_path, workers, duration, resume):
+        """
+        Mede handshakes/s agregados com `workers` processos clientes simultâneos.
+        Com resume=True, vazão e latência consideram apenas os handshakes de fato
+        retomados (session_reused); os completos (como o primeiro de cada cliente)
+        ficam de fora e são apenas contados.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_tls_client_worker, port, cert_path, duration, resume)
+                       for _ in range(workers)]
+            outcomes = [future.result() for future in futures]
+        
+        handshakes = sum(outcome[0] for outcome in outcomes)
+        resumed = sum(outcome[1] for outcome in outcomes)
+        elapsed = max(outcome[2] for outcome in outcomes)
+        if resume:
+            measured = resumed
+            mean_latency_ms = sum(outcome[4] * 1000 / max(outcome[1], 1) for outcome in outcomes) / workers
+        else:
+            measured = handshakes
+            mean_latency_ms = sum(outcome[2] * 1000 / max(outcome[0], 1) for outcome in outcomes) / workers
+        return measured / elapsed, mean_latency_ms, handshakes, resumed, outcomes[0][3]
+
+    def run_tls_handshake_benchmark(self, max_workers=None, duration=None):
+        """
+        Sobe servidores TLS locais (127.0.0.1) com certificados gerados para cada tipo
+        de chave suportado e mede handshakes completos e retomados por segundo com
+        1..N processos clientes (e o mesmo número de processos servidores).
+        """
+        import socket
+        import tempfile
+        import multiprocessing
+        
+        max_workers = max_workers or self.use_cores
+        duration = duration or self.TLS_MEASURE_SECONDS
+        
+        self._print("\n===== Benchmark de Handshake TLS (loopback) =====")
+        if "fork" not in multiprocessing.get_all_start_methods():
+            self._print("⚠️ AVISO: o benchmark TLS requer processos com fork (Linux/macOS).")
+            return
+        fork_context = multiprocessing.get_context("fork")
+        self._print(f"Workers: 1..{max_workers} | Duração por medição: {duration:.1f}s")
+        self.stabilize_system()
+        self.limit_cpu_cores()
+        
+        results_count_before = len(self.results)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for algorithm, key_size in self.TLS_KEY_TYPES:
+                label = f"{algorithm}-{key_size}" if algorithm == "RSA" else algorithm
+                self._print(f"\nTestando TLS com certificado {label}...")
+                if algorithm not in AVAILABLE_ALGORITHMS:
+                    self._print(f"⚠️ AVISO: {algorithm} não está disponível no sistema.")
+                    continue
+                
+                servers = []
+                listen_socket = None
+                try:
+                    # Certificado autoassinado para a chave do benchmark de geração de chaves
+                    private_key = self.get_or_generate_private_key(algorithm, key_size)
+                    certificate = build_self_signed_certificate(private_key)
+                    cert_path = os.path.join(temp_dir, f"{label}.crt")
+                    key_path = os.path.join(temp_dir, f"{label}.key")
+                    with open(cert_path, "wb") as cert_file:
+                        cert_file.write(certificate.public_bytes(serialization.Encoding.PEM))
+                    with open(key_path, "wb") as key_file:
+                        key_file.write(private_key.private_bytes(serialization.Encoding.PEM,
+                                                                 serialization.PrivateFormat.PKCS8,
+                                                                 serialization.NoEncryption()))
                     
-                    # Formatação numérica para o resumo
-                    if col_idx >= 3 and col_idx <= 6:  # Colunas de tempo e memória
-                        cell.number_format = '0.000000'
-                    elif col_idx == 7:  # CPU
-                        cell.number_format = '0.000'
-            
-            # === FREEZAR PAINÉIS ===
-            ws.freeze_panes = f'A{data_start_row}'
-            
-            # Salvar arquivo
-            wb.save(filename)
+                    # Socket de escuta e contexto TLS (chaves de ticket) compartilhados
+                    # pelos processos servidores (pré-fork)
+                    server_context = build_tls_server_context(cert_path, key_path)
+                    listen_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    listen_socket.bind(("127.0.0.1", 0))
+                    listen_socket.listen(128)
+                    port = listen_socket.getsockname()[1]
                     
-            print(f"Resultados exportados para {filename} com sucesso!")
-            print(f"Total de resultados exportados: {len(self.results)}")
+                    for workers in range(1, max_workers + 1):
+                        while len(servers) < workers:
+                            server = fork_context.Process(target=run_tls_server_worker,
+                                                          args=(listen_socket, server_context), daemon=True)
+                            server.start()
+                            servers.append(server)
+                        
+                        for resume in (False, True):
+                            handshakes_per_second, latency_ms, handshakes, resumed, tls_version = \
+                                self.measure_tls_handshakes(port, cert_path, workers, duration, resume)
+                            
+                            result = BenchmarkResult()
+                            result.algorithm = f"TLS {label}"
+                            result.key_size = key_size
+                            result.operation_type = "TLS Handshake (resumed)" if resume else "TLS Handshake (full)"
+                            result.iterations = resumed if resume else handshakes
+                            result.execution_time_ms = latency_ms
+                            result.timestamp = datetime.datetime.now()
+                            result.concurrency_mode = "process"
+                            result.workers = workers
+                            result.throughput_ops = handshakes_per_second
+                            result.notes = f"{tls_version}; {resumed}/{handshakes} sessões retomadas"
+                            if resume and resumed < handshakes:
+                                result.notes += (f"; {handshakes - resumed} handshakes completos excluídos "
+                                                 f"da vazão e da latência")
+                            if resume and not resumed:
+                                result.notes += "; ⚠️ nenhuma sessão retomada"
+                            self.add_result(result)
+                            
+                            self._print(f"- {workers} workers, {'retomado' if resume else 'completo'}: "
+                                  f"{handshakes_per_second:.1f} handshakes/s, {latency_ms:.4f} ms/handshake "
+                                  f"({tls_version}, {resumed}/{handshakes} retomados)")
+                except Exception as ex:
+                    self._print(f"Erro durante benchmark TLS de {label}: {str(ex)}")
+                finally:
+                    for server in servers:
+                        server.terminate()
+                        server.join()
+                    if listen_socket is not None:
+                        listen_socket.close()
+        
+        results_count_after = len(self.results)
+        self._print(f"\nTotal de resultados de TLS adicionados: {results_count_after - results_count_before}")
+
+    # ==== Certificados X.509 e CSRs (autoridade certificadora interna) ====
+
+    def run_x509_benchmark(self, iterations=None):
+        """
+        Mede, por algoritmo e tamanho de chave, o ciclo de uma AC interna: geração de
+        CSR, validação da CSR e emissão do certificado, serialização, parsing e
+        verificação da cadeia (folha → intermediária → raiz). Reporta certificados/s
+        por núcleo (as medições são de um único processo).
+        """
+        iterations = max(iterations or self.iterations, self.X509_ITERATIONS)
+        
+        self._print("\n===== Benchmark de Certificados X.509 / CSR =====")
+        self._print(f"Iterações por operação: {iterations}")
+        self.stabilize_system()
+        self.limit_cpu_cores()
+        
+        results_count_before = len(self.results)
+        
+        for algorithm, key_size in self.X509_KEY_TYPES:
+            label = f"{algorithm}-{key_size}" if algorithm == "RSA" else algorithm
+            self._print(f"\nTestando X.509 com {label}...")
+            if algorithm not in AVAILABLE_ALGORITHMS:
+                self._print(f"⚠️ AVISO: {algorithm} não está disponível no sistema.")
+                continue
             
-            # Mostrar contagem por algoritmo
-            algorithm_counts = {}
-            for result in self.results:
-                algorithm_counts[result.algorithm] = algorithm_counts.get(result.algorithm, 0) + 1
+            try:
+                # Hierarquia: raiz → intermediária (emissora) com chaves do mesmo tipo
+                subject_key = self.get_or_generate_private_key(algorithm, key_size)
+                root_key = self.generate_private_key_like(subject_key)
+                root_certificate = build_self_signed_certificate(root_key, f"Benchmark Root {label}")
+                intermediate_key = self.generate_private_key_like(subject_key)
+                intermediate_certificate = issue_certificate(
+                    build_certificate_request(intermediate_key, f"Benchmark Issuing CA {label}"),
+                    root_certificate, root_key, ca=True)
                 
-            print("\nDetalhamento dos resultados exportados:")
-            for algo, count in algorithm_counts.items():
-                print(f"- {algo}: {count} resultados")
-            
-            print(f"\nRecursos do arquivo XLSX:")
-            print("- Formatação condicional nos tempos de execução")
-            print("- Cores alternadas nas linhas")
-            print("- Resumo estatístico por algoritmo")
-            print("- Colunas ajustadas automaticamente")
-            print("- 6 casas decimais para medições de precisão")
-        
-        except Exception as ex:
-            print(f"Erro ao exportar resultados: {str(ex)}")
-            print("Certifique-se de que a biblioteca openpyxl está instalada: pip install openpyxl")
+                csr = build_certificate_request(subject_key, "service.benchmark.local")
+                
+                def sign_certificate():
+                    # A AC valida a assinatura da CSR antes de emitir
+                    if not csr.is_signature_valid:
+                        raise ValueError("CSR com assinatura inválida")
+                    return issue_certificate(csr, intermediate_certificate, intermediate_key)
+                
+                certificate = sign_certificate()
+                der_bytes = certificate.public_bytes(serialization.Encoding.DER)
+                
+                def verify_chain():
+                    leaf = x509.load_der_x509_certificate(der_bytes)
+                    leaf.verify_directly_issued_by(intermediate_certificate)
+                    intermediate_certificate.verify_directly_issued_by(root_certificate)
+                
+                def issue_full():
+                    # Ciclo completo de emissão: validar CSR, assinar e serializar
+                    return sign_certificate().public_bytes(serialization.Encoding.DER)
+                
+                steps = [
+                    ("CSR Generation", 0, lambda: build_certificate_request(subject_key, "service.benchmark.local")),
+                    ("Certificate Signing", 0, sign_certificate),
+                    ("Certificate Serialization", len(der_bytes),
+                     lambda: (certificate.public_bytes(serialization.Encoding.DER),
+                              certificate.public_bytes(serialization.Encoding.PEM))),
+                    ("Certificate Parsing", len(der_bytes), lambda: x509.load_der_x509_certificate(der_bytes)),
+                    ("Chain Verification", len(der_bytes), verify_chain),
+                    ("Certificate Issuance", len(der_bytes), issue_full)
+                ]
+                
+                for operation_type, data_size, operation in steps:
+                    result = BenchmarkResult()
+                    result.algorithm = f"X509 {label}"
+                    result.key_size = key_size
+                    result.operation_type = operation_type
+                    result.data_size_bytes = data_size
+                    result.processes_data = operation_type in ("Certificate Serialization", "Certificate Parsing")
+                    self.measure_operation(result, operation, iterations)
+                    if result.execution_time_ms > 0:
+                        result.throughput_ops = 1000.0 / result.execution_time_ms
+                    self.add_result(result)
+                    self._print(f"- {operation_type:<26} {result.execution_time_ms:>10.4f} ms "
+                          f"({result.throughput_ops or 0:>10.1f} /s por núcleo)")
+            except Exception as ex:
+                self._print(f"Erro durante benchmark X.509 de {label}: {str(ex)}")
         
-    # Implementações dos métodos de benchmark
+        results_count_after = len(self.results)
+        self._print(f"\nTotal de resultados de X.509 adicionados: {results_count_after - results_count_before}")
 
-    # ==== Ed25519 / X25519 (Curve25519) ====
+    @staticmethod
+    def generate_private_key_like(private_key):
+        """Gera uma nova chave privada do mesmo tipo e tamanho da chave informada"""
+        if isinstance(private_key, rsa.RSAPrivateKey):
+            return rsa.generate_private_key(public_exponent=65537, key_size=private_key.key_size)
+        if isinstance(private_key, ec.EllipticCurvePrivateKey):
+            return ec.generate_private_key(private_key.curve)
+        if isinstance(private_key, ed25519.Ed25519PrivateKey):
+            return ed25519.Ed25519PrivateKey.generate()
+        if isinstance(private_key, ed448.Ed448PrivateKey):
+            return ed448.Ed448PrivateKey.generate()
+        raise ValueError(f"Tipo de chave sem suporte: {type(private_key).__name__}")
 
-    def benchmark_ed25519_keygen(self):
-        """Realiza o benchmark de geração de chaves Ed25519"""
+    # ==== Criptografia pós-quântica e troca de chaves híbrida ====
+
+    def measure_pqc_operation(self, algorithm, key_size, operation_type, data_size, operation, iterations,
+                              processes_data=False):
+        """Mede uma operação pós-quântica e registra o resultado"""
         result = BenchmarkResult()
-        result.algorithm = "Ed25519"
-        result.key_size = 256  # Ed25519 tem tamanho fixo de 256 bits
-        result.operation_type = "Key Generation"
-        result.data_size_bytes = 0  # Não aplicável para geração de chaves
-        
-        # Reset da flag de timeout
-        self.timeout_occurred = False
-        
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
+        result.algorithm = algorithm
+        result.key_size = key_size
+        result.operation_type = operation_type
+        result.data_size_bytes = data_size
+        result.processes_data = processes_data
+        value = self.measure_operation(result, operation, iterations)
+        if result.execution_time_ms > 0:
+            result.throughput_ops = 1000.0 / result.execution_time_ms
+        self.add_result(result)
+        self._print(f"- {algorithm + ' ' + operation_type:<34} {result.execution_time_ms:>10.4f} ms")
+        return value
+
+    def run_pqc_benchmark(self, iterations=None):
+        """
+        Mede ML-KEM (geração de chaves, encapsulamento, desencapsulamento), ML-DSA
+        (geração de chaves, assinatura, verificação) e a troca híbrida X25519 + ML-KEM,
+        comparada à troca X25519 clássica. Também lista os tamanhos de chaves,
+        ciphertexts e assinaturas. Pula os algoritmos que o backend não oferece.
+        """
+        iterations = max(iterations or self.iterations, self.PQC_ITERATIONS)
         
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
+        self._print("\n===== Benchmark Pós-Quântico (ML-KEM / ML-DSA) e Híbrido =====")
+        if not PQC_KEM_CLASSES and not PQC_SIGNATURE_CLASSES:
+            self._print("⚠️ AVISO: a versão instalada da cryptography/OpenSSL não oferece ML-KEM nem ML-DSA.")
+            return
+        self._print(f"Iterações por operação: {iterations}")
+        self.stabilize_system()
+        self.limit_cpu_cores()
         
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
+        results_count_before = len(self.results)
+        sizes = []
         
-        # Executar geração de chave e medir tempo
-        start_time = time.time()
+        for name, (private_class, public_class) in PQC_KEM_CLASSES.items():
+            self._print(f"\nTestando {name}...")
+            try:
+                parameter_set = int(name.rsplit("-", 1)[1])
+                private_key = private_class.generate()
+                public_key = private_key.public_key()
+                secret, ciphertext = public_key.encapsulate()
+                public_size = len(public_key.public_bytes_raw())
+                
+                self.measure_pqc_operation(name, parameter_set, "Key Generation", 0,
+                                           private_class.generate, iterations)
+                self.measure_pqc_operation(name, parameter_set, "Encapsulation", public_size,
+                                           public_key.encapsulate, iterations)
+                self.measure_pqc_operation(name, parameter_set, "Decapsulation", len(ciphertext),
+                                           lambda: private_key.decapsulate(ciphertext), iterations)
+                sizes.append((name, public_size, len(private_key.private_bytes_raw()),
+                              f"ciphertext {len(ciphertext)}, segredo {len(secret)}"))
+            except Exception as ex:
+                self._print(f"Erro durante benchmark de {name}: {str(ex)}")
         
-        try:
-            # Gerar par de chaves Ed25519
-            if not self.timeout_occurred:
-                private_key = ed25519.Ed25519PrivateKey.generate()
+        for name, (private_class, public_class) in PQC_SIGNATURE_CLASSES.items():
+            self._print(f"\nTestando {name}...")
+            try:
+                parameter_set = int(name.rsplit("-", 1)[1])
+                data = self.test_data
+                private_key = private_class.generate()
                 public_key = private_key.public_key()
+                signature = private_key.sign(data)
                 
-        except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
-            
-        end_time = time.time()
+                self.measure_pqc_operation(name, parameter_set, "Key Generation", 0,
+                                           private_class.generate, iterations)
+                self.measure_pqc_operation(name, parameter_set, "Signing", len(data),
+                                           lambda: private_key.sign(data), iterations, processes_data=True)
+                self.measure_pqc_operation(name, parameter_set, "Verification", len(data),
+                                           lambda: public_key.verify(signature, data), iterations,
+                                           processes_data=True)
+                sizes.append((name, len(public_key.public_bytes_raw()), len(private_key.private_bytes_raw()),
+                              f"assinatura {len(signature)}"))
+            except Exception as ex:
+                self._print(f"Erro durante benchmark de {name}: {str(ex)}")
         
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
+        # Troca híbrida X25519 + ML-KEM (cliente e servidor no mesmo processo) vs. X25519 clássica
+        if "ML-KEM-768" in PQC_KEM_CLASSES and "X25519" in AVAILABLE_ALGORITHMS:
+            self._print("\nTestando troca híbrida X25519MLKEM768...")
+            try:
+                kem_classes = PQC_KEM_CLASSES["ML-KEM-768"]
+                client_secret, server_secret, wire_bytes = run_hybrid_handshake(kem_classes)
+                if client_secret != server_secret:
+                    raise ValueError("segredos do cliente e do servidor divergem")
+                
+                def classic_handshake():
+                    client_private = x25519.X25519PrivateKey.generate()
+                    server_private = x25519.X25519PrivateKey.generate()
+                    server_private.exchange(client_private.public_key())
+                    return client_private.exchange(server_private.public_key())
+                
+                self.measure_pqc_operation("X25519", 256, "Handshake", 64, classic_handshake, iterations)
+                classic_ms = self.results[-1].execution_time_ms
+                self.measure_pqc_operation("X25519MLKEM768", 768, "Hybrid Handshake", wire_bytes,
+                                           lambda: run_hybrid_handshake(kem_classes), iterations)
+                hybrid_ms = self.results[-1].execution_time_ms
+                self._print(f"Bytes trafegados: {wire_bytes} (híbrido) vs 64 (X25519)")
+                if classic_ms > 0:
+                    self._print(f"Custo da troca híbrida: {hybrid_ms / classic_ms:.2f}x a troca X25519")
+            except Exception as ex:
+                self._print(f"Erro durante benchmark da troca híbrida: {str(ex)}")
         
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
+        if sizes:
+            # A chave privada é serializada como semente (FIPS 203/204)
+            self._print(f"\n{'Algoritmo':<12} {'Pública (B)':>12} {'Semente (B)':>12}  Outros (B)")
+            for name, public_size, private_size, extra in sizes:
+                self._print(f"{name:<12} {public_size:>12} {private_size:>12}  {extra}")
         
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
+        results_count_after = len(self.results)
+        self._print(f"\nTotal de resultados pós-quânticos adicionados: {results_count_after - results_count_before}")
+
+    # ==== Derivação de chaves e hash de senhas (KDF) ====
+
+    def run_kdf_benchmark(self, configs=None, max_workers=None):
+        """
+        Mede latência, pico de memória e hashes/s (1 núcleo e N processos) para HKDF,
+        PBKDF2, scrypt e Argon2id. Configurações cuja memória de trabalho excede o
+        limite de memória são puladas, assim como as acima de KDF_MEMORY_CAP_MB sem
+        kdf_large_memory, e o número de workers paralelos é reduzido para que N
+        derivações simultâneas caibam no limite.
+        """
+        from concurrent.futures import ProcessPoolExecutor
         
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
+        configs = configs or list(KDF_CONFIGS)
+        max_workers = max_workers or self.use_cores
+        budget_bytes = self.get_available_memory_gb() * (1024 ** 3)
         
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
+        self._print("\n===== Benchmark de Derivação de Chaves (KDF) =====")
+        self._print(f"Orçamento de memória: {budget_bytes / (1024 * 1024):.0f} MB | Workers: até {max_workers}")
+        self.stabilize_system()
+        self.limit_cpu_cores()
+        
+        results_count_before = len(self.results)
+        summary = []
+        
+        for name in configs:
+            kind, _ = KDF_CONFIGS[name]
+            if kind not in AVAILABLE_ALGORITHMS:
+                self._print(f"⚠️ AVISO: {kind} não está disponível no sistema.")
+                continue
             
-        return result
+            memory_bytes = kdf_memory_bytes(name)
+            if memory_bytes > self.KDF_MEMORY_CAP_MB * 1024 * 1024 and not self.kdf_large_memory:
+                self._print(f"\nPulando {name}: exige {memory_bytes / (1024 * 1024):.0f} MB, acima de "
+                      f"{self.KDF_MEMORY_CAP_MB} MB (use --kdf-large-memory para incluir)")
+                continue
+            if memory_bytes > budget_bytes:
+                self._print(f"\nPulando {name}: exige {memory_bytes / (1024 * 1024):.0f} MB, "
+                      f"acima do limite de {budget_bytes / (1024 * 1024):.0f} MB")
+                continue
+            
+            self._print(f"\nTestando {name}...")
+            try:
+                operation = build_kdf_operation(name)
+                
+                # Calibra as iterações para ~KDF_TARGET_SECONDS
+                calibration_start = time.perf_counter()
+                operation()
+                per_op_seconds = time.perf_counter() - calibration_start
+                iterations = max(self.iterations,
+                                 min(1000, int(self.KDF_TARGET_SECONDS / max(per_op_seconds, 1e-9))))
+                
+                result = BenchmarkResult()
+                result.algorithm = name
+                result.key_size = KDF_OUTPUT_LENGTH * 8
+                result.operation_type = "Key Derivation"
+                result.data_size_bytes = len(KDF_PASSWORD)
+                
+                rss_before = psutil.Process(os.getpid()).memory_info().rss
+                peak_supported = reset_peak_rss()
+                self.measure_operation(result, operation, iterations)
+                peak_rss = read_peak_rss_bytes() if peak_supported else None
+                if peak_rss is not None:
+                    # O RSS final não reflete a memória de trabalho, que é liberada ao fim da derivação
+                    result.memory_usage_mb = max(0, peak_rss - rss_before) / (1024.0 * 1024.0)
+                if memory_bytes:
+                    # O alocador pode reaproveitar memória já residente; registra também a teórica
+                    result.notes = f"Memória de trabalho teórica: {memory_bytes / (1024 * 1024):.1f} MB"
+                if result.execution_time_ms > 0:
+                    result.throughput_ops = 1000.0 / result.execution_time_ms
+                self.add_result(result)
+                
+                # Vazão com N processos, limitada pela memória de N derivações simultâneas
+                workers = max_workers
+                if memory_bytes:
+                    workers = max(1, min(workers, int(budget_bytes // memory_bytes)))
+                parallel_ops = None
+                if workers > 1:
+                    ops_per_worker = max(1, int(self.KDF_TARGET_SECONDS / max(per_op_seconds, 1e-9)))
+                    with ProcessPoolExecutor(max_workers=workers) as executor:
+                        parallel_ops, elapsed, energy_values, histogram = self.measure_pool_throughput(
+                            executor, name, workers, ops_per_worker, worker=run_kdf_worker)
+                    
+                    parallel_result = BenchmarkResult()
+                    parallel_result.algorithm = name
+                    parallel_result.key_size = KDF_OUTPUT_LENGTH * 8
+                    parallel_result.operation_type = "Key Derivation"
+                    parallel_result.data_size_bytes = len(KDF_PASSWORD)
+                    parallel_result.iterations = ops_per_worker * workers
+                    parallel_result.execution_time_ms = histogram.summary()["mean_ms"]
+                    if memory_bytes:
+                        # Pico não medido nos workers; registra a memória teórica das N derivações
+                        parallel_result.notes = (f"Memória de trabalho teórica: {memory_bytes * workers / (1024 * 1024):.1f} MB "
+                                                 f"({workers} × {memory_bytes / (1024 * 1024):.1f} MB)")
+                    parallel_result.timestamp = datetime.datetime.now()
+                    parallel_result.concurrency_mode = "process"
+                    parallel_result.workers = workers
+                    parallel_result.throughput_ops = parallel_ops
+                    parallel_result.latency_histogram = histogram
+                    self.apply_energy(parallel_result, energy_values)
+                    self.add_result(parallel_result)
+                
+                summary.append((name, result, workers, parallel_ops))
+            except Exception as ex:
+                self._print(f"Erro durante benchmark de {name}: {str(ex)}")
+        
+        if summary:
+            header = (f"{'Configuração':<26} {'Latência (ms)':>14} {'Pico (MB)':>10} {'Teórica (MB)':>13} "
+                      f"{'Hashes/s (1)':>13} {'Workers':>8} {'Hashes/s (N)':>13}")
+            self._print("\n" + header)
+            self._print("-" * len(header))
+            for name, result, workers, parallel_ops in summary:
+                parallel_text = f"{parallel_ops:>13.1f}" if parallel_ops else f"{'-':>13}"
+                self._print(f"{name:<26} {result.execution_time_ms:>14.2f} {result.memory_usage_mb:>10.1f} "
+                      f"{kdf_memory_bytes(name) / (1024 * 1024):>13.1f} "
+                      f"{result.throughput_ops or 0:>13.1f} {workers:>8} {parallel_text}")
         
-    def benchmark_ed25519_sign(self, data):
-        """Realiza o benchmark de assinatura Ed25519"""
-        result = BenchmarkResult()
-        result.algorithm = "Ed25519"
-        result.key_size = 256  # Ed25519 tem tamanho fixo de 256 bits
-        result.operation_type = "Signing"
-        result.data_size_bytes = len(data)
+        results_count_after = len(self.results)
+        self._print(f"\nTotal de resultados de KDF adicionados: {results_count_after - results_count_before}")
+
+    # ==== Tokens JWT/JWS ====
+
+    def run_jwt_benchmark(self, iterations=None):
+        """
+        Mede tokens JWS compactos assinados e verificados por segundo para EdDSA,
+        ES256/384/512, RS256 e PS256, incluindo a codificação JSON/base64url e a
+        conversão DER ↔ r||s das assinaturas ECDSA. A codificação sem assinatura é
+        medida separadamente para quantificar seu custo.
+        """
+        iterations = max(iterations or self.iterations, self.JWT_ITERATIONS)
         
-        # Gerar chave privada Ed25519 para assinatura
-        private_key = ed25519.Ed25519PrivateKey.generate()
+        self._print("\n===== Benchmark de Tokens JWT/JWS =====")
+        self._print(f"Iterações por operação: {iterations}")
+        self.stabilize_system()
+        self.limit_cpu_cores()
         
-        # Reset da flag de timeout
-        self.timeout_occurred = False
+        results_count_before = len(self.results)
+        claims = build_jwt_claims()
         
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
+        for alg, (algorithm, key_size, _) in JWS_ALGORITHMS.items():
+            self._print(f"\nTestando JWT {alg}...")
+            if algorithm not in AVAILABLE_ALGORITHMS:
+                self._print(f"⚠️ AVISO: {algorithm} não está disponível no sistema.")
+                continue
+            
+            try:
+                private_key = self.get_or_generate_private_key(algorithm, key_size)
+                public_key = private_key.public_key()
+                token = sign_jws(alg, private_key, claims)
+                
+                steps = [
+                    ("Token Encoding", lambda: jws_signing_input(alg, claims)),
+                    ("Token Signing", lambda: sign_jws(alg, private_key, claims)),
+                    ("Token Verification", lambda: verify_jws(alg, public_key, token))
+                ]
+                for operation_type, operation in steps:
+                    result = BenchmarkResult()
+                    result.algorithm = f"JWT {alg}"
+                    result.key_size = key_size
+                    result.operation_type = operation_type
+                    result.data_size_bytes = len(token)
+                    result.processes_data = True
+                    self.measure_operation(result, operation, iterations)
+                    if result.execution_time_ms > 0:
+                        result.throughput_ops = 1000.0 / result.execution_time_ms
+                    self.add_result(result)
+                    self._print(f"- {operation_type:<20} {result.execution_time_ms:>10.4f} ms "
+                          f"({result.throughput_ops or 0:>10.1f} tokens/s por núcleo, token de {len(token)} bytes)")
+            except Exception as ex:
+                self._print(f"Erro durante benchmark JWT {alg}: {str(ex)}")
         
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
+        results_count_after = len(self.results)
+        self._print(f"\nTotal de resultados de JWT adicionados: {results_count_after - results_count_before}")
+
+    # ==== Simulação de serviço asyncio com carga em malha aberta ====
+
+    async def _simulate_async_load(self, executor, operations, target_rps, duration, rng):
+        """
+        Gera chegadas de Poisson na taxa alvo por `duration` segundos, independentemente
+        das respostas (malha aberta), e executa cada requisição no executor.
+        Retorna uma lista de (latência ponta a ponta, tempo de serviço, instante de término).
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        
+        async def handle_request(scheduled_time):
+            service_time = await loop.run_in_executor(executor, run_request_operations, operations)
+            end_time = loop.time()
+            # A latência é medida a partir do instante agendado, não do envio efetivo,
+            # para não esconder atrasos do próprio gerador de carga
+            return end_time - scheduled_time, service_time, end_time
+        
+        start_time = loop.time()
+        next_arrival = start_time
+        requests = []
+        while next_arrival < start_time + duration:
+            delay = next_arrival - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            requests.append(asyncio.ensure_future(handle_request(next_arrival)))
+            next_arrival += rng.expovariate(target_rps)
+        
+        records = await asyncio.gather(*requests)
+        return records, start_time
+
+    def measure_async_load_step(self, executor, operations, target_rps, duration, rng):
+        """Executa um patamar de carga e resume latências, fila e vazão alcançada"""
+        import asyncio
+        records, start_time = asyncio.run(
+            self._simulate_async_load(executor, operations, target_rps, duration, rng))
+        
+        latencies_ms = [latency * 1000 for latency, _, _ in records]
+        queueing_ms = [(latency - service) * 1000 for latency, service, _ in records]
+        elapsed = max(end for _, _, end in records) - start_time if records else duration
+        
+        # A latência medida desde o instante agendado já corrige a omissão coordenada;
+        # o tempo de serviço é a variante sem correção (o que um gerador em malha fechada veria)
+        response_histogram = LatencyHistogram()
+        service_histogram = LatencyHistogram()
+        for latency, service, _ in records:
+            response_histogram.record(latency * 1e9)
+            service_histogram.record(service * 1e9)
+        
+        return {
+            "response_histogram": response_histogram,
+            "service_histogram": service_histogram,
+            "service_p99_ms": service_histogram.value_at_percentile(99) / 1e6,
+            "target_rps": target_rps,
+            "requests": len(records),
+            "achieved_rps": len(records) / elapsed if elapsed > 0 else 0.0,
+            "mean_ms": sum(latencies_ms) / len(latencies_ms) if latencies_ms else 0.0,
+            "p50_ms": percentile(latencies_ms, 50),
+            "p90_ms": percentile(latencies_ms, 90),
+            "p99_ms": percentile(latencies_ms, 99),
+            "p999_ms": percentile(latencies_ms, 99.9),
+            "max_ms": max(latencies_ms) if latencies_ms else 0.0,
+            "mean_queueing_ms": sum(queueing_ms) / len(queueing_ms) if queueing_ms else 0.0,
+            "mean_service_ms": (sum(latencies_ms) - sum(queueing_ms)) / len(records) if records else 0.0
+        }
+
+    def run_async_load_benchmark(self, operations=None, executor_kind="thread", slo_p99_ms=None,
+                                 target_rps=None, step_seconds=None, seed=None):
+        """
+        Simula um gateway asyncio que delega operações criptográficas a um executor
+        (threads ou processos). Com target_rps, mede um único patamar; caso contrário,
+        aumenta a carga até violar o SLO de p99 e refina por bisseção a vazão máxima
+        sustentável.
+        """
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+        
+        operations = operations or self.ASYNC_LOAD_OPERATIONS
+        slo_p99_ms = slo_p99_ms or self.ASYNC_SLO_P99_MS
+        step_seconds = step_seconds or self.ASYNC_STEP_SECONDS
+        rng = random.Random(seed)
+        workers = self.use_cores
+        request_name = " + ".join(operations)
+        
+        self._print("\n===== Simulação de Serviço asyncio (chegadas de Poisson) =====")
+        self._print(f"Requisição: {request_name}")
+        self._print(f"Executor: {executor_kind} com {workers} workers | SLO p99: {slo_p99_ms:.1f} ms | "
+              f"Patamar: {step_seconds:.1f}s")
+        self.stabilize_system()
+        self.limit_cpu_cores()
         
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
+        executor_class = ProcessPoolExecutor if executor_kind == "process" else ThreadPoolExecutor
+        steps = []
         
-        # Executar assinatura e medir tempo
-        start_time = time.time()
+        def run_step(rps):
+            step = self.measure_async_load_step(executor, operations, rps, step_seconds, rng)
+            step["slo_ok"] = step["p99_ms"] <= slo_p99_ms and step["achieved_rps"] >= 0.9 * rps
+            steps.append(step)
+            self._print(f"- {rps:>10.1f} req/s alvo: {step['achieved_rps']:>10.1f} req/s | "
+                  f"p50 {step['p50_ms']:.3f} ms | p99 {step['p99_ms']:.3f} ms "
+                  f"(sem correção {step['service_p99_ms']:.3f} ms) | "
+                  f"fila média {step['mean_queueing_ms']:.3f} ms | "
+                  f"{'OK' if step['slo_ok'] else 'SLO violado'}")
+            return step["slo_ok"]
         
         try:
-            # Assinar os dados
-            if not self.timeout_occurred:
-                signature = private_key.sign(data)
+            with executor_class(max_workers=workers) as executor:
+                # Aquece os workers e estima o tempo de serviço de uma requisição
+                list(executor.map(run_request_operations, [operations] * (workers * 4)))
+                service_time = min(executor.map(run_request_operations, [operations] * (workers * 4)))
                 
+                if target_rps:
+                    run_step(target_rps)
+                else:
+                    # Rampa geométrica a partir de 25% da capacidade teórica
+                    rps = max(1.0, 0.25 * workers / max(service_time, 1e-6))
+                    last_ok, first_failure = None, None
+                    while first_failure is None:
+                        if run_step(rps):
+                            last_ok = rps
+                            rps *= 1.5
+                        else:
+                            first_failure = rps
+                    
+                    # Bisseção entre o último patamar aprovado e o primeiro reprovado
+                    if last_ok is not None:
+                        low, high = last_ok, first_failure
+                        for _ in range(self.ASYNC_SEARCH_REFINEMENTS):
+                            middle = (low + high) / 2
+                            if run_step(middle):
+                                low = middle
+                            else:
+                                high = middle
+                        self._print(f"\nVazão máxima sustentável (p99 ≤ {slo_p99_ms:.1f} ms): {low:.1f} req/s")
+                    else:
+                        self._print("\n⚠️ AVISO: SLO violado já na carga inicial; reduza a carga ou aumente o SLO")
         except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
-            
-        end_time = time.time()
+            self._print(f"Erro durante a simulação asyncio: {str(ex)}")
+        
+        # Tamanho de chave comum às operações da requisição (0 se forem mistos) e
+        # mensagem assinada/verificada, se houver
+        key_sizes = {SCALING_OPERATIONS[name][1] for name in operations}
+        key_size = key_sizes.pop() if len(key_sizes) == 1 else 0
+        processes_data = any(SCALING_OPERATIONS[name][2] != "Key Exchange" for name in operations)
+        
+        for step in steps:
+            result = BenchmarkResult()
+            result.algorithm = "Async Service"
+            result.key_size = key_size
+            result.operation_type = request_name
+            result.data_size_bytes = SCALING_MESSAGE_SIZE if processes_data else 0
+            result.processes_data = processes_data
+            result.iterations = step["requests"]
+            # Média por requisição, como nos demais resultados; percentis ficam no histograma
+            result.execution_time_ms = step["mean_ms"]
+            result.timestamp = datetime.datetime.now()
+            result.concurrency_mode = f"asyncio+{executor_kind}"
+            result.workers = workers
+            result.throughput_ops = step["achieved_rps"]
+            result.latency_histogram = step["response_histogram"]
+            result.notes = (f"Alvo {step['target_rps']:.1f} req/s; p50 {step['p50_ms']:.3f} ms; "
+                            f"p90 {step['p90_ms']:.3f} ms; "
+                            f"p99 {step['p99_ms']:.3f} ms; p99.9 {step['p999_ms']:.3f} ms; "
+                            f"p99 sem correção de omissão coordenada {step['service_p99_ms']:.3f} ms; "
+                            f"máx {step['max_ms']:.3f} ms; fila média {step['mean_queueing_ms']:.3f} ms; "
+                            f"SLO {'OK' if step['slo_ok'] else 'violado'}")
+            self.add_result(result)
+        return steps
+
+    # ==== Linha de base e verificação de regressão ====
+
+    @staticmethod
+    def result_key(result):
+        """Retorna a chave (algoritmo, tamanho da chave, operação) usada para agrupar resultados"""
+        return f"{result.algorithm}|{result.key_size}|{result.operation_type}"
+
+    def collect_benchmark_samples(self, repetitions=None):
+        """
+        Executa o benchmark completo várias vezes e agrupa os tempos de execução
+        (em ms) por algoritmo, tamanho da chave e operação
+        """
+        repetitions = repetitions or self.REGRESSION_REPETITIONS
+        samples = {}
         
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
+        for repetition in range(repetitions):
+            self._print(f"\n===== Repetição {repetition + 1}/{repetitions} =====")
+            results_count_before = len(self.results)
+            self.run_complete_benchmark()
+            
+            for result in self.results[results_count_before:]:
+                # Resultados com timeout não representam o tempo real da operação
+                if result.notes.startswith("Timeout"):
+                    continue
+                samples.setdefault(self.result_key(result), []).append(result.execution_time_ms)
+                
+        return samples
+
+    def save_performance_baseline(self, filename, repetitions=None):
+        """Executa o benchmark e salva as amostras como linha de base em um arquivo JSON"""
+        samples = self.collect_benchmark_samples(repetitions)
+        
+        baseline = {
+            "schema_version": self.BASELINE_SCHEMA_VERSION,
+            "created_at": datetime.datetime.now().isoformat(),
+            "versions": get_crypto_library_versions(),
+            "environment_id": self.environment_id,
+            "environment": self.environment,
+            "config": {
+                "use_cores": self.use_cores,
+                "max_cores": self.max_cores,
+                "memory_limit_mb": self.memory_limit_mb,
+                "test_data_size_mb": self.test_data_size_mb,
+                "data_seed": self.data_seed,
+                "iterations": self.iterations
+            },
+            "samples": samples
+        }
         
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
+        try:
+            with open(filename, "w") as baseline_file:
+                json.dump(baseline, baseline_file, indent=2)
+            self._print(f"Linha de base salva em {filename} ({len(samples)} operações)")
+        except OSError as ex:
+            self._print(f"Erro ao salvar linha de base: {str(ex)}")
+            
+        return baseline
+
+    def save_run_manifest(self, filename, arguments, exit_code=0):
+        """
+        Salva o manifesto da execução (sementes, seleção, iterações e ambiente) em
+        JSON, permitindo reexecutá-la com --replay sobre os mesmos dados de teste
+        """
+        manifest = {
+            "schema_version": self.MANIFEST_SCHEMA_VERSION,
+            "created_at": datetime.datetime.now().isoformat(),
+            "data_seed": self.data_seed,
+            "test_data_sha256": self.test_data_sha256,
+            "arguments": {key: value for key, value in arguments.items() if key not in ("manifest", "replay")},
+            "config": {
+                "use_cores": self.use_cores,
+                "max_cores": self.max_cores,
+                "memory_limit_mb": self.memory_limit_mb,
+                "timeout_seconds": self.timeout_seconds,
+                "test_data_size_mb": self.test_data_size_mb,
+                "iterations": self.iterations
+            },
+            "startup_ms": getattr(self, "startup_timings", None),
+            "versions": get_crypto_library_versions(),
+            "environment_id": self.environment_id,
+            "environment": self.environment,
+            "results_count": len(self.results),
+            "exit_code": exit_code
+        }
         
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
+        try:
+            with open(filename, "w") as manifest_file:
+                json.dump(manifest, manifest_file, indent=2)
+            self._print(f"Manifesto da execução salvo em {filename}")
+        except OSError as ex:
+            self._print(f"Erro ao salvar manifesto: {str(ex)}")
         
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
+        return manifest
+
+    @staticmethod
+    def load_run_manifest(filename):
+        """Carrega um manifesto salvo por save_run_manifest"""
+        with open(filename) as manifest_file:
+            manifest = json.load(manifest_file)
+        if "arguments" not in manifest or "data_seed" not in manifest:
+            raise ValueError(f"Arquivo de manifesto inválido: {filename}")
+        return manifest
+
+    def check_replay_manifest(self, manifest):
+        """Avisa quando os dados de teste, as versões ou o ambiente diferem dos do manifesto"""
+        if manifest.get("test_data_sha256") != self.test_data_sha256:
+            self._print("⚠️ AVISO: os dados de teste diferem dos registrados no manifesto.")
+        if manifest.get("versions") != get_crypto_library_versions():
+            self._print(f"⚠️ AVISO: versões diferentes das do manifesto: {manifest.get('versions')}")
+        if manifest.get("environment_id") != self.environment_id:
+            self._print(f"⚠️ AVISO: ambiente diferente do manifesto "
+                  f"({manifest.get('environment_id')} → {self.environment_id}).")
+
+    @staticmethod
+    def load_performance_baseline(filename):
+        """Carrega uma linha de base salva por save_performance_baseline"""
+        with open(filename) as baseline_file:
+            baseline = json.load(baseline_file)
+        if "samples" not in baseline:
+            raise ValueError(f"Arquivo de linha de base inválido: {filename}")
+        return baseline
+
+    def compare_with_baseline(self, baseline_samples, current_samples,
+                              threshold_pct=None, noise_factor=None, alpha=None):
+        """
+        Compara as amostras atuais com as da linha de base.
         
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
+        Uma operação é considerada regressão quando o aumento da mediana excede a
+        tolerância (o maior valor entre threshold_pct e noise_factor vezes o ruído
+        relativo da linha de base, estimado pelo MAD) e o teste de Mann-Whitney
+        indica diferença significativa.
+        """
+        threshold_pct = self.REGRESSION_THRESHOLD_PCT if threshold_pct is None else threshold_pct
+        noise_factor = self.REGRESSION_NOISE_FACTOR if noise_factor is None else noise_factor
+        alpha = self.REGRESSION_ALPHA if alpha is None else alpha
+        
+        comparisons = []
+        for key in sorted(set(baseline_samples) | set(current_samples)):
+            algorithm, key_size, operation = key.split("|")
+            baseline = baseline_samples.get(key, [])
+            current = current_samples.get(key, [])
+            row = {
+                "algorithm": algorithm,
+                "key_size": int(key_size),
+                "operation": operation,
+                "baseline_median_ms": median(baseline) if baseline else None,
+                "current_median_ms": median(current) if current else None,
+                "change_pct": None,
+                "tolerance_pct": None,
+                "p_value": None,
+                "status": ""
+            }
             
-        # Armazenar a assinatura e a chave para uso em verificação
-        self._last_ed25519_signature = signature
-        self._last_ed25519_private_key = private_key
+            if not baseline:
+                row["status"] = "NOVO"
+            elif not current:
+                row["status"] = "AUSENTE"
+            else:
+                baseline_median = row["baseline_median_ms"]
+                # Ruído relativo da linha de base (MAD escalado para desvio padrão)
+                relative_noise = (1.4826 * median_absolute_deviation(baseline) / baseline_median
+                                  if baseline_median > 0 else 0.0)
+                tolerance = max(threshold_pct / 100.0, noise_factor * relative_noise)
+                change = (row["current_median_ms"] / baseline_median - 1.0) if baseline_median > 0 else 0.0
+                # Teste unilateral na direção da mudança observada
+                if change >= 0:
+                    p_value = mann_whitney_u_pvalue(baseline, current)
+                else:
+                    p_value = mann_whitney_u_pvalue(current, baseline)
+                # Com poucas amostras o teste não tem poder; usa apenas a tolerância
+                significant = p_value < alpha if min(len(baseline), len(current)) >= 3 else True
+                
+                row["change_pct"] = change * 100
+                row["tolerance_pct"] = tolerance * 100
+                row["p_value"] = p_value
+                if change > tolerance and significant:
+                    row["status"] = "REGRESSÃO"
+                elif change < -tolerance and significant:
+                    row["status"] = "MELHORIA"
+                else:
+                    row["status"] = "OK"
+                    
+            comparisons.append(row)
             
-        return result
-        
-    def benchmark_ed25519_verify(self, data):
-        """Realiza o benchmark de verificação Ed25519"""
-        result = BenchmarkResult()
-        result.algorithm = "Ed25519"
-        result.key_size = 256  # Ed25519 tem tamanho fixo de 256 bits
-        result.operation_type = "Verification"
-        result.data_size_bytes = len(data)
-        
-        # Verificar se temos uma assinatura e chave pública disponíveis
-        if not hasattr(self, '_last_ed25519_signature') or not hasattr(self, '_last_ed25519_private_key'):
-            # Se não tivermos, criar uma nova
-            private_key = ed25519.Ed25519PrivateKey.generate()
-            signature = private_key.sign(data)
-            public_key = private_key.public_key()
-        else:
-            # Usar a última assinatura e chave geradas
-            signature = self._last_ed25519_signature
-            public_key = self._last_ed25519_private_key.public_key()
+        return comparisons
+
+    def print_regression_table(self, comparisons, baseline_versions=None):
+        """Exibe a tabela de aprovação/reprovação da verificação de regressão"""
+        self._print("\n===== Verificação de Regressão de Desempenho =====")
+        if baseline_versions:
+            self._print(f"Linha de base: cryptography {baseline_versions.get('cryptography')} / "
+                  f"{baseline_versions.get('openssl')}")
+        self._print(f"Execução atual: cryptography {get_crypto_library_versions()['cryptography']} / "
+              f"{get_crypto_library_versions()['openssl']}")
+        
+        def fmt(value, spec):
+            if value is None:
+                return "-".rjust(int(spec.lstrip("+").split(".")[0]))
+            return format(value, spec)
+        
+        header = (f"{'Algoritmo':<16} {'Chave':>6} {'Operação':<16} {'Base (ms)':>12} "
+                  f"{'Atual (ms)':>12} {'Δ (%)':>9} {'Tol. (%)':>9} {'p-valor':>8}  Status")
+        self._print(header)
+        self._print("-" * len(header))
+        for row in comparisons:
+            self._print(f"{row['algorithm']:<16} {row['key_size']:>6} {row['operation']:<16} "
+                  f"{fmt(row['baseline_median_ms'], '12.4f')} {fmt(row['current_median_ms'], '12.4f')} "
+                  f"{fmt(row['change_pct'], '+9.2f')} {fmt(row['tolerance_pct'], '9.2f')} "
+                  f"{fmt(row['p_value'], '8.4f')}  {row['status']}")
+        
+        regressions = sum(1 for row in comparisons if row["status"] == "REGRESSÃO")
+        missing = sum(1 for row in comparisons if row["status"] == "AUSENTE")
+        self._print("-" * len(header))
+        if missing:
+            self._print(f"⚠️ {missing} operações da linha de base sem amostras na execução atual "
+                  f"(tempo limite ou erro); contadas como falha")
+        self._print(f"Resultado: {'REPROVADO' if regressions or missing else 'APROVADO'} "
+              f"({regressions} regressões e {missing} ausentes em {len(comparisons)} operações)")
+
+    def run_regression_gate(self, filename, repetitions=None, threshold_pct=None):
+        """
+        Executa o benchmark, compara com a linha de base salva e exibe a tabela.
+        Retorna True se nenhuma regressão significativa for encontrada e todas as
+        operações da linha de base tiverem amostras, False caso contrário e None se a
+        linha de base não puder ser carregada.
+        """
+        try:
+            baseline = self.load_performance_baseline(filename)
+        except (OSError, ValueError) as ex:
+            self._print(f"Erro ao carregar linha de base: {str(ex)}")
+            return None
+        
+        baseline_environment_id = baseline.get("environment_id")
+        if baseline_environment_id and baseline_environment_id != self.environment_id:
+            self._print(f"⚠️ AVISO: ambiente diferente da linha de base "
+                  f"({baseline_environment_id} → {self.environment_id}); compare com cautela")
+        
+        current_samples = self.collect_benchmark_samples(repetitions)
+        comparisons = self.compare_with_baseline(baseline["samples"], current_samples,
+                                                 threshold_pct=threshold_pct)
+        self.print_regression_table(comparisons, baseline.get("versions"))
+        
+        return not any(row["status"] in ("REGRESSÃO", "AUSENTE") for row in comparisons)
+        
+    # Implementações dos métodos de benchmark
+
+    def should_supervise(self, result):
+        """Decide se a operação roda em um processo filho supervisionado"""
+        if self.supervise_mode == "never" or "fork" not in multiprocessing.get_all_start_methods():
+            return False
+        if self.supervise_mode == "always":
+            return True
+        return result.algorithm == "RSA" and (result.operation_type == "Key Generation"
+                                              or result.key_size >= self.SUPERVISE_MIN_RSA_BITS)
+
+    def measure_operation(self, result, operation, iterations=None, supervised=None):
+        """
+        Executa a operação medindo tempo, memória, CPU e (opcionalmente) contadores
+        de hardware, respeitando o tempo limite configurado.
+
+        A operação é repetida `iterations` vezes (padrão: self.iterations); o tempo
+        de execução registrado é a média por operação. Retorna o valor retornado
+        pela última execução da operação.
+
+        Operações longas (ver should_supervise) rodam em um processo filho que é
+        encerrado ao atingir o tempo limite; no processo atual, o tempo limite só é
+        verificado entre iterações.
+        """
+        iterations = iterations or self.iterations
+        if self.auto_calibrate and self.harness_calibration is None and not self.calibrating:
+            self.calibrate_harness()
+        if supervised is None:
+            supervised = self.should_supervise(result)
+        if supervised:
+            value = self.measure_operation_supervised(result, operation, iterations)
+            self.profile_if_requested(result, operation, iterations, supervised=True)
+            return value
         
         # Reset da flag de timeout
         self.timeout_occurred = False
@@ -937,15 +4800,29 @@ class CryptoBenchmark:
             timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
             timer.start()
         
-        # Executar verificação e medir tempo
-        start_time = time.time()
-        
+        # Contadores de hardware (ciclos, instruções, falhas de cache e de desvio)
+        counters = self.perf_counters if self.enable_perf_counters else None
+        if counters:
+            counters.start()
+        
+        # Executar a operação e medir tempo de cada iteração
+        samples_ns = new_sample_array()
+        value = None
+        self.reporter.operation_started(result, samples_ns, iterations)
+        energy = self.start_energy_measurement()
+        start_time_total = time.perf_counter_ns()
         try:
-            # Verificar a assinatura
-            if not self.timeout_occurred:
-                public_key.verify(signature, data)
+            for _ in range(iterations):
+                if self.timeout_occurred:
+                    break
+                start_time = time.perf_counter_ns()
+                value = operation()
+                samples_ns.append(time.perf_counter_ns() - start_time)
                 
         except Exception as ex:
+            if counters:
+                counters.stop()
+            self.reporter.operation_finished(result)
             # Cancelar o timer se ocorrer exceção
             if self.timeout_seconds > 0:
                 timer.cancel()
@@ -954,7 +4831,10 @@ class CryptoBenchmark:
             cpu_usage_thread.join()
             raise ex
             
-        end_time = time.time()
+        elapsed_ns = time.perf_counter_ns() - start_time_total
+        counter_values = counters.stop() if counters else {}
+        energy_values = energy.stop() if energy else {}
+        self.reporter.operation_finished(result)
         
         # Cancelar o timer se a operação for concluída antes do timeout
         if self.timeout_seconds > 0 and not self.timeout_occurred:
@@ -967,83 +4847,401 @@ class CryptoBenchmark:
         # Calcular uso de memória
         end_memory = process.memory_info().rss
         
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
+        self.store_measurement(result, samples_ns, iterations, elapsed_ns, end_memory - start_memory,
+                               counter_values, energy_values)
+        self.profile_if_requested(result, operation, iterations)
+        return value
+
+    def measure_operation_supervised(self, result, operation, iterations):
+        """
+        Executa as iterações em um processo filho (fork) que envia cada amostra ao
+        concluí-la. Ao atingir o tempo limite, o worker é encerrado (SIGKILL) e as
+        amostras recebidas até então são mantidas; a próxima operação usa um novo worker.
+        """
+        self.timeout_occurred = False
+        
+        context = multiprocessing.get_context("fork")
+        receiver, sender = context.Pipe(duplex=False)
+        worker = context.Process(target=run_supervised_worker,
+                                 args=(sender, operation, iterations, self.enable_perf_counters),
+                                 daemon=True)
+        # A energia é medida a partir do sinal "ready" do worker, sem a criação do processo
+        energy = None
+        start_time = time.perf_counter_ns()
+        worker.start()
+        sender.close()
+        
+        # Monitora a CPU do worker (a thread é iniciada após o fork)
+        self.stop_cpu_measurement = False
+        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result, worker.pid))
+        cpu_usage_thread.start()
+        
+        deadline = start_time + self.timeout_seconds * 1_000_000_000 if self.timeout_seconds > 0 else None
+        samples_ns = new_sample_array()
+        self.reporter.operation_started(result, samples_ns, iterations, worker.pid)
+        outcome = None
+        while outcome is None:
+            remaining = None if deadline is None else (deadline - time.perf_counter_ns()) / 1e9
+            if remaining is not None and remaining <= 0:
+                break
+            if not receiver.poll(remaining):
+                continue
+            try:
+                message = receiver.recv()
+            except EOFError:
+                outcome = ("error", f"worker encerrado inesperadamente (código {worker.exitcode})")
+                break
+            if message[0] == "samples":
+                samples_ns.frombytes(message[1])
+            elif message[0] == "ready":
+                energy = self.start_energy_measurement()
+            else:
+                outcome = message
+        elapsed_ns = time.perf_counter_ns() - start_time
+        energy_values = energy.stop() if energy else {}
+        self.reporter.operation_finished(result)
+        
+        if outcome is None:
+            # Tempo limite: encerra o worker mesmo no meio de uma chamada ao OpenSSL
+            worker.kill()
+            self.timeout_occurred = True
+            self._print(f"Timeout atingido após {self.timeout_seconds} segundos! Worker encerrado "
+                  f"({len(samples_ns)} de {iterations} iterações concluídas); um novo worker será usado a seguir.")
+        worker.join()
+        receiver.close()
+        
+        self.stop_cpu_measurement = True
+        cpu_usage_thread.join()
+        
+        if outcome is not None and outcome[0] == "error":
+            raise RuntimeError(f"Falha no worker supervisionado: {outcome[1]}")
+        
+        value, counter_values, memory_delta = None, {}, 0
+        if outcome is not None:
+            _, encoded_value, counter_values, memory_delta = outcome
+            value = decode_worker_value(encoded_value)
+        
+        self.store_measurement(result, samples_ns, iterations, elapsed_ns, memory_delta, counter_values, energy_values)
+        return value
+
+    def store_measurement(self, result, samples_ns, iterations, elapsed_ns, memory_delta, counter_values,
+                          energy_values=None):
+        """
+        Registra as amostras no resultado. Em caso de timeout, o tempo é a média das
+        iterações concluídas; sem nenhuma concluída, o tempo decorrido é registrado
+        como limite inferior, indicado nas notas.
+        """
+        result.iterations = len(samples_ns)
+        result.samples_ns = samples_ns
+        result.latency_histogram = LatencyHistogram.from_samples(samples_ns)
+        if samples_ns:
+            result.execution_time_ms = summarize_samples(samples_ns)["mean_ms"]
+        else:
+            result.execution_time_ms = elapsed_ns / 1e6
+        result.memory_usage_mb = memory_delta / (1024.0 * 1024.0)
         result.timestamp = datetime.datetime.now()
+        self.apply_perf_counters(result, counter_values)
+        self.apply_energy(result, energy_values)
+        self.apply_harness_calibration(result)
         
         # Adicionar informações sobre timeout, se ocorreu
         if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
-            
-        return result
+            result.notes = (f"Timeout após {self.timeout_seconds} segundos "
+                            f"({len(samples_ns)} de {iterations} iterações concluídas)")
+            if not samples_ns:
+                result.notes += "; tempo registrado é limite inferior"
+
+    # ==== Calibração do harness (resolução do timer e piso de ruído) ====
+
+    @staticmethod
+    def measure_timer_resolution(readings=20000):
+        """
+        Resolução efetiva de perf_counter_ns: menor incremento positivo entre leituras
+        consecutivas, e custo mediano de uma leitura (ns)
+        """
+        deltas = []
+        previous = time.perf_counter_ns()
+        for _ in range(readings):
+            current = time.perf_counter_ns()
+            deltas.append(current - previous)
+            previous = current
+        positive = [delta for delta in deltas if delta > 0]
+        return (min(positive) if positive else 0), median(deltas)
+
+    def calibrate_harness(self, iterations=None):
+        """
+        Mede a resolução efetiva do timer e o custo por iteração do próprio laço de
+        medição (com a thread de monitoramento de CPU ativa) usando uma operação vazia
+        e uma chamada trivial a código nativo. O piso de ruído é a mediana da operação
+        vazia mais 3 desvios robustos (1,4826 × MAD), e nunca menor que a resolução do
+        timer. Executada uma vez por instância; o resultado fica em harness_calibration.
+        """
+        if self.harness_calibration is not None:
+            return self.harness_calibration
+        iterations = iterations or self.CALIBRATION_ITERATIONS
         
-    def benchmark_x25519_keygen(self):
-        """Realiza o benchmark de geração de chaves X25519"""
+        resolution_ns, timer_call_ns = self.measure_timer_resolution()
+        self.calibrating = True
+        profile_patterns, self.profile_patterns = self.profile_patterns, []
+        try:
+            noop = BenchmarkResult(algorithm="Harness", operation_type="Empty Operation")
+            self.measure_operation(noop, lambda: None, iterations, supervised=False)
+            trivial = BenchmarkResult(algorithm="Harness", operation_type="Trivial Call")
+            self.measure_operation(trivial, lambda: abs(-1), iterations, supervised=False)
+        finally:
+            self.calibrating = False
+            self.profile_patterns = profile_patterns
+        
+        noop_samples = list(noop.samples_ns)
+        noop_ns = median(noop_samples)
+        noop_mad_ns = median_absolute_deviation(noop_samples)
+        self.harness_calibration = {
+            "timer_resolution_ns": resolution_ns,
+            "declared_resolution_ns": time.get_clock_info("perf_counter").resolution * 1e9,
+            "timer_call_ns": timer_call_ns,
+            "noop_ns": noop_ns,
+            "noop_mad_ns": noop_mad_ns,
+            "trivial_call_ns": median(list(trivial.samples_ns)),
+            "noise_floor_ns": max(resolution_ns, noop_ns + 3 * 1.4826 * noop_mad_ns)
+        }
+        self.print_harness_calibration()
+        return self.harness_calibration
+
+    def print_harness_calibration(self):
+        """Exibe o resultado da calibração do harness"""
+        calibration = self.harness_calibration
+        self._print(f"Calibração do harness: resolução do timer {calibration['timer_resolution_ns']:.0f} ns "
+                    f"(declarada {calibration['declared_resolution_ns']:.0f} ns), "
+                    f"leitura do timer {calibration['timer_call_ns']:.0f} ns")
+        self._print(f"- Operação vazia: {calibration['noop_ns']:.0f} ns (MAD {calibration['noop_mad_ns']:.0f} ns) | "
+                    f"chamada trivial: {calibration['trivial_call_ns']:.0f} ns | "
+                    f"piso de ruído: {calibration['noise_floor_ns']:.0f} ns")
+        self._print(f"- Resultados abaixo de {self.NOISE_FLOOR_MULTIPLE}× o piso de ruído "
+                    f"({self.NOISE_FLOOR_MULTIPLE * calibration['noise_floor_ns'] / 1000:.2f} µs) serão sinalizados")
+
+    def apply_harness_calibration(self, result):
+        """Desconta a sobrecarga da operação vazia e sinaliza resultados próximos ao piso de ruído"""
+        calibration = self.harness_calibration
+        if calibration is None or not result.iterations:
+            return
+        result.net_time_ms = max(0.0, result.execution_time_ms - calibration["noop_ns"] / 1e6)
+        if result.execution_time_ms * 1e6 < self.NOISE_FLOOR_MULTIPLE * calibration["noise_floor_ns"]:
+            note = (f"Próximo do piso de ruído ({result.execution_time_ms * 1e6:.0f} ns < "
+                    f"{self.NOISE_FLOOR_MULTIPLE}× {calibration['noise_floor_ns']:.0f} ns)")
+            result.notes = f"{result.notes}; {note}" if result.notes else note
+
+    # ==== Perfis de execução sob demanda (--profile) ====
+
+    def should_profile(self, result):
+        """Verifica se a operação corresponde a algum padrão de --profile (trecho, sem diferenciar maiúsculas)"""
+        label = f"{result.algorithm}-{result.key_size} {result.operation_type}".lower()
+        return any(pattern.lower() in label or pattern == "all" for pattern in self.profile_patterns)
+
+    def measure_harness_overhead(self):
+        """
+        Custo por iteração (ns, mediana) do laço de medição com uma operação vazia, se o
+        harness foi calibrado (ver calibrate_harness); None com --no-calibration
+        """
+        if self.harness_calibration is None:
+            return None
+        return self.harness_calibration["noop_ns"]
+
+    def profile_if_requested(self, result, operation, iterations, supervised=False):
+        """
+        Perfila a operação em uma passagem extra, se selecionada por --profile.
+        A passagem roda no processo atual, sem como interromper a operação; por isso é
+        ignorada após um timeout e, para operações supervisionadas, limitada às
+        iterações que cabem no tempo limite segundo o tempo médio medido.
+        """
+        if not self.profile_patterns or not self.should_profile(result):
+            return
+        if self.timeout_occurred:
+            self._print(f"Perfil de {result.algorithm} {result.operation_type} ignorado: "
+                        f"a medição atingiu o tempo limite")
+            return
+        if supervised and self.timeout_seconds > 0 and result.execution_time_ms > 0:
+            iterations = min(iterations, int(self.timeout_seconds * 1000 / result.execution_time_ms))
+        if iterations <= 0:
+            self._print(f"Perfil de {result.algorithm} {result.operation_type} ignorado: "
+                        f"nenhuma iteração cabe no tempo limite")
+            return
+        try:
+            self.profile_operation(result, operation, iterations)
+        except Exception as ex:
+            self._print(f"Erro ao perfilar {result.algorithm} {result.operation_type}: {str(ex)}")
+
+    def profile_operation(self, result, operation, iterations):
+        """
+        Executa a operação novamente sob o profiler (a medição registrada não é afetada
+        pela sobrecarga do profiler) e grava no diretório de perfis:
+        - .prof: estatísticas do cProfile (pstats, snakeviz) — apenas no modo cprofile
+        - .collapsed: pilhas colapsadas para flamegraph.pl / speedscope
+        - .txt: resumo com tempo bruto, sobrecarga do harness e tempo líquido (se o
+          harness foi calibrado) e divisão entre código nativo (OpenSSL/Rust) e Python
+        """
+        import re
+        import io
+        
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{result.algorithm}_{result.key_size}_{result.operation_type}")
+        self.profile_files[name] = self.profile_files.get(name, 0) + 1
+        if self.profile_files[name] > 1:
+            name = f"{name}_{self.profile_files[name]}"
+        os.makedirs(self.profile_dir, exist_ok=True)
+        base = os.path.join(self.profile_dir, name)
+        
+        summary = [
+            f"Operação: {result.algorithm} {result.key_size} {result.operation_type}",
+            f"Tempo bruto por operação: {result.execution_time_ms:.6f} ms ({result.iterations} iterações)"
+        ]
+        # O tempo líquido já foi calculado por apply_harness_calibration
+        overhead_ns = self.measure_harness_overhead()
+        if overhead_ns is not None and result.net_time_ms is not None:
+            summary.append(f"Sobrecarga do harness (operação vazia): {overhead_ns / 1000:.3f} µs")
+            summary.append(f"Tempo líquido por operação: {result.net_time_ms:.6f} ms")
+        summary.append(f"Profiler: {self.profile_mode} ({iterations} iterações perfiladas)")
+        
+        mode = self.profile_mode
+        if mode == "sampling" and not SamplingProfiler.is_available():
+            self._print("Profiler por amostragem indisponível (requer POSIX e a thread principal); usando cProfile.")
+            mode = "cprofile"
+        
+        if mode == "sampling":
+            profiler = SamplingProfiler()
+            profiler.start()
+            try:
+                for _ in range(iterations):
+                    operation()
+            finally:
+                profiler.stop()
+            collapsed = profiler.collapsed()
+            summary.append(f"Amostras: {profiler.samples} "
+                           f"(intervalo de {PROFILE_SAMPLING_INTERVAL * 1000:.1f} ms de CPU)")
+        else:
+            import cProfile
+            import pstats
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                for _ in range(iterations):
+                    operation()
+            finally:
+                profiler.disable()
+            stats = pstats.Stats(profiler)
+            stats.dump_stats(base + ".prof")
+            collapsed = collapse_profile_stats(stats)
+            
+            # Tempo próprio em funções nativas (sem arquivo-fonte) vs funções Python
+            native_time = sum(entry[2] for function, entry in stats.stats.items() if function[0] == "~")
+            total_time = sum(entry[2] for entry in stats.stats.values())
+            if total_time > 0:
+                summary.append(f"Tempo em código nativo (OpenSSL/Rust/C): {100 * native_time / total_time:.1f}%")
+                summary.append(f"Tempo em Python (wrappers e harness): {100 * (total_time - native_time) / total_time:.1f}%")
+            report = io.StringIO()
+            stats.stream = report
+            stats.sort_stats("tottime").print_stats(25)
+            summary.append("")
+            summary.append(report.getvalue())
+        
+        with open(base + ".collapsed", "w") as collapsed_file:
+            collapsed_file.write("\n".join(collapsed) + "\n")
+        with open(base + ".txt", "w") as summary_file:
+            summary_file.write("\n".join(summary) + "\n")
+        
+        note = f"Perfil em {base}.*"
+        result.notes = f"{result.notes}; {note}" if result.notes else note
+        if result.net_time_ms is not None:
+            self._print(f"Perfil gravado em {base}.* (tempo líquido {result.net_time_ms:.4f} ms)")
+        else:
+            self._print(f"Perfil gravado em {base}.*")
+
+    @staticmethod
+    def apply_perf_counters(result, counter_values):
+        """Calcula ciclos/operação, IPC e ciclos/byte a partir dos contadores de hardware"""
+        if not counter_values or not result.iterations:
+            return
+        result.cpu_cycles = counter_values.get("cycles")
+        result.instructions = counter_values.get("instructions")
+        result.cache_misses = counter_values.get("cache_misses")
+        result.branch_misses = counter_values.get("branch_misses")
+
+        if result.cpu_cycles:
+            result.cycles_per_op = result.cpu_cycles / result.iterations
+            if result.instructions is not None:
+                result.ipc = result.instructions / result.cpu_cycles
+            if result.processes_data and result.data_size_bytes > 0:
+                result.cycles_per_byte = result.cycles_per_op / result.data_size_bytes
+
+    # ==== Ed25519 / X25519 (Curve25519) ====
+
+    def benchmark_ed25519_keygen(self):
+        """Realiza o benchmark de geração de chaves Ed25519"""
         result = BenchmarkResult()
-        result.algorithm = "X25519"
-        result.key_size = 256  # X25519 tem tamanho fixo de 256 bits
+        result.algorithm = "Ed25519"
+        result.key_size = 256  # Ed25519 tem tamanho fixo de 256 bits
         result.operation_type = "Key Generation"
         result.data_size_bytes = 0  # Não aplicável para geração de chaves
+
+        # Gerar par de chaves Ed25519
+        self.measure_operation(result, ed25519.Ed25519PrivateKey.generate)
+            
+        return result
         
-        # Reset da flag de timeout
-        self.timeout_occurred = False
-        
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
-        
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
-        
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
+    def benchmark_ed25519_sign(self, data):
+        """Realiza o benchmark de assinatura Ed25519"""
+        result = BenchmarkResult()
+        result.algorithm = "Ed25519"
+        result.key_size = 256  # Ed25519 tem tamanho fixo de 256 bits
+        result.operation_type = "Signing"
+        result.data_size_bytes = len(data)
+        result.processes_data = True
         
-        # Executar geração de chave e medir tempo
-        start_time = time.time()
+        # Gerar chave privada Ed25519 para assinatura
+        private_key = ed25519.Ed25519PrivateKey.generate()
         
-        try:
-            # Gerar par de chaves X25519
-            if not self.timeout_occurred:
-                private_key = x25519.X25519PrivateKey.generate()
-                public_key = private_key.public_key()
-                
-        except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
+        # Assinar os dados
+        signature = self.measure_operation(result, lambda: private_key.sign(data))
+            
+        # Armazenar a assinatura e a chave para uso em verificação
+        self._last_ed25519_signature = signature
+        self._last_ed25519_private_key = private_key
             
-        end_time = time.time()
+        return result
         
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
+    def benchmark_ed25519_verify(self, data):
+        """Realiza o benchmark de verificação Ed25519"""
+        result = BenchmarkResult()
+        result.algorithm = "Ed25519"
+        result.key_size = 256  # Ed25519 tem tamanho fixo de 256 bits
+        result.operation_type = "Verification"
+        result.data_size_bytes = len(data)
+        result.processes_data = True
         
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
+        # Verificar se temos uma assinatura e chave pública disponíveis
+        if not hasattr(self, '_last_ed25519_signature') or not hasattr(self, '_last_ed25519_private_key'):
+            # Se não tivermos, criar uma nova
+            private_key = ed25519.Ed25519PrivateKey.generate()
+            signature = private_key.sign(data)
+            public_key = private_key.public_key()
+        else:
+            # Usar a última assinatura e chave geradas
+            signature = self._last_ed25519_signature
+            public_key = self._last_ed25519_private_key.public_key()
         
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
+        # Verificar a assinatura
+        self.measure_operation(result, lambda: public_key.verify(signature, data))
+            
+        return result
         
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
+    def benchmark_x25519_keygen(self):
+        """Realiza o benchmark de geração de chaves X25519"""
+        result = BenchmarkResult()
+        result.algorithm = "X25519"
+        result.key_size = 256  # X25519 tem tamanho fixo de 256 bits
+        result.operation_type = "Key Generation"
+        result.data_size_bytes = 0  # Não aplicável para geração de chaves
         
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
+        # Gerar par de chaves X25519
+        private_key = self.measure_operation(result, x25519.X25519PrivateKey.generate)
         
         # Armazenar as chaves para uso em troca de chaves
         self._last_x25519_private_key = private_key
@@ -1059,79 +5257,127 @@ class CryptoBenchmark:
         result.data_size_bytes = 32  # Tamanho da chave compartilhada (32 bytes)
         
         # Gerar os pares de chaves para Alice e Bob
-        if hasattr(self, '_last_x25519_private_key'):
+        if getattr(self, '_last_x25519_private_key', None) is not None:
             alice_private = self._last_x25519_private_key
         else:
             alice_private = x25519.X25519PrivateKey.generate()
             
         bob_private = x25519.X25519PrivateKey.generate()
-        
-        alice_public = alice_private.public_key()
         bob_public = bob_private.public_key()
         
         # Serializar a chave pública de Bob para simular transmissão
-# Serializar a chave pública de Bob para simular transmissão
         bob_public_bytes = bob_public.public_bytes(
-            encoding=Encoding.Raw,
-            format=PublicFormat.Raw
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw
         )
         
-        # Reset da flag de timeout
-        self.timeout_occurred = False
-        
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
-        
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
-        
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
-        
-        # Executar troca de chaves e medir tempo
-        start_time = time.time()
-        
-        try:
-            # Alice gera a chave compartilhada usando a chave pública de Bob
-            if not self.timeout_occurred:
-                shared_key = alice_private.exchange(x25519.X25519PublicKey.from_public_bytes(bob_public_bytes))
-                
-        except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
-            
-        end_time = time.time()
-        
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
-        
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
-        
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
-        
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
-        
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
+        # Alice gera a chave compartilhada usando a chave pública de Bob
+        self.measure_operation(
+            result,
+            lambda: alice_private.exchange(x25519.X25519PublicKey.from_public_bytes(bob_public_bytes))
+        )
+
+        return result
+
+    # ==== Ed448 / X448 (Curve448) ====
+
+    def benchmark_ed448_keygen(self):
+        """Realiza o benchmark de geração de chaves Ed448"""
+        result = BenchmarkResult()
+        result.algorithm = "Ed448"
+        result.key_size = 448  # Ed448 tem tamanho fixo (Curve448)
+        result.operation_type = "Key Generation"
+        result.data_size_bytes = 0  # Não aplicável para geração de chaves
+
+        # Gerar par de chaves Ed448
+        self.measure_operation(result, ed448.Ed448PrivateKey.generate)
+
+        return result
+
+    def benchmark_ed448_sign(self, data):
+        """Realiza o benchmark de assinatura Ed448"""
+        result = BenchmarkResult()
+        result.algorithm = "Ed448"
+        result.key_size = 448  # Ed448 tem tamanho fixo (Curve448)
+        result.operation_type = "Signing"
+        result.data_size_bytes = len(data)
+        result.processes_data = True
+
+        # Gerar chave privada Ed448 para assinatura
+        private_key = ed448.Ed448PrivateKey.generate()
+
+        # Assinar os dados
+        signature = self.measure_operation(result, lambda: private_key.sign(data))
+
+        # Armazenar a assinatura e a chave para uso em verificação
+        self._last_ed448_signature = signature
+        self._last_ed448_private_key = private_key
+
+        return result
+
+    def benchmark_ed448_verify(self, data):
+        """Realiza o benchmark de verificação Ed448"""
+        result = BenchmarkResult()
+        result.algorithm = "Ed448"
+        result.key_size = 448  # Ed448 tem tamanho fixo (Curve448)
+        result.operation_type = "Verification"
+        result.data_size_bytes = len(data)
+        result.processes_data = True
+
+        # Usar a última assinatura e chave geradas, ou criar novas
+        if getattr(self, '_last_ed448_signature', None) is None or getattr(self, '_last_ed448_private_key', None) is None:
+            private_key = ed448.Ed448PrivateKey.generate()
+            signature = private_key.sign(data)
+            public_key = private_key.public_key()
+        else:
+            signature = self._last_ed448_signature
+            public_key = self._last_ed448_private_key.public_key()
+
+        # Verificar a assinatura
+        self.measure_operation(result, lambda: public_key.verify(signature, data))
+
+        return result
+
+    def benchmark_x448_keygen(self):
+        """Realiza o benchmark de geração de chaves X448"""
+        result = BenchmarkResult()
+        result.algorithm = "X448"
+        result.key_size = 448  # X448 tem tamanho fixo (Curve448)
+        result.operation_type = "Key Generation"
+        result.data_size_bytes = 0  # Não aplicável para geração de chaves
+
+        # Gerar par de chaves X448
+        private_key = self.measure_operation(result, x448.X448PrivateKey.generate)
+
+        # Armazenar as chaves para uso em troca de chaves
+        self._last_x448_private_key = private_key
+
+        return result
+
+    def benchmark_x448_key_exchange(self):
+        """Realiza o benchmark de troca de chaves X448 (ECDH)"""
+        result = BenchmarkResult()
+        result.algorithm = "X448"
+        result.key_size = 448  # X448 tem tamanho fixo (Curve448)
+        result.operation_type = "Key Exchange"
+        result.data_size_bytes = 56  # Tamanho da chave compartilhada (56 bytes)
+
+        # Gerar os pares de chaves para Alice e Bob
+        if getattr(self, '_last_x448_private_key', None) is not None:
+            alice_private = self._last_x448_private_key
+        else:
+            alice_private = x448.X448PrivateKey.generate()
+
+        bob_public_bytes = x448.X448PrivateKey.generate().public_key().public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw
+        )
+
+        # Alice gera a chave compartilhada usando a chave pública de Bob
+        self.measure_operation(
+            result,
+            lambda: alice_private.exchange(x448.X448PublicKey.from_public_bytes(bob_public_bytes))
+        )
             
         return result
     
@@ -1141,77 +5387,12 @@ class CryptoBenchmark:
         """Realiza o benchmark de geração de chaves ECDSA usando uma curva específica"""
         result = BenchmarkResult()
         result.algorithm = curve_name
-        
-        # Define o tamanho da chave com base na curva
-        if curve_name == "NIST_P256":
-            result.key_size = 256
-        elif curve_name == "NIST_P384":
-            result.key_size = 384
-        elif curve_name == "NIST_P521":
-            result.key_size = 521
-        else:
-            result.key_size = 0
-            
+        result.key_size = curve.key_size  # 256, 384 ou 521 bits
         result.operation_type = "Key Generation"
         result.data_size_bytes = 0  # Não aplicável para geração de chaves
         
-        # Reset da flag de timeout
-        self.timeout_occurred = False
-        
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
-        
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
-        
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
-        
-        # Executar geração de chave e medir tempo
-        start_time = time.time()
-        
-        try:
-            # Gerar par de chaves EC
-            if not self.timeout_occurred:
-                private_key = ec.generate_private_key(curve)
-                public_key = private_key.public_key()
-                
-        except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
-            
-        end_time = time.time()
-        
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
-        
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
-        
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
-        
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
-        
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
+        # Gerar par de chaves EC
+        private_key = self.measure_operation(result, lambda: ec.generate_private_key(curve))
         
         # Armazenar as chaves para uso em operações ECDSA
         # Usamos um dicionário para armazenar chaves por curva
@@ -1226,22 +5407,12 @@ class CryptoBenchmark:
         """Realiza o benchmark de assinatura ECDSA usando uma curva específica"""
         result = BenchmarkResult()
         result.algorithm = curve_name
-        
-        # Define o tamanho da chave com base na curva
-        if curve_name == "NIST_P256":
-            result.key_size = 256
-        elif curve_name == "NIST_P384":
-            result.key_size = 384
-        elif curve_name == "NIST_P521":
-            result.key_size = 521
-        else:
-            result.key_size = 0
-            
+        result.key_size = curve.key_size  # 256, 384 ou 521 bits
         result.operation_type = "Signing"
         result.data_size_bytes = len(data)
         
         # Verificar se temos uma chave privada disponível
-        if hasattr(self, '_last_ecdsa_keys') and curve_name in self._last_ecdsa_keys:
+        if getattr(self, '_last_ecdsa_keys', {}).get(curve_name) is not None:
             private_key = self._last_ecdsa_keys[curve_name]
         else:
             # Se não tivermos, criar uma nova
@@ -1251,70 +5422,16 @@ class CryptoBenchmark:
                 self._last_ecdsa_keys = {}
             self._last_ecdsa_keys[curve_name] = private_key
         
-        # Reset da flag de timeout
-        self.timeout_occurred = False
-        
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
-        
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
-        
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
-        
         # Preparar o hash dos dados para assinatura
         digest = hashes.Hash(hashes.SHA256())
         digest.update(data)
         data_hash = digest.finalize()
         
-        # Executar assinatura e medir tempo
-        start_time = time.time()
-        
-        try:
-            # Assinar o hash dos dados
-            if not self.timeout_occurred:
-                signature = private_key.sign(
-                    data_hash,
-                    ec.ECDSA(hashes.SHA256())
-                )
-                
-        except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
-            
-        end_time = time.time()
-        
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
-        
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
-        
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
-        
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
-        
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
+        # Assinar o hash dos dados
+        signature = self.measure_operation(
+            result,
+            lambda: private_key.sign(data_hash, ec.ECDSA(hashes.SHA256()))
+        )
             
         # Armazenar a assinatura para uso em verificação
         if not hasattr(self, '_last_ecdsa_signatures'):
@@ -1332,24 +5449,14 @@ class CryptoBenchmark:
         """Realiza o benchmark de verificação ECDSA usando uma curva específica"""
         result = BenchmarkResult()
         result.algorithm = curve_name
-        
-        # Define o tamanho da chave com base na curva
-        if curve_name == "NIST_P256":
-            result.key_size = 256
-        elif curve_name == "NIST_P384":
-            result.key_size = 384
-        elif curve_name == "NIST_P521":
-            result.key_size = 521
-        else:
-            result.key_size = 0
-            
+        result.key_size = curve.key_size  # 256, 384 ou 521 bits
         result.operation_type = "Verification"
         result.data_size_bytes = len(data)
         
         # Verificar se temos uma assinatura e chave disponíveis
-        if (hasattr(self, '_last_ecdsa_keys') and curve_name in self._last_ecdsa_keys and
-            hasattr(self, '_last_ecdsa_signatures') and curve_name in self._last_ecdsa_signatures and
-            hasattr(self, '_last_ecdsa_hashes') and curve_name in self._last_ecdsa_hashes):
+        if (getattr(self, '_last_ecdsa_keys', {}).get(curve_name) is not None and
+            getattr(self, '_last_ecdsa_signatures', {}).get(curve_name) is not None and
+            curve_name in getattr(self, '_last_ecdsa_hashes', {})):
             
             private_key = self._last_ecdsa_keys[curve_name]
             public_key = private_key.public_key()
@@ -1372,66 +5479,11 @@ class CryptoBenchmark:
                 ec.ECDSA(hashes.SHA256())
             )
             
-        # Reset da flag de timeout
-        self.timeout_occurred = False
-        
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
-        
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
-        
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
-        
-        # Executar verificação e medir tempo
-        start_time = time.time()
-        
-        try:
-            # Verificar a assinatura
-            if not self.timeout_occurred:
-                public_key.verify(
-                    signature,
-                    data_hash,
-                    ec.ECDSA(hashes.SHA256())
-                )
-                
-        except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
-            
-        end_time = time.time()
-        
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
-        
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
-        
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
-        
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
-        
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
+        # Verificar a assinatura
+        self.measure_operation(
+            result,
+            lambda: public_key.verify(signature, data_hash, ec.ECDSA(hashes.SHA256()))
+        )
             
         return result
         
@@ -1439,173 +5491,50 @@ class CryptoBenchmark:
         """Realiza o benchmark de troca de chaves ECDH usando uma curva específica"""
         result = BenchmarkResult()
         result.algorithm = f"{curve_name}_ECDH"
-        
-        # Define o tamanho da chave com base na curva
-        if curve_name == "NIST_P256":
-            result.key_size = 256
-        elif curve_name == "NIST_P384":
-            result.key_size = 384
-        elif curve_name == "NIST_P521":
-            result.key_size = 521
-        else:
-            result.key_size = 0
-            
+        result.key_size = curve.key_size  # 256, 384 ou 521 bits
         result.operation_type = "Key Exchange"
         result.data_size_bytes = result.key_size // 8  # Tamanho aproximado da chave em bytes
         
         # Gerar pares de chaves para Alice e Bob
-        if hasattr(self, '_last_ecdsa_keys') and curve_name in self._last_ecdsa_keys:
+        if getattr(self, '_last_ecdsa_keys', {}).get(curve_name) is not None:
             alice_private = self._last_ecdsa_keys[curve_name]
         else:
             alice_private = ec.generate_private_key(curve)
             
         bob_private = ec.generate_private_key(curve)
-        
-        alice_public = alice_private.public_key()
         bob_public = bob_private.public_key()
         
         # Serializar a chave pública de Bob para simular transmissão
         bob_public_bytes = bob_public.public_bytes(
-            encoding=Encoding.X962,
-            format=PublicFormat.CompressedPoint
+            encoding=serialization.Encoding.X962,
+            format=serialization.PublicFormat.CompressedPoint
         )
         
-        # Reset da flag de timeout
-        self.timeout_occurred = False
-        
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
-        
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
-        
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
-        
-        # Executar troca de chaves e medir tempo
-        start_time = time.time()
-        
-        try:
-            # Alice gera a chave compartilhada usando a chave pública de Bob
-            if not self.timeout_occurred:
-                # Reconstruir a chave pública de Bob
-                bob_restored_public = ec.EllipticCurvePublicKey.from_encoded_point(curve, bob_public_bytes)
-                
-                # Derivar a chave compartilhada
-                shared_key = alice_private.exchange(
-                    ec.ECDH(),
-                    bob_restored_public
-                )
-                
-        except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
-            
-        end_time = time.time()
-        
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
-        
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
-        
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
-        
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
-        
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
-            
-        return result
-    
-    # ==== RSA ====
-    
-    def benchmark_rsa_keygen(self, key_size):
-        """Realiza o benchmark de geração de chaves RSA"""
-        result = BenchmarkResult()
-        result.algorithm = "RSA"
-        result.key_size = key_size
-        result.operation_type = "Key Generation"
-        result.data_size_bytes = 0  # Não aplicável para geração de chaves
-        
-        # Reset da flag de timeout
-        self.timeout_occurred = False
-        
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
-        
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
-        
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
-        
-        # Executar geração de chave e medir tempo
-        start_time = time.time()
-        
-        try:
-            # Gerar par de chaves RSA
-            if not self.timeout_occurred:
-                private_key = rsa.generate_private_key(
-                    public_exponent=65537,
-                    key_size=key_size
-                )
-                public_key = private_key.public_key()
-                
-        except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
-            
-        end_time = time.time()
-        
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
-        
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
-        
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
+        def exchange():
+            # Reconstruir a chave pública de Bob e derivar a chave compartilhada
+            bob_restored_public = ec.EllipticCurvePublicKey.from_encoded_point(curve, bob_public_bytes)
+            return alice_private.exchange(ec.ECDH(), bob_restored_public)
         
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
+        # Alice gera a chave compartilhada usando a chave pública de Bob
+        self.measure_operation(result, exchange)
+            
+        return result
+    
+    # ==== RSA ====
+    
+    def benchmark_rsa_keygen(self, key_size):
+        """Realiza o benchmark de geração de chaves RSA"""
+        result = BenchmarkResult()
+        result.algorithm = "RSA"
+        result.key_size = key_size
+        result.operation_type = "Key Generation"
+        result.data_size_bytes = 0  # Não aplicável para geração de chaves
         
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
+        # Gerar par de chaves RSA
+        private_key = self.measure_operation(
+            result,
+            lambda: rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+        )
         
         # Armazenar as chaves para uso em operações RSA
         if not hasattr(self, '_last_rsa_keys'):
@@ -1622,9 +5551,10 @@ class CryptoBenchmark:
         result.key_size = key_size
         result.operation_type = "Signing"
         result.data_size_bytes = len(data)
+        result.processes_data = True
         
         # Verificar se temos uma chave privada disponível
-        if hasattr(self, '_last_rsa_keys') and key_size in self._last_rsa_keys:
+        if getattr(self, '_last_rsa_keys', {}).get(key_size) is not None:
             private_key = self._last_rsa_keys[key_size]
         else:
             # Se não tivermos, criar uma nova
@@ -1637,69 +5567,18 @@ class CryptoBenchmark:
                 self._last_rsa_keys = {}
             self._last_rsa_keys[key_size] = private_key
         
-        # Reset da flag de timeout
-        self.timeout_occurred = False
-        
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
-        
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
-        
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
-        
-        # Executar assinatura e medir tempo
-        start_time = time.time()
-        
-        try:
-            # Assinar os dados
-            if not self.timeout_occurred:
-                signature = private_key.sign(
-                    data,
-                    asym_padding.PSS(
-                        mgf=asym_padding.MGF1(hashes.SHA256()),
-                        salt_length=asym_padding.PSS.MAX_LENGTH
-                    ),
-                    hashes.SHA256()
-                )
-                
-        except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
-            
-        end_time = time.time()
-        
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
-        
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
-        
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
-        
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
-        
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
+        # Assinar os dados
+        signature = self.measure_operation(
+            result,
+            lambda: private_key.sign(
+                data,
+                asym_padding.PSS(
+                    mgf=asym_padding.MGF1(hashes.SHA256()),
+                    salt_length=asym_padding.PSS.MAX_LENGTH
+                ),
+                hashes.SHA256()
+            )
+        )
             
         # Armazenar a assinatura para uso em verificação
         if not hasattr(self, '_last_rsa_signatures'):
@@ -1720,11 +5599,12 @@ class CryptoBenchmark:
         result.key_size = key_size
         result.operation_type = "Verification"
         result.data_size_bytes = len(data)
+        result.processes_data = True
         
         # Verificar se temos uma assinatura e chave disponíveis
-        if (hasattr(self, '_last_rsa_keys') and key_size in self._last_rsa_keys and
-            hasattr(self, '_last_rsa_signatures') and key_size in self._last_rsa_signatures and
-            hasattr(self, '_last_rsa_data') and key_size in self._last_rsa_data):
+        if (getattr(self, '_last_rsa_keys', {}).get(key_size) is not None and
+            getattr(self, '_last_rsa_signatures', {}).get(key_size) is not None and
+            key_size in getattr(self, '_last_rsa_data', {})):
             
             private_key = self._last_rsa_keys[key_size]
             public_key = private_key.public_key()
@@ -1750,70 +5630,19 @@ class CryptoBenchmark:
             )
             data_to_verify = data
             
-        # Reset da flag de timeout
-        self.timeout_occurred = False
-        
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
-        
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
-        
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
-        
-        # Executar verificação e medir tempo
-        start_time = time.time()
-        
-        try:
-            # Verificar a assinatura
-            if not self.timeout_occurred:
-                public_key.verify(
-                    signature,
-                    data_to_verify,
-                    asym_padding.PSS(
-                        mgf=asym_padding.MGF1(hashes.SHA256()),
-                        salt_length=asym_padding.PSS.MAX_LENGTH
-                    ),
-                    hashes.SHA256()
-                )
-                
-        except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
-            
-        end_time = time.time()
-        
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
-        
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
-        
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
-        
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
-        
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
+        # Verificar a assinatura
+        self.measure_operation(
+            result,
+            lambda: public_key.verify(
+                signature,
+                data_to_verify,
+                asym_padding.PSS(
+                    mgf=asym_padding.MGF1(hashes.SHA256()),
+                    salt_length=asym_padding.PSS.MAX_LENGTH
+                ),
+                hashes.SHA256()
+            )
+        )
             
         return result
         
@@ -1824,9 +5653,10 @@ class CryptoBenchmark:
         result.key_size = key_size
         result.operation_type = "Encryption"
         result.data_size_bytes = len(data)
+        result.processes_data = True
         
         # Verificar se temos uma chave disponível
-        if hasattr(self, '_last_rsa_keys') and key_size in self._last_rsa_keys:
+        if getattr(self, '_last_rsa_keys', {}).get(key_size) is not None:
             private_key = self._last_rsa_keys[key_size]
             public_key = private_key.public_key()
         else:
@@ -1842,84 +5672,673 @@ class CryptoBenchmark:
                 self._last_rsa_keys = {}
             self._last_rsa_keys[key_size] = private_key
         
-        # Reset da flag de timeout
-        self.timeout_occurred = False
-        
-        # Medição de recursos
-        process = psutil.Process(os.getpid())
-        start_memory = process.memory_info().rss
-        
-        # Iniciar thread para monitoramento de CPU
-        self.stop_cpu_measurement = False
-        cpu_usage_thread = threading.Thread(target=self.measure_cpu_usage, args=(result,))
-        cpu_usage_thread.start()
-        
-        # Iniciar thread para timeout (se configurado)
-        if self.timeout_seconds > 0:
-            timer = threading.Timer(self.timeout_seconds, self.timeout_handler)
-            timer.start()
-        
-        # Executar criptografia e medir tempo
-        start_time = time.time()
-        
-        try:
-            # Criptografar os dados
-            if not self.timeout_occurred:
-                encrypted_data = public_key.encrypt(
-                    data,
-                    asym_padding.OAEP(
-                        mgf=asym_padding.MGF1(algorithm=hashes.SHA256()),
-                        algorithm=hashes.SHA256(),
-                        label=None
-                    )
-                )
-                
-                # Adicionar a descriptografia para completar o teste
-                decrypted_data = private_key.decrypt(
-                    encrypted_data,
-                    asym_padding.OAEP(
-                        mgf=asym_padding.MGF1(algorithm=hashes.SHA256()),
-                        algorithm=hashes.SHA256(),
-                        label=None
-                    )
-                )
-                
-        except Exception as ex:
-            # Cancelar o timer se ocorrer exceção
-            if self.timeout_seconds > 0:
-                timer.cancel()
-            # Finalizar medição de CPU
-            self.stop_cpu_measurement = True
-            cpu_usage_thread.join()
-            raise ex
-            
-        end_time = time.time()
-        
-        # Cancelar o timer se a operação for concluída antes do timeout
-        if self.timeout_seconds > 0 and not self.timeout_occurred:
-            timer.cancel()
-        
-        # Finalizar medição de CPU
-        self.stop_cpu_measurement = True
-        cpu_usage_thread.join()
-        
-        # Calcular uso de memória
-        end_memory = process.memory_info().rss
+        oaep = asym_padding.OAEP(
+            mgf=asym_padding.MGF1(algorithm=hashes.SHA256()),
+            algorithm=hashes.SHA256(),
+            label=None
+        )
         
-        # Armazenar resultados
-        result.execution_time_ms = (end_time - start_time) * 1000
-        result.memory_usage_mb = (end_memory - start_memory) / (1024.0 * 1024.0)
-        result.timestamp = datetime.datetime.now()
+        def encrypt_decrypt():
+            # Criptografar os dados e descriptografar para completar o teste
+            encrypted_data = public_key.encrypt(data, oaep)
+            return private_key.decrypt(encrypted_data, oaep)
         
-        # Adicionar informações sobre timeout, se ocorreu
-        if self.timeout_occurred:
-            result.notes = f"Timeout após {self.timeout_seconds} segundos"
-            result.execution_time_ms = self.timeout_seconds * 1000
+        self.measure_operation(result, encrypt_decrypt)
             
         return result
 
 
+def run_benchmarks(selection=None, iterations=1, reporter=None, data_seed=None, **settings):
+    """
+    API de biblioteca: executa a seleção (ver CryptoBenchmark.run_selection) sem
+    imprimir nada por padrão e retorna a lista de BenchmarkResult. `settings`
+    ajusta atributos do benchmark (ex.: use_cores=2, timeout_seconds=10). A
+    calibração do harness fica desligada, ao contrário da CLI; use
+    auto_calibrate=True para obter tempo líquido e sinalização do piso de ruído.
+    """
+    benchmark = CryptoBenchmark(data_seed=data_seed, reporter=reporter or NullReporter())
+    benchmark.iterations = max(1, iterations)
+    benchmark.auto_calibrate = False
+    for name, value in settings.items():
+        if not hasattr(benchmark, name):
+            raise TypeError(f"Configuração desconhecida: {name}")
+        setattr(benchmark, name, value)
+    return benchmark.run_selection(selection)
+
+def save_results_json(results, filename):
+    """Salva os resultados como JSON (lista de BenchmarkResult.to_dict)"""
+    with open(filename, "w") as results_file:
+        json.dump([result.to_dict() for result in results], results_file, indent=2)
+
+def load_results_json(filename):
+    """Carrega resultados salvos por save_results_json"""
+    with open(filename) as results_file:
+        return [BenchmarkResult.from_dict(data) for data in json.load(results_file)]
+
+def check_result_api():
+    """
+    Verificações da API pública de resultados: ida e volta de to_dict/from_dict (com
+    amostras e histograma, via JSON e via arquivo), campos desconhecidos ignorados,
+    rejeição de esquema mais novo e run_benchmarks/run_selection. Retorna a lista de
+    falhas (vazia quando tudo passa).
+    """
+    import tempfile
+    
+    failures = []
+    
+    def check(condition, message):
+        if not condition:
+            failures.append(message)
+    
+    samples = [1_250_000, 980_000, 1_730_000, 1_010_000]
+    original = BenchmarkResult(
+        algorithm="Ed25519", key_size=256, operation_type="Signing", execution_time_ms=1.2425,
+        data_size_bytes=1024, processes_data=True, timestamp=datetime.datetime(2026, 1, 2, 3, 4, 5),
+        notes="verificação", iterations=len(samples), samples_ns=new_sample_array(samples),
+        cycles_per_op=1234.5, concurrency_mode="thread", workers=2, throughput_ops=804.8,
+        latency_histogram=LatencyHistogram.from_samples(samples))
+    data = json.loads(json.dumps(original.to_dict()))
+    check(data["schema_version"] == RESULT_SCHEMA_VERSION, "to_dict sem schema_version atual")
+    restored = BenchmarkResult.from_dict(data)
+    for name in BenchmarkResult.__slots__:
+        expected, value = getattr(original, name), getattr(restored, name)
+        if name == "latency_histogram":
+            check(value is not None and value.to_dict() == expected.to_dict(), "histograma diferente após from_dict")
+        elif name == "samples_ns":
+            check(isinstance(value, array) and list(value) == list(expected), "amostras diferentes após from_dict")
+        else:
+            check(value == expected, f"campo {name} diferente após from_dict: {value!r} != {expected!r}")
+    
+    data["campo_futuro"] = 1
+    check(BenchmarkResult.from_dict(data).algorithm == "Ed25519", "campo desconhecido não foi ignorado")
+    defaults = BenchmarkResult.from_dict({"schema_version": RESULT_SCHEMA_VERSION, "algorithm": "RSA"})
+    check(defaults.latency_histogram is None and len(defaults.samples_ns) == 0 and not defaults.processes_data,
+          "campos ausentes não receberam os valores padrão")
+    try:
+        BenchmarkResult.from_dict({"schema_version": RESULT_SCHEMA_VERSION + 1})
+        check(False, "esquema mais novo não foi rejeitado")
+    except ValueError:
+        pass
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filename = os.path.join(temp_dir, "resultados.json")
+        save_results_json([original], filename)
+        loaded = load_results_json(filename)
+        check(len(loaded) == 1 and loaded[0].to_dict() == original.to_dict(), "ida e volta por arquivo JSON falhou")
+    
+    try:
+        results = run_benchmarks(["Ed25519"], iterations=2, auto_calibrate=False)
+        check(results and all(len(result.samples_ns) == 2 for result in results),
+              "run_benchmarks não retornou 2 amostras por operação")
+        check(all(BenchmarkResult.from_dict(result.to_dict()).to_dict() == result.to_dict() for result in results),
+              "ida e volta de resultados reais falhou")
+    except Exception as ex:
+        check(False, f"run_benchmarks falhou: {ex}")
+    try:
+        run_benchmarks(["inexistente"])
+        check(False, "seleção desconhecida não foi rejeitada")
+    except ValueError:
+        pass
+    return failures
+
+def check_latency_histogram():
+    """
+    Verificações determinísticas de LatencyHistogram: limites das faixas, paridade
+    entre from_samples e record, from_timestamps, merge e erro relativo dos
+    percentis (no máximo 2^-SUB_BUCKET_BITS). Retorna a lista de falhas.
+    """
+    failures = []
+    
+    def check(condition, message):
+        if not condition:
+            failures.append(message)
+    
+    for index in range(0, 24 * LatencyHistogram.SUB_BUCKET_COUNT):
+        lower, upper = LatencyHistogram.bucket_bounds(index)
+        if (LatencyHistogram.bucket_index(lower) != index or LatencyHistogram.bucket_index(upper) != index
+                or LatencyHistogram.bucket_index(upper + 1) != index + 1):
+            check(False, f"faixa {index} com limites inconsistentes ({lower}, {upper})")
+            break
+    
+    rng = random.Random(2026)
+    samples = [int(rng.lognormvariate(11, 1.5)) for _ in range(5000)] + [0, 1, 127, 128, 255, 256]
+    recorded = LatencyHistogram()
+    for value in samples:
+        recorded.record(value)
+    histogram = LatencyHistogram.from_samples(new_sample_array(samples))
+    check(histogram.to_dict() == recorded.to_dict(), "from_samples difere de record")
+    check(LatencyHistogram.from_samples(samples).to_dict() == recorded.to_dict(),
+          "from_samples (lista) difere de record")
+    
+    timestamps = new_sample_array([1000, 1100, 1350, 1350, 2350])
+    from_timestamps = LatencyHistogram.from_timestamps(timestamps)
+    check(from_timestamps.to_dict() == LatencyHistogram.from_samples([100, 250, 0, 1000]).to_dict(),
+          "from_timestamps não usa a diferença entre instantes vizinhos")
+    
+    merged = LatencyHistogram.from_samples(samples[:2000]).merge(LatencyHistogram.from_samples(samples[2000:]))
+    check(merged.to_dict() == histogram.to_dict(), "merge difere do histograma das amostras combinadas")
+    
+    ordered = sorted(samples)
+    for pct in (1, 50, 90, 99, 99.9, 100):
+        exact = ordered[max(1, math.ceil(len(ordered) * pct / 100.0)) - 1]
+        value = histogram.value_at_percentile(pct)
+        if not exact <= value <= exact * (1 + 2.0 ** -LatencyHistogram.SUB_BUCKET_BITS):
+            check(False, f"p{pct:g} = {value} ns fora do erro relativo máximo (exato {exact} ns)")
+    check(histogram.total_count == len(samples) and histogram.total_ns == sum(samples)
+          and histogram.min_ns == 0 and histogram.max_ns == ordered[-1], "contagem, soma ou extremos incorretos")
+    return failures
+
+def check_result_table():
+    """
+    Verificações determinísticas de ResultTable: agregados conhecidos por grupo no
+    caminho em Python puro, mesmo resultado no caminho NumPy (se instalado) e
+    intervalo bootstrap contendo a mediana. Retorna a lista de falhas.
+    """
+    failures = []
+    
+    def check(condition, message):
+        if not condition:
+            failures.append(message)
+    
+    def close(value, expected):
+        return math.isclose(value, expected, rel_tol=1e-9, abs_tol=1e-12)
+    
+    table = ResultTable()
+    fields = {"algorithm": "AES", "key_size": 256, "operation": "Encryption", "config": "1CPU"}
+    table.add(fields, [1_000_000, 4_000_000], memory_mb=2.0, cpu_pct=50.0)
+    table.add(fields, [2_000_000, 3_000_000], memory_mb=4.0, cpu_pct=100.0)
+    table.add(dict(fields, config="2CPU"), [10_000_000], memory_mb=1.0)
+    expected = [
+        {"runs": 2, "samples": 4, "mean_ms": 2.5, "min_ms": 1.0, "max_ms": 4.0, "q50": 2.5, "q90": 3.7,
+         "memory_mb": 3.0, "cpu_pct": 75.0},
+        {"runs": 1, "samples": 1, "mean_ms": 10.0, "min_ms": 10.0, "max_ms": 10.0, "q50": 10.0, "q90": 10.0,
+         "memory_mb": 1.0, "cpu_pct": 0.0}
+    ]
+    
+    python_columns = table._aggregate_python((0.5, 0.9), 0.95, False, 0)
+    for code, row in enumerate(expected):
+        for name, value in row.items():
+            check(close(python_columns[name][code], value),
+                  f"{name} do grupo {code} em Python puro: {python_columns[name][code]!r} != {value!r}")
+    
+    np = get_numpy()
+    if np is not None:
+        numpy_columns = table._aggregate_numpy(np, (0.5, 0.9), 0.95, False, 0)
+        check(sorted(numpy_columns) == sorted(python_columns), "caminhos NumPy e Python com colunas diferentes")
+        for name, values in python_columns.items():
+            check(all(close(a, b) for a, b in zip(numpy_columns.get(name, []), values)),
+                  f"coluna {name} difere entre os caminhos NumPy e Python")
+    
+    rows = table.aggregate(quantiles=(0.5,), bootstrap=True, seed=1)
+    check([row["config"] for row in rows] == ["1CPU", "2CPU"], "grupos fora da ordem de inserção")
+    check(all(row["ci_low_ms"] <= row["q50"] <= row["ci_high_ms"] for row in rows),
+          "intervalo bootstrap não contém a mediana")
+    
+    result = BenchmarkResult(algorithm="AES", key_size=256, operation_type="Encryption", execution_time_ms=1.5,
+                             samples_ns=new_sample_array([1_000_000, 2_000_000, 6_000_000]))
+    means = [ResultTable.from_results([result], use_samples=use_samples).aggregate(bootstrap=False)[0]["mean_ms"]
+             for use_samples in (True, False)]
+    check(close(means[0], 3.0) and close(means[1], 1.5), "from_results não usa amostras ou tempo médio")
+    return failures
+
+def check_regression_statistics():
+    """
+    Verificações determinísticas da verificação de regressão: p-valores conhecidos do
+    teste de Mann-Whitney (com e sem empates), marcação de outliers pelo MAD e status
+    de compare_with_baseline. Retorna a lista de falhas.
+    """
+    failures = []
+    
+    def check(condition, message):
+        if not condition:
+            failures.append(message)
+    
+    # p-valores de referência da aproximação normal com correção de empates e de continuidade
+    for baseline, current, expected in (([1, 2, 3, 4, 5], [6, 7, 8, 9, 10], 0.006092890177672409),
+                                        ([6, 7, 8, 9, 10], [1, 2, 3, 4, 5], 0.9966923245172357),
+                                        ([1, 2, 2, 3], [2, 3, 3, 4], 0.08601685446091148),
+                                        ([5, 5, 5, 5], [5, 5, 5, 5], 1.0),
+                                        ([], [1, 2], 1.0)):
+        p_value = mann_whitney_u_pvalue(baseline, current)
+        check(math.isclose(p_value, expected, rel_tol=1e-9),
+              f"Mann-Whitney {baseline} x {current}: p = {p_value!r}, esperado {expected!r}")
+    
+    benchmark = CryptoBenchmark(data_seed=0, reporter=NullReporter())
+    
+    def make_result(algorithm, time_ms):
+        return BenchmarkResult(algorithm=algorithm, key_size=256, operation_type="Signing", execution_time_ms=time_ms)
+    
+    group = [make_result("Ed25519", time_ms) for time_ms in (1.0, 1.01, 0.99, 1.0, 1.02, 5.0)]
+    small_group = [make_result("Ed448", time_ms) for time_ms in (1.0, 1.0, 9.0)]
+    outliers = benchmark.flag_outliers(group + small_group)
+    check(outliers == [group[-1]] and "Outlier" in group[-1].notes,
+          "flag_outliers não marcou apenas o valor discrepante")
+    check(not any(result.notes for result in group[:-1] + small_group),
+          "flag_outliers marcou resultados de grupos pequenos ou sem desvio")
+    
+    stable = [1.0, 1.01, 0.99, 1.0, 1.02]
+    comparisons = benchmark.compare_with_baseline(
+        {"Regressao|256|Signing": stable, "Estavel|256|Signing": stable,
+         "Melhoria|256|Signing": stable, "Ausente|256|Signing": stable},
+        {"Regressao|256|Signing": [value * 1.3 for value in stable], "Estavel|256|Signing": [1.01, 1.0, 0.99, 1.0, 1.01],
+         "Melhoria|256|Signing": [value * 0.7 for value in stable], "Novo|256|Signing": stable},
+        threshold_pct=10.0, noise_factor=3.0, alpha=0.05)
+    statuses = {row["algorithm"]: row["status"] for row in comparisons}
+    check(statuses == {"Regressao": "REGRESSÃO", "Estavel": "OK", "Melhoria": "MELHORIA",
+                       "Ausente": "AUSENTE", "Novo": "NOVO"},
+          f"status inesperados em compare_with_baseline: {statuses}")
+    return failures
+
+# ==== Exportação OpenMetrics (Prometheus) ====
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Limites superiores (segundos) dos buckets do histograma de latência: 1-2,5-5 por década, de 1 µs a 10 s
+OPENMETRICS_LATENCY_BUCKETS = tuple(mantissa * 10.0 ** exponent
+                                    for exponent in range(-6, 1) for mantissa in (1, 2.5, 5)) + (10.0,)
+
+def openmetrics_escape(value):
+    """Escapa barras invertidas, aspas e quebras de linha em valores de rótulos"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def openmetrics_labels(labels):
+    """Formata um conjunto de rótulos OpenMetrics ({nome="valor",...})"""
+    return "{" + ",".join(f'{name}="{openmetrics_escape(value)}"' for name, value in labels.items()) + "}"
+
+def cumulative_bucket_counts(samples_ns, bounds_seconds):
+    """Contagens acumuladas de amostras (ns) menores ou iguais a cada limite (s)"""
+    bounds_ns = [bound * 1e9 for bound in bounds_seconds]
+    np = get_numpy()
+    if np is not None:
+        values = np.sort(np.frombuffer(samples_ns, dtype=np.int64) if isinstance(samples_ns, array)
+                         else np.asarray(samples_ns, dtype=np.int64))
+        return [int(count) for count in np.searchsorted(values, bounds_ns, side="right")]
+    import bisect
+    ordered = sorted(samples_ns)
+    return [bisect.bisect_right(ordered, bound) for bound in bounds_ns]
+
+def render_openmetrics(results, cores, memory_limit_mb=None, environment_id=""):
+    """
+    Gera o texto OpenMetrics com o resultado mais recente de cada série (algoritmo,
+    tamanho da chave, operação, modo de concorrência, workers): tempo médio, vazão,
+    memória, instante da medição e histograma de latência, construído a partir das
+    amostras por iteração ou, na falta delas, do LatencyHistogram do resultado
+    (escalonamento, KDF em paralelo e carga assíncrona).
+    """
+    latest = {}
+    for result in results:
+        latest[(result.algorithm, result.key_size, result.operation_type,
+                result.concurrency_mode, result.workers)] = result
+    
+    families = {
+        "operation_seconds": ("gauge", "seconds", "Tempo médio por operação"),
+        "net_operation_seconds": ("gauge", "seconds", "Tempo médio por operação descontada a sobrecarga do harness"),
+        "throughput_ops_per_second": ("gauge", None, "Vazão em operações por segundo"),
+        "memory_bytes": ("gauge", "bytes", "Variação de memória residente durante a medição"),
+        "energy_per_operation_joules": ("gauge", "joules", "Energia RAPL dos pacotes de CPU por operação"),
+        "timestamp_seconds": ("gauge", "seconds", "Instante da medição (epoch Unix)"),
+        "latency_seconds": ("histogram", "seconds", "Latência por iteração")
+    }
+    samples = {name: [] for name in families}
+    for (algorithm, key_size, operation_type, concurrency_mode, workers), result in latest.items():
+        labels = {"algorithm": algorithm, "key_size": key_size, "operation": operation_type,
+                  "concurrency": concurrency_mode or "sequential", "workers": workers, "cores": cores,
+                  "memory_limit_mb": memory_limit_mb if memory_limit_mb else "none"}
+        label_text = openmetrics_labels(labels)
+        samples["operation_seconds"].append(f"{label_text} {result.execution_time_ms / 1000.0!r}")
+        if result.net_time_ms is not None:
+            samples["net_operation_seconds"].append(f"{label_text} {result.net_time_ms / 1000.0!r}")
+        throughput = result.throughput_ops
+        if throughput is None and result.execution_time_ms > 0:
+            throughput = 1000.0 / result.execution_time_ms
+        if throughput is not None:
+            samples["throughput_ops_per_second"].append(f"{label_text} {float(throughput)!r}")
+        samples["memory_bytes"].append(f"{label_text} {result.memory_usage_mb * 1024.0 * 1024.0!r}")
+        if result.joules_per_op is not None:
+            samples["energy_per_operation_joules"].append(f"{label_text} {result.joules_per_op!r}")
+        if result.timestamp is not None:
+            samples["timestamp_seconds"].append(f"{label_text} {result.timestamp.timestamp()!r}")
+        histogram = result.latency_histogram
+        if len(result.samples_ns):
+            counts = cumulative_bucket_counts(result.samples_ns, OPENMETRICS_LATENCY_BUCKETS)
+            total_count, total_seconds = len(result.samples_ns), sum(result.samples_ns) / 1e9
+        elif histogram is not None and histogram.total_count:
+            counts = histogram.cumulative_counts([bound * 1e9 for bound in OPENMETRICS_LATENCY_BUCKETS])
+            total_count, total_seconds = histogram.total_count, histogram.total_ns / 1e9
+        else:
+            counts = None
+        if counts is not None:
+            for bound, count in zip(OPENMETRICS_LATENCY_BUCKETS, counts):
+                samples["latency_seconds"].append(
+                    ("_bucket", openmetrics_labels({**labels, "le": f"{bound:g}"}), count))
+            samples["latency_seconds"].append(("_bucket", openmetrics_labels({**labels, "le": "+Inf"}), total_count))
+            samples["latency_seconds"].append(("_count", label_text, total_count))
+            samples["latency_seconds"].append(("_sum", label_text, total_seconds))
+    
+    lines = []
+    for name, (metric_type, unit, help_text) in families.items():
+        metric = f"crypto_benchmark_{name}"
+        lines.append(f"# TYPE {metric} {metric_type}")
+        if unit:
+            lines.append(f"# UNIT {metric} {unit}")
+        lines.append(f"# HELP {metric} {help_text}.")
+        for sample in samples[name]:
+            if metric_type == "histogram":
+                suffix, label_text, value = sample
+                lines.append(f"{metric}{suffix}{label_text} {value!r}")
+            else:
+                lines.append(f"{metric}{sample}")
+    
+    versions = get_crypto_library_versions()
+    lines.append("# TYPE crypto_benchmark_build info")
+    lines.append("# HELP crypto_benchmark_build Versões das bibliotecas e ambiente de execução.")
+    lines.append("crypto_benchmark_build_info" + openmetrics_labels({
+        "cryptography": versions["cryptography"], "openssl": versions["openssl"],
+        "environment_id": environment_id}) + " 1")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+def measure_startup_timings(probe_ms, init_ms):
+    """Tempos de inicialização (ms): importação do módulo, verificação de algoritmos e criação do benchmark"""
+    import_ms = (_MODULE_IMPORT_END - _MODULE_IMPORT_START) * 1000
+    return {
+        "total_ms": import_ms + probe_ms + init_ms,
+        "import_ms": import_ms,
+        "probe_ms": probe_ms,
+        "probe_source": _PROBE_SOURCE,
+        "init_ms": init_ms
+    }
+
+def print_startup_timings(timings):
+    """Exibe os tempos de inicialização medidos por measure_startup_timings"""
+    probe_origin = "cache" if timings["probe_source"] == "cache" else "verificação completa"
+    print(f"Tempo de inicialização: {timings['total_ms']:.1f} ms (importação {timings['import_ms']:.1f} ms, "
+          f"algoritmos {timings['probe_ms']:.1f} ms [{probe_origin}], "
+          f"benchmark/dados de teste {timings['init_ms']:.1f} ms)")
+
+def parse_arguments(argv=None):
+    """Interpreta os argumentos de linha de comando"""
+    parser = argparse.ArgumentParser(description="CryptoBenchmark - Análise de Desempenho Criptográfico")
+    parser.add_argument("--save-baseline", metavar="ARQUIVO",
+                        help="executa o benchmark e salva a linha de base de desempenho em JSON")
+    parser.add_argument("--regression-gate", metavar="ARQUIVO",
+                        help="compara a execução com a linha de base e sai com código 1 em caso de regressão")
+    parser.add_argument("--repetitions", type=int, default=None,
+                        help="repetições do benchmark completo (padrão: %d)" % CryptoBenchmark.REGRESSION_REPETITIONS)
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="aumento mínimo (%%%%) da mediana para regressão (padrão: %.1f)"
+                             % CryptoBenchmark.REGRESSION_THRESHOLD_PCT)
+    parser.add_argument("--interleaved", type=int, metavar="RODADAS", default=None,
+                        help="executa o benchmark intercalado em ordem aleatória com N rodadas")
+    parser.add_argument("--seed", type=int, default=None, help="semente da ordem aleatória das rodadas")
+    parser.add_argument("--wait-idle", action="store_true",
+                        help="aguarda o sistema ficar ocioso antes de cada benchmark/rodada")
+    parser.add_argument("--iterations", type=int, default=None, help="execuções medidas por operação")
+    parser.add_argument("--perf-counters", action="store_true",
+                        help="coleta ciclos, instruções e falhas de cache/desvio via perf_event (Linux)")
+    parser.add_argument("--thread-scaling", type=int, nargs="?", const=0, metavar="WORKERS", default=None,
+                        help="compara a vazão com 1..N threads e 1..N processos (padrão: núcleos em uso)")
+    parser.add_argument("--async-load", action="store_true",
+                        help="simula um serviço asyncio com chegadas de Poisson e busca a vazão máxima sob o SLO")
+    parser.add_argument("--async-operations", nargs="+", choices=sorted(SCALING_OPERATIONS), default=None,
+                        help="operações executadas por requisição na simulação asyncio")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread",
+                        help="executor usado pela simulação asyncio")
+    parser.add_argument("--rps", type=float, default=None, help="taxa fixa de requisições (desativa a busca)")
+    parser.add_argument("--slo-p99-ms", type=float, default=None, help="SLO de latência p99 em ms")
+    parser.add_argument("--tls", action="store_true",
+                        help="mede handshakes TLS completos e retomados por segundo em loopback")
+    parser.add_argument("--x509", action="store_true",
+                        help="mede geração de CSR, emissão, serialização, parsing e verificação de certificados")
+    parser.add_argument("--jwt", action="store_true",
+                        help="mede tokens JWS assinados/verificados por segundo (EdDSA, ES256/384/512, RS256, PS256)")
+    parser.add_argument("--kdf", action="store_true",
+                        help="mede latência, pico de memória e hashes/s de HKDF, PBKDF2, scrypt e Argon2id")
+    parser.add_argument("--kdf-large-memory", action="store_true",
+                        help="inclui KDFs com memória de trabalho acima de %d MB (ex.: Argon2id 2 GiB)"
+                             % CryptoBenchmark.KDF_MEMORY_CAP_MB)
+    parser.add_argument("--pqc", action="store_true",
+                        help="mede ML-KEM, ML-DSA e a troca híbrida X25519 + ML-KEM (se disponíveis)")
+    parser.add_argument("--curve448", action="store_true",
+                        help="mede Ed448/X448 e compara com Curve25519 e P-521")
+    parser.add_argument("--data-seed", type=int, default=None,
+                        help="semente dos dados de teste (padrão: sorteada e registrada no manifesto)")
+    parser.add_argument("--manifest", metavar="ARQUIVO",
+                        help="salva o manifesto da execução (sementes, seleção, iterações, ambiente) em JSON")
+    parser.add_argument("--replay", metavar="ARQUIVO",
+                        help="reexecuta a seleção registrada em um manifesto com as mesmas sementes")
+    parser.add_argument("--supervise", choices=["auto", "always", "never"], default="auto",
+                        help="executa as operações em processo filho encerrado no tempo limite "
+                             "(auto: geração de chaves RSA e RSA >= %d bits)" % CryptoBenchmark.SUPERVISE_MIN_RSA_BITS)
+    parser.add_argument("--refresh-probe", action="store_true",
+                        help="refaz a verificação de algoritmos disponíveis, ignorando o cache")
+    parser.add_argument("--self-test", action="store_true",
+                        help="verifica a API de resultados (to_dict/from_dict, JSON, run_benchmarks) "
+                             "e as estatísticas (histogramas, agregação, regressão) e sai")
+    parser.add_argument("--startup-time", action="store_true",
+                        help="apenas reporta o tempo de inicialização e sai")
+    parser.add_argument("--select", nargs="+", metavar="NOME", default=None,
+                        help="executa apenas as unidades/suítes indicadas (ex.: Ed25519 RSA-2048 jwt)")
+    parser.add_argument("--json", metavar="ARQUIVO",
+                        help="salva os resultados da execução em JSON (esquema versionado)")
+    parser.add_argument("--openmetrics-file", metavar="ARQUIVO",
+                        help="grava as métricas OpenMetrics ao final (textfile collector, ex.: crypto.prom)")
+    parser.add_argument("--openmetrics-port", type=int, metavar="PORTA", default=None,
+                        help="serve /metrics em HTTP durante a execução e depois dela, até Ctrl+C")
+    parser.add_argument("--openmetrics-host", default="127.0.0.1", metavar="ENDEREÇO",
+                        help="endereço do servidor de métricas (padrão: 127.0.0.1)")
+    parser.add_argument("--profile", nargs="+", metavar="PADRÃO", default=None,
+                        help="perfila as operações cujo nome contém o padrão (ex.: Ed25519, \"RSA-2048 Signing\", all)")
+    parser.add_argument("--profile-mode", choices=["cprofile", "sampling"], default="cprofile",
+                        help="cprofile (determinístico) ou sampling (SIGPROF, menor sobrecarga)")
+    parser.add_argument("--profile-dir", default="perfis", metavar="DIRETÓRIO",
+                        help="diretório dos arquivos de perfil (.prof, .collapsed, .txt)")
+    parser.add_argument("--histograms", metavar="DIRETÓRIO",
+                        help="exporta os histogramas de latência por série (.hgrm e JSON) ao final")
+    parser.add_argument("--aggregate", nargs="+", metavar="CAMINHO", default=None,
+                        help="agrega execuções históricas (diretórios com planilhas XLSX e arquivos JSON) e sai")
+    parser.add_argument("--aggregate-csv", metavar="ARQUIVO",
+                        help="exporta a tabela agregada de --aggregate em CSV")
+    parser.add_argument("--energy", action="store_true",
+                        help="mede a energia via RAPL (powercap do Linux) e reporta J/op e J/MB")
+    parser.add_argument("--no-calibration", action="store_true",
+                        help="não calibra a sobrecarga do harness (sem tempo líquido nem aviso de piso de ruído)")
+    parser.add_argument("--live", action="store_true",
+                        help="exibe um painel ao vivo (operação atual, mediana/p99, ops/s, CPU, RSS e ETA)")
+    parser.add_argument("--cores", type=int, default=None, help="número de núcleos de CPU a usar")
+    parser.add_argument("--timeout", type=int, default=None, help="tempo limite por teste em segundos")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Ponto de entrada: menu interativo ou modos não interativos via argumentos"""
+    args = parse_arguments(argv)
+    
+    manifest = None
+    if args.replay:
+        # Restaura a seleção e as sementes registradas, mantendo o destino do novo manifesto
+        try:
+            manifest = CryptoBenchmark.load_run_manifest(args.replay)
+        except (OSError, ValueError) as ex:
+            print(f"Erro ao carregar manifesto: {str(ex)}")
+            return 2
+        replay_args = vars(parse_arguments([]))
+        replay_args.update(manifest["arguments"])
+        replay_args.update(manifest=args.manifest, replay=args.replay, data_seed=manifest["data_seed"])
+        args = argparse.Namespace(**replay_args)
+        print(f"Reexecutando o manifesto {args.replay} (criado em {manifest.get('created_at')})")
+    
+    # Fixa as sementes antes da execução para que o manifesto a reproduza
+    if args.seed is None:
+        args.seed = new_random_seed()
+    
+    probe_start = time.perf_counter()
+    probe_available_algorithms(verbose=True, refresh=args.refresh_probe)
+    probe_ms = (time.perf_counter() - probe_start) * 1000
+    
+    # Cria uma instância do benchmark
+    reporter = None
+    if args.live:
+        if LiveDashboard.is_supported():
+            reporter = LiveDashboard()
+        else:
+            print("Painel ao vivo indisponível (a saída não é um terminal); usando a saída padrão.")
+    
+    init_start = time.perf_counter()
+    benchmark = CryptoBenchmark(data_seed=args.data_seed, reporter=reporter)
+    args.data_seed = benchmark.data_seed
+    benchmark.startup_timings = measure_startup_timings(probe_ms, (time.perf_counter() - init_start) * 1000)
+    print_startup_timings(benchmark.startup_timings)
+    if args.startup_time:
+        return 0
+    if args.self_test:
+        failed = False
+        for label, check_function in (("API de resultados", check_result_api),
+                                      ("histogramas de latência", check_latency_histogram),
+                                      ("agregação de resultados", check_result_table),
+                                      ("regressão de desempenho", check_regression_statistics)):
+            failures = check_function()
+            for failure in failures:
+                print(f"FALHA: {failure}")
+            print(f"Verificação de {label}: " + ("REPROVADA" if failures else "APROVADA"))
+            failed = failed or bool(failures)
+        return 1 if failed else 0
+    if manifest is not None:
+        benchmark.check_replay_manifest(manifest)
+    if args.cores:
+        benchmark.use_cores = max(1, min(args.cores, benchmark.max_cores))
+    if args.timeout is not None:
+        benchmark.timeout_seconds = args.timeout
+    benchmark.wait_for_idle = args.wait_idle
+    benchmark.supervise_mode = args.supervise
+    benchmark.kdf_large_memory = args.kdf_large_memory
+    benchmark.auto_calibrate = not args.no_calibration
+    if args.iterations:
+        benchmark.iterations = max(1, args.iterations)
+    if args.perf_counters:
+        benchmark.set_perf_counters(True)
+    if args.energy:
+        benchmark.set_energy_measurement(True)
+    if args.profile:
+        benchmark.profile_patterns = args.profile
+        benchmark.profile_mode = args.profile_mode
+        benchmark.profile_dir = args.profile_dir
+    
+    metrics_server = None
+    if args.openmetrics_port is not None:
+        try:
+            metrics_server = benchmark.serve_openmetrics(args.openmetrics_port, args.openmetrics_host)
+        except OSError as ex:
+            print(f"Erro ao iniciar servidor de métricas: {str(ex)}")
+            return 2
+    
+    try:
+        exit_code = run_selected_mode(benchmark, args)
+    finally:
+        benchmark.reporter.close()
+    if args.openmetrics_file:
+        benchmark.export_results_to_openmetrics(args.openmetrics_file)
+    if args.histograms:
+        benchmark.export_latency_histograms(args.histograms)
+    if args.json:
+        try:
+            save_results_json(benchmark.results, args.json)
+            print(f"Resultados salvos em {args.json} ({len(benchmark.results)} resultados)")
+        except OSError as ex:
+            print(f"Erro ao salvar resultados: {str(ex)}")
+    if args.manifest:
+        benchmark.save_run_manifest(args.manifest, vars(args), exit_code)
+    if metrics_server is not None:
+        print("Servindo as métricas mais recentes (Ctrl+C para encerrar)...")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        metrics_server.shutdown()
+    return exit_code
+
+def run_selected_mode(benchmark, args):
+    """Executa o modo selecionado pelos argumentos e retorna o código de saída"""
+    if args.aggregate:
+        rows = benchmark.aggregate_runs(args.aggregate, include_current=False, csv_filename=args.aggregate_csv)
+        return 0 if rows else 2
+    
+    if args.save_baseline:
+        benchmark.print_system_info()
+        benchmark.save_performance_baseline(args.save_baseline, args.repetitions)
+        return 0
+    
+    if args.regression_gate:
+        benchmark.print_system_info()
+        if not os.path.exists(args.regression_gate):
+            print(f"Linha de base não encontrada: {args.regression_gate}")
+            return 2
+        passed = benchmark.run_regression_gate(args.regression_gate, args.repetitions, args.threshold)
+        if passed is None:
+            return 2
+        return 0 if passed else 1
+    
+    if args.thread_scaling is not None:
+        benchmark.print_system_info()
+        benchmark.run_thread_scaling_benchmark(args.thread_scaling or None)
+        return 0
+    
+    if args.async_load:
+        benchmark.print_system_info()
+        benchmark.run_async_load_benchmark(args.async_operations, args.executor, args.slo_p99_ms,
+                                           args.rps, seed=args.seed)
+        return 0
+    
+    if args.tls:
+        benchmark.print_system_info()
+        benchmark.run_tls_handshake_benchmark()
+        return 0
+    
+    if args.x509:
+        benchmark.print_system_info()
+        benchmark.run_x509_benchmark()
+        return 0
+    
+    if args.jwt:
+        benchmark.print_system_info()
+        benchmark.run_jwt_benchmark()
+        return 0
+    
+    if args.kdf:
+        benchmark.print_system_info()
+        benchmark.run_kdf_benchmark()
+        return 0
+    
+    if args.pqc:
+        benchmark.print_system_info()
+        benchmark.run_pqc_benchmark()
+        return 0
+    
+    if args.curve448:
+        benchmark.print_system_info()
+        benchmark.run_curve448_benchmark()
+        return 0
+    
+    if args.select:
+        benchmark.print_system_info()
+        try:
+            benchmark.run_selection(args.select)
+        except ValueError as ex:
+            print(str(ex))
+            return 2
+        return 0
+    
+    if args.interleaved:
+        benchmark.print_system_info()
+        benchmark.run_interleaved_benchmark(args.interleaved, args.seed)
+        return 0
+    
+    benchmark.run()
+    return 0
+
+
+# Fim da importação do módulo
+_MODULE_IMPORT_END = time.perf_counter()
+
 if __name__ == "__main__":
-    # Cria uma instância do benchmark e executa
-    benchmark = CryptoBenchmark()
-    benchmark.run()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file